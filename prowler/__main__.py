@@ -28,7 +28,7 @@ from prowler.lib.logger import logger, set_logging_config
 from prowler.lib.outputs.compliance import display_compliance_table
 from prowler.lib.outputs.html import add_html_footer, fill_html_overview_statistics
 from prowler.lib.outputs.json import close_json
-from prowler.lib.outputs.outputs import extract_findings_statistics, send_to_s3_bucket
+from prowler.lib.outputs.outputs import Findings_Summary, send_to_s3_bucket
 from prowler.lib.outputs.slack import send_slack_message
 from prowler.lib.outputs.summary_table import display_summary_table
 from prowler.providers.aws.lib.security_hub.security_hub import (
@@ -156,11 +156,15 @@ def prowler():
         run_provider_quick_inventory(provider, audit_info, args)
         sys.exit()
 
-    # Execute checks
-    findings = []
+    # Execute checks, the findings are aggregated as they are reported
+    findings_summary = Findings_Summary(compliance_framework, bulk_checks_metadata)
     if len(checks_to_execute):
-        findings = execute_checks(
-            checks_to_execute, provider, audit_info, audit_output_options
+        execute_checks(
+            checks_to_execute,
+            provider,
+            audit_info,
+            audit_output_options,
+            findings_summary,
         )
     else:
         logger.error(
@@ -168,7 +172,7 @@ def prowler():
         )
 
     # Extract findings stats
-    stats = extract_findings_statistics(findings)
+    stats = findings_summary.statistics.get_stats()
 
     if args.slack:
         if "SLACK_API_TOKEN" in os.environ and "SLACK_CHANNEL_ID" in os.environ:
@@ -224,19 +228,17 @@ def prowler():
     # Display summary table
     if not args.only_logs:
         display_summary_table(
-            findings,
+            findings_summary.summary_table,
             audit_info,
             audit_output_options,
             provider,
         )
 
-        if compliance_framework and findings:
-            for compliance in compliance_framework:
+        if findings_summary.summary_table.findings_count:
+            for compliance_table in findings_summary.compliance_tables:
                 # Display compliance table
                 display_compliance_table(
-                    findings,
-                    bulk_checks_metadata,
-                    compliance,
+                    compliance_table,
                     audit_output_options.output_filename,
                     audit_output_options.output_directory,
                 )
@@ -27,6 +27,7 @@ except Exception:
     sys.exit(1)
 
 import prowler
+from prowler.lib.outputs.outputs import Findings_Summary
 from prowler.lib.utils.utils import open_file, parse_json_file
 from prowler.providers.common.models import Audit_Metadata
 from prowler.providers.common.outputs import Provider_Output_Options
@@ -408,9 +409,8 @@ def execute_checks(
     provider: str,
     audit_info: Any,
     audit_output_options: Provider_Output_Options,
-) -> list:
-    # List to store all the check's findings
-    all_findings = []
+    findings_summary: Findings_Summary,
+):
     # Services and checks executed for the Audit Status
     services_executed = set()
     checks_executed = set()
@@ -445,7 +445,7 @@ def execute_checks(
             # Recover service from check name
             service = check_name.split("_")[0]
             try:
-                check_findings = execute(
+                execute(
                     service,
                     check_name,
                     provider,
@@ -453,8 +453,8 @@ def execute_checks(
                     audit_info,
                     services_executed,
                     checks_executed,
+                    findings_summary,
                 )
-                all_findings.extend(check_findings)
 
             # If check does not exists in the provider or is from another provider
             except ModuleNotFoundError:
@@ -491,7 +491,7 @@ def execute_checks(
                     f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
                 )
                 try:
-                    check_findings = execute(
+                    execute(
                         service,
                         check_name,
                         provider,
@@ -499,8 +499,8 @@ def execute_checks(
                         audit_info,
                         services_executed,
                         checks_executed,
+                        findings_summary,
                     )
-                    all_findings.extend(check_findings)
                     bar()
 
                 # If check does not exists in the provider or is from another provider
@@ -515,7 +515,6 @@ def execute_checks(
                         f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                     )
             bar.title = f"-> {Fore.GREEN}Scan completed!{Style.RESET_ALL}"
-    return all_findings
 
 
 def execute(
@@ -526,6 +525,7 @@ def execute(
     audit_info: Any,
     services_executed: set,
     checks_executed: set,
+    findings_summary: Findings_Summary,
 ):
     # Import check module
     check_module_path = (
@@ -548,6 +548,8 @@ def execute(
 
     # Report the check's findings
     report(check_findings, audit_output_options, audit_info)
+    # Aggregate the reported findings, they are not kept after this point
+    findings_summary.add_findings(check_findings)
 
     return check_findings
 
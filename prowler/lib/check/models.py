@@ -2,6 +2,7 @@ import os
 import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 
 from pydantic import BaseModel, ValidationError
 
@@ -80,10 +81,34 @@ class Check(ABC, Check_Metadata_Model):
         """Execute the check's logic"""
 
 
+# Finding values repeated in most findings, they are interned to keep only one copy of each
+interned_finding_attributes = {
+    "status",
+    "region",
+    "subscription",
+    "project_id",
+    "location",
+}
+
+
+@lru_cache(maxsize=None)
+def parse_check_metadata(metadata: str) -> Check_Metadata_Model:
+    """parse_check_metadata parses the metadata of a check only once, so it is shared by all the check's findings"""
+    return Check_Metadata_Model.parse_raw(metadata)
+
+
 @dataclass
 class Check_Report:
     """Contains the Check's finding information."""
 
+    __slots__ = (
+        "status",
+        "status_extended",
+        "check_metadata",
+        "resource_details",
+        "resource_tags",
+    )
+
     status: str
     status_extended: str
     check_metadata: Check_Metadata_Model
@@ -92,16 +117,23 @@ class Check_Report:
 
     def __init__(self, metadata):
         self.status = ""
-        self.check_metadata = Check_Metadata_Model.parse_raw(metadata)
+        self.check_metadata = parse_check_metadata(metadata)
         self.status_extended = ""
         self.resource_details = ""
         self.resource_tags = []
 
+    def __setattr__(self, name, value):
+        if name in interned_finding_attributes and type(value) is str:
+            value = sys.intern(value)
+        super().__setattr__(name, value)
+
 
 @dataclass
 class Check_Report_AWS(Check_Report):
     """Contains the AWS Check's finding information."""
 
+    __slots__ = ("resource_id", "resource_arn", "region")
+
     resource_id: str
     resource_arn: str
     region: str
@@ -117,6 +149,8 @@ class Check_Report_AWS(Check_Report):
 class Check_Report_Azure(Check_Report):
     """Contains the Azure Check's finding information."""
 
+    __slots__ = ("resource_name", "resource_id", "subscription")
+
     resource_name: str
     resource_id: str
     subscription: str
@@ -132,8 +166,38 @@ class Check_Report_Azure(Check_Report):
 class Check_Report_GCP(Check_Report):
     """Contains the GCP Check's finding information."""
 
+    __slots__ = ("resource_name", "resource_id", "project_id", "location")
+
+    resource_name: str
+    resource_id: str
+    project_id: str
+    location: str
+
+    def __init__(self, metadata):
+        super().__init__(metadata)
+        self.resource_name = ""
+        self.resource_id = ""
+        self.project_id = ""
+        self.location = ""
+
+
+@dataclass
+class Check_Report_Manual(Check_Report):
+    """Contains the finding of the manual requirements of the compliance frameworks, valid for every provider."""
+
+    __slots__ = (
+        "resource_name",
+        "resource_id",
+        "resource_arn",
+        "region",
+        "project_id",
+        "location",
+    )
+
     resource_name: str
     resource_id: str
+    resource_arn: str
+    region: str
     project_id: str
     location: str
 
@@ -141,6 +205,8 @@ class Check_Report_GCP(Check_Report):
         super().__init__(metadata)
         self.resource_name = ""
         self.resource_id = ""
+        self.resource_arn = ""
+        self.region = ""
         self.project_id = ""
         self.location = ""
 
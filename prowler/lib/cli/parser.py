@@ -320,6 +320,11 @@ Detailed documentation at https://docs.prowler.cloud
             help="AWS region names to run Prowler against",
             choices=get_aws_available_regions(),
         )
+        aws_regions_subparser.add_argument(
+            "--skip-empty-regions",
+            action="store_true",
+            help="Probe the regions with resources before the scan to skip the regional collection of services without resources in a region. Services with region-level configuration checks are always audited",
+        )
         # AWS Organizations
         aws_orgs_subparser = aws_parser.add_argument_group("AWS Organizations")
         aws_orgs_subparser.add_argument(
@@ -5,7 +5,7 @@ from colorama import Fore, Style
 from tabulate import tabulate
 
 from prowler.config.config import orange_color, timestamp
-from prowler.lib.check.models import Check_Report
+from prowler.lib.check.models import Check_Report_Manual
 from prowler.lib.logger import logger
 from prowler.lib.outputs.models import (
     Check_Output_CSV_AWS_CIS,
@@ -24,7 +24,7 @@ def add_manual_controls(output_options, audit_info, file_descriptors):
     try:
         # Check if MANUAL control was already added to output
         if "manual_check" in output_options.bulk_checks_metadata:
-            manual_finding = Check_Report(
+            manual_finding = Check_Report_Manual(
                 output_options.bulk_checks_metadata["manual_check"].json()
             )
             manual_finding.status = "INFO"
@@ -339,16 +339,138 @@ def fill_compliance(output_options, finding, audit_info, file_descriptors):
         )
 
 
+class Compliance_Table:
+    """
+    Compliance_Table aggregates the findings of a compliance framework as they are reported, keeping only the counters
+    of its sections so the findings do not have to be kept until the end of the execution
+    """
+
+    def __init__(self, compliance_framework: str, bulk_checks_metadata: dict):
+        self.compliance_framework = compliance_framework
+        self.bulk_checks_metadata = bulk_checks_metadata
+        self.framework = None
+        self.version = None
+        self.provider = None
+        self.pass_count = 0
+        self.fail_count = 0
+        # ENS Marco/Categoria, CIS sections or MITRE ATT&CK tactics
+        self.sections = {}
+
+    def add_finding(self, finding):
+        check = self.bulk_checks_metadata.get(finding.check_metadata.CheckID)
+        if not check:
+            return
+        for compliance in check.Compliance:
+            if "ens_rd2022_aws" == self.compliance_framework:
+                if (
+                    compliance.Framework == "ENS"
+                    and compliance.Provider == "AWS"
+                    and compliance.Version == "RD2022"
+                ):
+                    self.__add_ens_finding__(finding, compliance)
+            elif "cis_" in self.compliance_framework:
+                if (
+                    compliance.Framework == "CIS"
+                    and compliance.Version in self.compliance_framework
+                ):
+                    self.__add_cis_finding__(finding, compliance)
+            elif "mitre_attack" in self.compliance_framework:
+                if (
+                    "MITRE-ATTACK" in compliance.Framework
+                    and compliance.Version in self.compliance_framework
+                ):
+                    self.__add_mitre_attack_finding__(finding, compliance)
+
+    def __set_compliance__(self, compliance):
+        self.framework = compliance.Framework
+        self.version = compliance.Version
+        self.provider = compliance.Provider
+
+    def __add_ens_finding__(self, finding, compliance):
+        self.__set_compliance__(compliance)
+        for requirement in compliance.Requirements:
+            for attribute in requirement.Attributes:
+                marco_categoria = f"{attribute.Marco}/{attribute.Categoria}"
+                # Check if Marco/Categoria exists
+                if marco_categoria not in self.sections:
+                    self.sections[marco_categoria] = {
+                        "Estado": f"{Fore.GREEN}CUMPLE{Style.RESET_ALL}",
+                        "Opcional": 0,
+                        "Alto": 0,
+                        "Medio": 0,
+                        "Bajo": 0,
+                    }
+                if finding.status == "FAIL":
+                    self.fail_count += 1
+                    self.sections[marco_categoria][
+                        "Estado"
+                    ] = f"{Fore.RED}NO CUMPLE{Style.RESET_ALL}"
+                elif finding.status == "PASS":
+                    self.pass_count += 1
+                if attribute.Nivel == "opcional":
+                    self.sections[marco_categoria]["Opcional"] += 1
+                elif attribute.Nivel == "alto":
+                    self.sections[marco_categoria]["Alto"] += 1
+                elif attribute.Nivel == "medio":
+                    self.sections[marco_categoria]["Medio"] += 1
+                elif attribute.Nivel == "bajo":
+                    self.sections[marco_categoria]["Bajo"] += 1
+
+    def __add_cis_finding__(self, finding, compliance):
+        self.__set_compliance__(compliance)
+        for requirement in compliance.Requirements:
+            for attribute in requirement.Attributes:
+                section = attribute.Section
+                # Check if Section exists
+                if section not in self.sections:
+                    self.sections[section] = {
+                        "Status": f"{Fore.GREEN}PASS{Style.RESET_ALL}",
+                        "Level 1": {"FAIL": 0, "PASS": 0},
+                        "Level 2": {"FAIL": 0, "PASS": 0},
+                    }
+                if finding.status == "FAIL":
+                    self.fail_count += 1
+                elif finding.status == "PASS":
+                    self.pass_count += 1
+                if attribute.Profile == "Level 1":
+                    if finding.status == "FAIL":
+                        self.sections[section]["Level 1"]["FAIL"] += 1
+                    else:
+                        self.sections[section]["Level 1"]["PASS"] += 1
+                elif attribute.Profile == "Level 2":
+                    if finding.status == "FAIL":
+                        self.sections[section]["Level 2"]["FAIL"] += 1
+                    else:
+                        self.sections[section]["Level 2"]["PASS"] += 1
+
+    def __add_mitre_attack_finding__(self, finding, compliance):
+        self.__set_compliance__(compliance)
+        for requirement in compliance.Requirements:
+            for tactic in requirement.Tactics:
+                if tactic not in self.sections:
+                    self.sections[tactic] = {"FAIL": 0, "PASS": 0}
+                if finding.status == "FAIL":
+                    self.fail_count += 1
+                    self.sections[tactic]["FAIL"] += 1
+                elif finding.status == "PASS":
+                    self.pass_count += 1
+                    self.sections[tactic]["PASS"] += 1
+
+
 def display_compliance_table(
-    findings: list,
-    bulk_checks_metadata: dict,
-    compliance_framework: str,
+    compliance_table: Compliance_Table,
     output_filename: str,
     output_directory: str,
 ):
     try:
+        compliance_framework = compliance_table.compliance_framework
+        compliance_fm = compliance_table.framework
+        compliance_version = compliance_table.version
+        compliance_provider = compliance_table.provider
+        fail_count = compliance_table.fail_count
+        pass_count = compliance_table.pass_count
         if "ens_rd2022_aws" == compliance_framework:
-            marcos = {}
+            marcos = compliance_table.sections
             ens_compliance_table = {
                 "Proveedor": [],
                 "Marco/Categoria": [],
@@ -358,52 +480,10 @@ def display_compliance_table(
                 "Bajo": [],
                 "Opcional": [],
             }
-            pass_count = fail_count = 0
-            for finding in findings:
-                check = bulk_checks_metadata[finding.check_metadata.CheckID]
-                check_compliances = check.Compliance
-                for compliance in check_compliances:
-                    if (
-                        compliance.Framework == "ENS"
-                        and compliance.Provider == "AWS"
-                        and compliance.Version == "RD2022"
-                    ):
-                        compliance_version = compliance.Version
-                        compliance_fm = compliance.Framework
-                        compliance_provider = compliance.Provider
-                        for requirement in compliance.Requirements:
-                            for attribute in requirement.Attributes:
-                                marco_categoria = (
-                                    f"{attribute.Marco}/{attribute.Categoria}"
-                                )
-                                # Check if Marco/Categoria exists
-                                if marco_categoria not in marcos:
-                                    marcos[marco_categoria] = {
-                                        "Estado": f"{Fore.GREEN}CUMPLE{Style.RESET_ALL}",
-                                        "Opcional": 0,
-                                        "Alto": 0,
-                                        "Medio": 0,
-                                        "Bajo": 0,
-                                    }
-                                if finding.status == "FAIL":
-                                    fail_count += 1
-                                    marcos[marco_categoria][
-                                        "Estado"
-                                    ] = f"{Fore.RED}NO CUMPLE{Style.RESET_ALL}"
-                                elif finding.status == "PASS":
-                                    pass_count += 1
-                                if attribute.Nivel == "opcional":
-                                    marcos[marco_categoria]["Opcional"] += 1
-                                elif attribute.Nivel == "alto":
-                                    marcos[marco_categoria]["Alto"] += 1
-                                elif attribute.Nivel == "medio":
-                                    marcos[marco_categoria]["Medio"] += 1
-                                elif attribute.Nivel == "bajo":
-                                    marcos[marco_categoria]["Bajo"] += 1
 
             # Add results to table
             for marco in sorted(marcos):
-                ens_compliance_table["Proveedor"].append(compliance.Provider)
+                ens_compliance_table["Proveedor"].append(compliance_provider)
                 ens_compliance_table["Marco/Categoria"].append(marco)
                 ens_compliance_table["Estado"].append(marcos[marco]["Estado"])
                 ens_compliance_table["Opcional"].append(
@@ -418,9 +498,9 @@ def display_compliance_table(
                 ens_compliance_table["Bajo"].append(
                     f"{Fore.YELLOW}{marcos[marco]['Bajo']}{Style.RESET_ALL}"
                 )
-            if fail_count + pass_count < 0:
+            if fail_count + pass_count < 1:
                 print(
-                    f"\n {Style.BRIGHT}There are no resources for {Fore.YELLOW}{compliance_fm} {compliance_version} - {compliance_provider}{Style.RESET_ALL}.\n"
+                    f"\n {Style.BRIGHT}There are no resources for {Fore.YELLOW}{compliance_framework}{Style.RESET_ALL}.\n"
                 )
             else:
                 print(
@@ -449,53 +529,17 @@ def display_compliance_table(
                     f" - CSV: {output_directory}/{output_filename}_{compliance_framework}.csv\n"
                 )
         elif "cis_" in compliance_framework:
-            sections = {}
             cis_compliance_table = {
                 "Provider": [],
                 "Section": [],
                 "Level 1": [],
                 "Level 2": [],
             }
-            pass_count = fail_count = 0
-            for finding in findings:
-                check = bulk_checks_metadata[finding.check_metadata.CheckID]
-                check_compliances = check.Compliance
-                for compliance in check_compliances:
-                    if (
-                        compliance.Framework == "CIS"
-                        and compliance.Version in compliance_framework
-                    ):
-                        compliance_version = compliance.Version
-                        compliance_fm = compliance.Framework
-                        for requirement in compliance.Requirements:
-                            for attribute in requirement.Attributes:
-                                section = attribute.Section
-                                # Check if Section exists
-                                if section not in sections:
-                                    sections[section] = {
-                                        "Status": f"{Fore.GREEN}PASS{Style.RESET_ALL}",
-                                        "Level 1": {"FAIL": 0, "PASS": 0},
-                                        "Level 2": {"FAIL": 0, "PASS": 0},
-                                    }
-                                if finding.status == "FAIL":
-                                    fail_count += 1
-                                elif finding.status == "PASS":
-                                    pass_count += 1
-                                if attribute.Profile == "Level 1":
-                                    if finding.status == "FAIL":
-                                        sections[section]["Level 1"]["FAIL"] += 1
-                                    else:
-                                        sections[section]["Level 1"]["PASS"] += 1
-                                elif attribute.Profile == "Level 2":
-                                    if finding.status == "FAIL":
-                                        sections[section]["Level 2"]["FAIL"] += 1
-                                    else:
-                                        sections[section]["Level 2"]["PASS"] += 1
 
             # Add results to table
-            sections = dict(sorted(sections.items()))
+            sections = dict(sorted(compliance_table.sections.items()))
             for section in sections:
-                cis_compliance_table["Provider"].append(compliance.Provider)
+                cis_compliance_table["Provider"].append(compliance_provider)
                 cis_compliance_table["Section"].append(section)
                 if sections[section]["Level 1"]["FAIL"] > 0:
                     cis_compliance_table["Level 1"].append(
@@ -515,7 +559,7 @@ def display_compliance_table(
                     )
             if fail_count + pass_count < 1:
                 print(
-                    f"\n {Style.BRIGHT}There are no resources for {Fore.YELLOW}{compliance_fm}-{compliance_version}{Style.RESET_ALL}.\n"
+                    f"\n {Style.BRIGHT}There are no resources for {Fore.YELLOW}{compliance_framework}{Style.RESET_ALL}.\n"
                 )
             else:
                 print(
@@ -544,37 +588,16 @@ def display_compliance_table(
                     f" - CSV: {output_directory}/{output_filename}_{compliance_framework}.csv\n"
                 )
         elif "mitre_attack" in compliance_framework:
-            tactics = {}
             mitre_compliance_table = {
                 "Provider": [],
                 "Tactic": [],
                 "Status": [],
             }
-            pass_count = fail_count = 0
-            for finding in findings:
-                check = bulk_checks_metadata[finding.check_metadata.CheckID]
-                check_compliances = check.Compliance
-                for compliance in check_compliances:
-                    if (
-                        "MITRE-ATTACK" in compliance.Framework
-                        and compliance.Version in compliance_framework
-                    ):
-                        compliance_fm = compliance.Framework
-                        for requirement in compliance.Requirements:
-                            for tactic in requirement.Tactics:
-                                if tactic not in tactics:
-                                    tactics[tactic] = {"FAIL": 0, "PASS": 0}
-                                if finding.status == "FAIL":
-                                    fail_count += 1
-                                    tactics[tactic]["FAIL"] += 1
-                                elif finding.status == "PASS":
-                                    pass_count += 1
-                                    tactics[tactic]["PASS"] += 1
 
             # Add results to table
-            tactics = dict(sorted(tactics.items()))
+            tactics = dict(sorted(compliance_table.sections.items()))
             for tactic in tactics:
-                mitre_compliance_table["Provider"].append(compliance.Provider)
+                mitre_compliance_table["Provider"].append(compliance_provider)
                 mitre_compliance_table["Tactic"].append(tactic)
                 if tactics[tactic]["FAIL"] > 0:
                     mitre_compliance_table["Status"].append(
@@ -586,7 +609,7 @@ def display_compliance_table(
                     )
             if fail_count + pass_count < 1:
                 print(
-                    f"\n {Style.BRIGHT}There are no resources for {Fore.YELLOW}{compliance_fm}{Style.RESET_ALL}.\n"
+                    f"\n {Style.BRIGHT}There are no resources for {Fore.YELLOW}{compliance_framework}{Style.RESET_ALL}.\n"
                 )
             else:
                 print(
@@ -13,7 +13,11 @@ from prowler.config.config import (
     orange_color,
 )
 from prowler.lib.logger import logger
-from prowler.lib.outputs.compliance import add_manual_controls, fill_compliance
+from prowler.lib.outputs.compliance import (
+    Compliance_Table,
+    add_manual_controls,
+    fill_compliance,
+)
 from prowler.lib.outputs.file_descriptors import fill_file_descriptors
 from prowler.lib.outputs.html import fill_html
 from prowler.lib.outputs.json import fill_json_asff, fill_json_ocsf
@@ -23,6 +27,7 @@ from prowler.lib.outputs.models import (
     generate_provider_output_json,
     unroll_tags,
 )
+from prowler.lib.outputs.summary_table import Summary_Table
 from prowler.providers.aws.lib.allowlist.allowlist import is_allowlisted
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.aws.lib.security_hub.security_hub import send_to_security_hub
@@ -244,6 +249,53 @@ def send_to_s3_bucket(
         sys.exit(1)
 
 
+class Findings_Statistics:
+    """Findings_Statistics aggregates the statistics of the findings as they are reported"""
+
+    def __init__(self):
+        self.total_pass = 0
+        self.total_fail = 0
+        self.resources = set()
+
+    def add_finding(self, finding):
+        # Save the resource_id
+        self.resources.add(finding.resource_id)
+        if finding.status == "PASS":
+            self.total_pass += 1
+        if finding.status == "FAIL":
+            self.total_fail += 1
+
+    def get_stats(self) -> dict:
+        return {
+            "total_pass": self.total_pass,
+            "total_fail": self.total_fail,
+            "resources_count": len(self.resources),
+            "findings_count": self.total_pass + self.total_fail,
+        }
+
+
+class Findings_Summary:
+    """
+    Findings_Summary updates the statistics, the summary table and the compliance tables as the findings are reported,
+    so the findings can be released once they are written to the outputs, keeping the memory flat whatever the number of findings
+    """
+
+    def __init__(self, compliance_frameworks: list, bulk_checks_metadata: dict):
+        self.statistics = Findings_Statistics()
+        self.summary_table = Summary_Table()
+        self.compliance_tables = [
+            Compliance_Table(compliance_framework, bulk_checks_metadata)
+            for compliance_framework in compliance_frameworks or []
+        ]
+
+    def add_findings(self, findings: list):
+        for finding in findings:
+            self.statistics.add_finding(finding)
+            self.summary_table.add_finding(finding)
+            for compliance_table in self.compliance_tables:
+                compliance_table.add_finding(finding)
+
+
 def extract_findings_statistics(findings: list) -> dict:
     """
     extract_findings_statistics takes a list of findings and returns the following dict with the aggregated statistics
@@ -255,25 +307,8 @@ def extract_findings_statistics(findings: list) -> dict:
     }
     """
     logger.info("Extracting audit statistics...")
-    stats = {}
-    total_pass = 0
-    total_fail = 0
-    resources = set()
-    findings_count = 0
-
+    statistics = Findings_Statistics()
     for finding in findings:
-        # Save the resource_id
-        resources.add(finding.resource_id)
-        if finding.status == "PASS":
-            total_pass += 1
-            findings_count += 1
-        if finding.status == "FAIL":
-            total_fail += 1
-            findings_count += 1
-
-    stats["total_pass"] = total_pass
-    stats["total_fail"] = total_fail
-    stats["resources_count"] = len(resources)
-    stats["findings_count"] = findings_count
+        statistics.add_finding(finding)
 
-    return stats
+    return statistics.get_stats()
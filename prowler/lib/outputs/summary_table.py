@@ -14,8 +14,50 @@ from prowler.lib.logger import logger
 from prowler.providers.common.outputs import Provider_Output_Options
 
 
+class Summary_Table:
+    """
+    Summary_Table aggregates the findings as they are reported, keeping only the counters of the summary table
+    so the findings do not have to be kept until the end of the execution
+    """
+
+    def __init__(self):
+        self.findings_count = 0
+        self.pass_count = 0
+        self.fail_count = 0
+        # Counters of each service in the order they are reported
+        self.services = {}
+
+    def add_finding(self, finding):
+        service = finding.check_metadata.ServiceName
+        if service not in self.services:
+            self.services[service] = {
+                "Service": service,
+                "Provider": finding.check_metadata.Provider,
+                "Total": 0,
+                "Critical": 0,
+                "High": 0,
+                "Medium": 0,
+                "Low": 0,
+            }
+        current = self.services[service]
+        self.findings_count += 1
+        current["Total"] += 1
+        if finding.status == "PASS":
+            self.pass_count += 1
+        elif finding.status == "FAIL":
+            self.fail_count += 1
+            if finding.check_metadata.Severity == "critical":
+                current["Critical"] += 1
+            elif finding.check_metadata.Severity == "high":
+                current["High"] += 1
+            elif finding.check_metadata.Severity == "medium":
+                current["Medium"] += 1
+            elif finding.check_metadata.Severity == "low":
+                current["Low"] += 1
+
+
 def display_summary_table(
-    findings: list,
+    summary_table: Summary_Table,
     audit_info,
     output_options: Provider_Output_Options,
     provider: str,
@@ -40,16 +82,7 @@ def display_summary_table(
             entity_type = "Project ID/s"
             audited_entities = ", ".join(audit_info.project_ids)
 
-        if findings:
-            current = {
-                "Service": "",
-                "Provider": "",
-                "Total": 0,
-                "Critical": 0,
-                "High": 0,
-                "Medium": 0,
-                "Low": 0,
-            }
+        if summary_table.findings_count:
             findings_table = {
                 "Provider": [],
                 "Service": [],
@@ -59,45 +92,17 @@ def display_summary_table(
                 "Medium": [],
                 "Low": [],
             }
-            pass_count = fail_count = 0
-            for finding in findings:
-                # If new service and not first, add previous row
-                if (
-                    current["Service"] != finding.check_metadata.ServiceName
-                    and current["Service"]
-                ):
-                    add_service_to_table(findings_table, current)
-
-                    current["Total"] = current["Critical"] = current["High"] = current[
-                        "Medium"
-                    ] = current["Low"] = 0
-
-                current["Service"] = finding.check_metadata.ServiceName
-                current["Provider"] = finding.check_metadata.Provider
-
-                current["Total"] += 1
-                if finding.status == "PASS":
-                    pass_count += 1
-                elif finding.status == "FAIL":
-                    fail_count += 1
-                    if finding.check_metadata.Severity == "critical":
-                        current["Critical"] += 1
-                    elif finding.check_metadata.Severity == "high":
-                        current["High"] += 1
-                    elif finding.check_metadata.Severity == "medium":
-                        current["Medium"] += 1
-                    elif finding.check_metadata.Severity == "low":
-                        current["Low"] += 1
-
-            # Add final service
-
-            add_service_to_table(findings_table, current)
+            for current in summary_table.services.values():
+                add_service_to_table(findings_table, current)
+            findings_count = summary_table.findings_count
+            fail_count = summary_table.fail_count
+            pass_count = summary_table.pass_count
 
             print("\nOverview Results:")
             overview_table = [
                 [
-                    f"{Fore.RED}{round(fail_count/len(findings)*100, 2)}% ({fail_count}) Failed{Style.RESET_ALL}",
-                    f"{Fore.GREEN}{round(pass_count/len(findings)*100, 2)}% ({pass_count}) Passed{Style.RESET_ALL}",
+                    f"{Fore.RED}{round(fail_count/findings_count*100, 2)}% ({fail_count}) Failed{Style.RESET_ALL}",
+                    f"{Fore.GREEN}{round(pass_count/findings_count*100, 2)}% ({pass_count}) Passed{Style.RESET_ALL}",
                 ]
             ]
             print(tabulate(overview_table, tablefmt="rounded_grid"))
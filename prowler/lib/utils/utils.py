@@ -1,18 +1,44 @@
+import atexit
 import json
 import os
 import sys
 import tempfile
-from hashlib import sha512
-from io import TextIOWrapper
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from hashlib import sha256, sha512
+from io import StringIO, TextIOWrapper
 from ipaddress import ip_address
+from multiprocessing import get_context
 from os.path import exists
-from typing import Any
+from threading import Lock
+from typing import Any, Optional
 
 from detect_secrets import SecretsCollection
-from detect_secrets.settings import default_settings
+from detect_secrets.__version__ import VERSION as detect_secrets_version
+from detect_secrets.core.plugins.util import get_mapping_from_secret_type_to_class
+from detect_secrets.settings import configure_settings_from_baseline
+from detect_secrets.transformers import get_transformed_file
 
 from prowler.lib.logger import logger
 
+# The in-memory scan uses a private detect-secrets function, only with the versions it is known to work with
+if detect_secrets_version.startswith("1.4."):
+    from detect_secrets.core.scan import _process_line_based_plugins
+else:
+    _process_line_based_plugins = None
+
+# Below this amount of data the process pool startup costs more than the scan
+secrets_scan_pool_min_size = 1024 * 1024
+# Results of the data most recently scanned, by hash, the oldest are dropped above the max size
+secrets_scan_results = OrderedDict()
+secrets_scan_results_max_size = 10000
+secrets_scan_results_lock = Lock()
+# Process pool shared by all the scans of the run, created the first time it is needed
+secrets_scan_pool = None
+secrets_scan_pool_lock = Lock()
+
 
 def open_file(input_file: str, mode: str = "r") -> TextIOWrapper:
     try:
@@ -65,21 +91,147 @@ def hash_sha512(string: str) -> str:
     return sha512(string.encode("utf-8")).hexdigest()[0:9]
 
 
-def detect_secrets_scan(data):
-    temp_data_file = tempfile.NamedTemporaryFile(delete=False)
-    temp_data_file.write(bytes(data, encoding="raw_unicode_escape"))
-    temp_data_file.close()
+@lru_cache(maxsize=None)
+def load_detect_secrets_settings():
+    """load_detect_secrets_settings enables all the detect-secrets plugins and default filters once per process"""
+    configure_settings_from_baseline(
+        {
+            "plugins_used": [
+                {"name": plugin_type.__name__}
+                for plugin_type in get_mapping_from_secret_type_to_class().values()
+            ]
+        }
+    )
+
+
+def scan_secrets_in_memory(data: str) -> list:
+    """scan_secrets_in_memory returns the secrets found in data, line by line, without writing it to disk"""
+    load_detect_secrets_settings()
+    if _process_line_based_plugins is None:
+        return scan_secrets_in_file(data)
+    data_file = StringIO(data)
+    data_file.name = "data"
+    secrets = set()
+    # Same passes than detect-secrets uses for files, the eager transformers only if nothing is found
+    for use_eager_transformers in [False, True]:
+        lines = get_transformed_file(
+            data_file, use_eager_transformers=use_eager_transformers
+        )
+        if not lines:
+            if use_eager_transformers:
+                break
+            lines = data_file.readlines()
+        secrets.update(
+            _process_line_based_plugins(
+                lines=list(enumerate(lines, start=1)), filename=data_file.name
+            )
+        )
+        if secrets:
+            break
+        data_file.seek(0)
+
+    return get_secrets_output(secrets)
+
+
+def scan_secrets_in_file(data: str) -> list:
+    """scan_secrets_in_file returns the secrets found in data writing it to a temporary file, only with the detect-secrets public API"""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt") as data_file:
+        data_file.write(data)
+        data_file.flush()
+        secrets_collection = SecretsCollection()
+        secrets_collection.scan_file(data_file.name)
+        return get_secrets_output(secret for _, secret in secrets_collection)
+
+
+def get_secrets_output(secrets) -> list:
+    """get_secrets_output returns the detect-secrets JSON output of the secrets, sorted and without the file name"""
+    output = []
+    for secret in sorted(
+        secrets,
+        key=lambda secret: (
+            getattr(secret, "line_number", 0),
+            secret.secret_hash,
+            secret.type,
+        ),
+    ):
+        secret_output = secret.json()
+        secret_output.pop("filename")
+        output.append(secret_output)
+    return output
+
+
+def get_secrets_scan_pool() -> ProcessPoolExecutor:
+    """get_secrets_scan_pool returns the process pool shared by all the secrets scans, creating it if needed"""
+    global secrets_scan_pool
+    with secrets_scan_pool_lock:
+        if secrets_scan_pool is None:
+            # Spawn the workers so they do not inherit the locks of the scan threads
+            secrets_scan_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(), mp_context=get_context("spawn")
+            )
+        return secrets_scan_pool
+
+
+@atexit.register
+def reset_secrets_scan_pool():
+    """reset_secrets_scan_pool shuts down the shared secrets scan process pool, if it was created"""
+    global secrets_scan_pool
+    with secrets_scan_pool_lock:
+        if secrets_scan_pool is not None:
+            secrets_scan_pool.shutdown(cancel_futures=True)
+            secrets_scan_pool = None
+
+
+def detect_secrets_scan_batch(data_list: list) -> list:
+    """detect_secrets_scan_batch returns the secrets found in each data of the list, or None if there are none
+
+    Identical data is scanned only once and big batches are spread over the shared process pool.
+    """
+    data_hashes = [sha256(data.encode("utf-8")).hexdigest() for data in data_list]
+    results_by_hash = {}
+    pending = {}
+    with secrets_scan_results_lock:
+        for data_hash, data in zip(data_hashes, data_list):
+            if data_hash in secrets_scan_results:
+                secrets_scan_results.move_to_end(data_hash)
+                results_by_hash[data_hash] = secrets_scan_results[data_hash]
+            elif data_hash not in results_by_hash:
+                pending[data_hash] = data
+
+    if pending:
+        pending_data = list(pending.values())
+        if (
+            (os.cpu_count() or 1) > 1
+            and len(pending_data) > 1
+            and sum(len(data) for data in pending_data) >= secrets_scan_pool_min_size
+        ):
+            try:
+                results = list(
+                    get_secrets_scan_pool().map(
+                        scan_secrets_in_memory, pending_data, chunksize=8
+                    )
+                )
+            except Exception as error:
+                logger.error(
+                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+                # A broken pool is replaced the next time it is needed
+                if isinstance(error, BrokenProcessPool):
+                    reset_secrets_scan_pool()
+                results = [scan_secrets_in_memory(data) for data in pending_data]
+        else:
+            results = [scan_secrets_in_memory(data) for data in pending_data]
+        results_by_hash.update(zip(pending.keys(), results))
+        with secrets_scan_results_lock:
+            secrets_scan_results.update(zip(pending.keys(), results))
+            while len(secrets_scan_results) > secrets_scan_results_max_size:
+                secrets_scan_results.popitem(last=False)
 
-    secrets = SecretsCollection()
-    with default_settings():
-        secrets.scan_file(temp_data_file.name)
-    os.remove(temp_data_file.name)
+    return [results_by_hash[data_hash] or None for data_hash in data_hashes]
 
-    detect_secrets_output = secrets.json()
-    if detect_secrets_output:
-        return detect_secrets_output[temp_data_file.name]
-    else:
-        return None
+
+def detect_secrets_scan(data: str) -> Optional[list]:
+    return detect_secrets_scan_batch([data])[0]
 
 
 def validate_ip_address(ip_string):
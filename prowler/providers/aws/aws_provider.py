@@ -1,6 +1,10 @@
 import os
 import pathlib
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional
 
 from boto3 import client, session
 from botocore.credentials import RefreshableCredentials
@@ -12,6 +16,9 @@ from prowler.lib.logger import logger
 from prowler.lib.utils.utils import open_file, parse_json_file
 from prowler.providers.aws.lib.audit_info.models import AWS_Assume_Role, AWS_Audit_Info
 
+# Maximum number of workers of every thread pool used to request the AWS resources details
+max_workers = 10
+
 
 ################## AWS PROVIDER
 class AWS_Provider:
@@ -153,6 +160,16 @@ def generate_regional_clients(
                 if audit_info.profile_region in service_regions:
                     service_regions = [audit_info.profile_region]
                 service_regions = service_regions[:1]
+        # Skip the regions without resources of the service if they were probed
+        elif (
+            audit_info.regions_with_resources
+            and service in audit_info.regions_with_resources
+        ):
+            service_regions = [
+                region
+                for region in service_regions
+                if region in audit_info.regions_with_resources[service]
+            ]
         for region in service_regions:
             regional_client = audit_info.audit_session.client(
                 service, region_name=region, config=audit_info.session_config
@@ -166,23 +183,115 @@ def generate_regional_clients(
         )
 
 
+def threading_call_per_resource(
+    call,
+    resources: list,
+    regional_clients: dict,
+    max_workers_per_region: int = max_workers,
+):
+    """
+    threading_call_per_resource runs call(regional_client, resource) for every resource concurrently.
+    The resources are grouped by their region, each region runs in its own thread with a pool of up to max_workers_per_region workers,
+    and an error getting the details of a resource is logged without stopping the rest.
+    """
+    resources_per_region = {}
+    for resource in resources:
+        resources_per_region.setdefault(resource.region, []).append(resource)
+
+    threads = []
+    for region, region_resources in resources_per_region.items():
+        if region in regional_clients:
+            threads.append(
+                threading.Thread(
+                    target=call_per_regional_resource,
+                    args=(
+                        call,
+                        regional_clients[region],
+                        region_resources,
+                        max_workers_per_region,
+                    ),
+                )
+            )
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def call_per_regional_resource(
+    call, regional_client, resources: list, max_workers_per_region: int = max_workers
+):
+    """call_per_regional_resource runs call(regional_client, resource) for every resource of the region with a pool of up to max_workers_per_region workers"""
+    with ThreadPoolExecutor(max_workers=max_workers_per_region) as executor:
+        futures = [
+            executor.submit(call, regional_client, resource) for resource in resources
+        ]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as error:
+                logger.error(
+                    f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+
+
+@lru_cache(maxsize=None)
+def load_aws_regions_catalog() -> dict:
+    """load_aws_regions_catalog parses the aws_regions_by_service.json only once per execution and returns it indexed as service -> partition -> regions"""
+    actual_directory = pathlib.Path(os.path.dirname(os.path.realpath(__file__)))
+    with open_file(f"{actual_directory}/{aws_services_json_file}") as f:
+        data = parse_json_file(f)
+
+    catalog = {}
+    for service_name, service in data["services"].items():
+        catalog[service_name] = {
+            partition: tuple(regions)
+            for partition, regions in service["regions"].items()
+        }
+    return catalog
+
+
 def get_aws_available_regions():
     try:
-        actual_directory = pathlib.Path(os.path.dirname(os.path.realpath(__file__)))
-        with open_file(f"{actual_directory}/{aws_services_json_file}") as f:
-            data = parse_json_file(f)
-
         regions = set()
-        for service in data["services"].values():
-            for partition in service["regions"]:
-                for item in service["regions"][partition]:
-                    regions.add(item)
+        for service in load_aws_regions_catalog().values():
+            for partition_regions in service.values():
+                regions.update(partition_regions)
         return list(regions)
     except Exception as error:
         logger.error(f"{error.__class__.__name__}: {error}")
         return []
 
 
+# Enabled regions per audited account, to run describe_regions only once per account
+aws_enabled_regions_by_account = {}
+
+
+def get_aws_enabled_regions(audit_info: AWS_Audit_Info) -> Optional[set]:
+    """get_aws_enabled_regions returns the regions enabled in the audited account (opted-in or not requiring opt-in), or None if they cannot be retrieved"""
+    if audit_info.audited_account in aws_enabled_regions_by_account:
+        return aws_enabled_regions_by_account[audit_info.audited_account]
+    enabled_regions = None
+    try:
+        ec2_client = audit_info.audit_session.client(
+            "ec2",
+            region_name=audit_info.profile_region or get_global_region(audit_info),
+            config=audit_info.session_config,
+        )
+        enabled_regions = set()
+        for region in ec2_client.describe_regions(AllRegions=True)["Regions"]:
+            if region.get("OptInStatus") != "not-opted-in":
+                enabled_regions.add(region["RegionName"])
+    except Exception as error:
+        # Without ec2:DescribeRegions permissions all the regions are audited
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        enabled_regions = None
+    aws_enabled_regions_by_account[audit_info.audited_account] = enabled_regions
+    return enabled_regions
+
+
 def get_checks_from_input_arn(audit_resources: list, provider: str) -> set:
     """get_checks_from_input_arn gets the list of checks from the input arns"""
     checks_from_arn = set()
@@ -255,18 +364,17 @@ def get_regions_from_audit_resources(audit_resources: list) -> list:
 
 
 def get_available_aws_service_regions(service: str, audit_info: AWS_Audit_Info) -> list:
-    # Get json locally
-    actual_directory = pathlib.Path(os.path.dirname(os.path.realpath(__file__)))
-    with open_file(f"{actual_directory}/{aws_services_json_file}") as f:
-        data = parse_json_file(f)
-    # Check if it is a subservice
-    json_regions = data["services"][service]["regions"][audit_info.audited_partition]
+    # Get regions from the catalog, loaded only once
+    json_regions = load_aws_regions_catalog()[service][audit_info.audited_partition]
     if audit_info.audited_regions:  # Check for input aws audit_info.audited_regions
         regions = list(
             set(json_regions).intersection(audit_info.audited_regions)
         )  # Get common regions between input and json
     else:  # Get all regions from json of the service and partition
-        regions = json_regions
+        regions = list(json_regions)
+    # Skip the regions not enabled in the audited account
+    if audit_info.enabled_regions:
+        regions = [region for region in regions if region in audit_info.enabled_regions]
     return regions
 
 
@@ -36,4 +36,7 @@ current_audit_info = AWS_Audit_Info(
     audited_regions=None,
     organizations_metadata=None,
     audit_metadata=None,
+    enabled_regions=None,
+    regions_with_resources=None,
+    tag_store=None,
 )
@@ -51,3 +51,9 @@ class AWS_Audit_Info:
     audit_resources: list
     organizations_metadata: AWS_Organizations_Info
     audit_metadata: Optional[Any] = None
+    # Regions enabled in the audited account, None means all the regions
+    enabled_regions: Optional[set] = None
+    # Regions with resources by service, None means all the regions
+    regions_with_resources: Optional[dict] = None
+    # Account-level store of the resources tags, None means every service lists its own tags
+    tag_store: Optional[Any] = None
@@ -0,0 +1,85 @@
+import json
+import os
+import threading
+from typing import Optional
+
+from prowler.lib.logger import logger
+
+
+def is_aws_managed_policy(policy_arn: str) -> bool:
+    """is_aws_managed_policy returns True if the policy ARN belongs to an AWS managed policy, e.g. arn:aws:iam::aws:policy/ReadOnlyAccess"""
+    return policy_arn.split(":")[4] == "aws"
+
+
+class ManagedPolicyDocuments:
+    """
+    ManagedPolicyDocuments keeps the documents of the AWS managed policies indexed by (policy ARN, version id).
+    A given version of an AWS managed policy is the same in every account, so the documents are shared by all the audited accounts
+    of the execution and, if a cache file is configured, by the next executions.
+    """
+
+    def __init__(self):
+        self.documents = {}
+        self.lock = threading.Lock()
+        self.cache_file = None
+        # Documents retrieved since the cache file was loaded
+        self.new_documents = False
+
+    def load(self, cache_file: Optional[str]):
+        """load reads the documents of the cache file, only the first time it is called with a file"""
+        with self.lock:
+            if not cache_file or self.cache_file:
+                return
+            self.cache_file = os.path.expanduser(cache_file)
+            if not os.path.isfile(self.cache_file):
+                return
+            try:
+                with open(self.cache_file) as f:
+                    cached_documents = json.load(f)
+                for policy_arn, versions in cached_documents.items():
+                    for version_id, document in versions.items():
+                        self.documents.setdefault((policy_arn, version_id), document)
+            except Exception as error:
+                logger.warning(
+                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+
+    def get_document(self, policy_arn: str, version_id: str) -> Optional[dict]:
+        """get_document returns the cached document of the policy version or None if it is not cached"""
+        return self.documents.get((policy_arn, version_id))
+
+    def add_document(self, policy_arn: str, version_id: str, document: dict):
+        """add_document caches the document of an AWS managed policy version, the rest of policies are ignored"""
+        if not document or not is_aws_managed_policy(policy_arn):
+            return
+        with self.lock:
+            if (policy_arn, version_id) not in self.documents:
+                self.documents[(policy_arn, version_id)] = document
+                self.new_documents = True
+
+    def save(self):
+        """save writes the cached documents to the cache file if there are new ones"""
+        with self.lock:
+            if not self.cache_file or not self.new_documents:
+                return
+            try:
+                cached_documents = {}
+                for (policy_arn, version_id), document in self.documents.items():
+                    cached_documents.setdefault(policy_arn, {})[version_id] = document
+                cache_directory = os.path.dirname(self.cache_file)
+                if cache_directory:
+                    os.makedirs(cache_directory, exist_ok=True)
+                # Replace the file at once so a concurrent execution never reads it half written
+                temporary_file = f"{self.cache_file}.{os.getpid()}.tmp"
+                with open(temporary_file, "w") as f:
+                    json.dump(cached_documents, f)
+                os.replace(temporary_file, self.cache_file)
+                self.new_documents = False
+            except Exception as error:
+                logger.warning(
+                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+
+
+# Shared by all the accounts audited in the execution
+aws_managed_policy_documents = ManagedPolicyDocuments()
@@ -0,0 +1,153 @@
+import re
+from functools import lru_cache
+from typing import Optional
+
+
+@lru_cache(maxsize=None)
+def compile_pattern(pattern: str):
+    """compile_pattern returns a regex matching every string, wildcards included, that the IAM pattern covers"""
+    regex = ""
+    for character in pattern:
+        if character == "*":
+            regex += ".*"
+        elif character == "?":
+            # A single character wildcard cannot cover a multi-character one
+            regex += "[^*]"
+        else:
+            regex += re.escape(character)
+    return re.compile(regex, re.DOTALL)
+
+
+def pattern_covers(pattern: str, value: str) -> bool:
+    """pattern_covers returns True if every string matched by value is matched by pattern"""
+    return compile_pattern(pattern).fullmatch(value) is not None
+
+
+@lru_cache(maxsize=None)
+def patterns_overlap(first: str, second: str) -> bool:
+    """patterns_overlap returns True if at least one string is matched by both IAM patterns"""
+
+    @lru_cache(maxsize=None)
+    def overlap(i: int, j: int) -> bool:
+        if i == len(first) and j == len(second):
+            return True
+        if i < len(first) and first[i] == "*":
+            return overlap(i + 1, j) or (j < len(second) and overlap(i, j + 1))
+        if j < len(second) and second[j] == "*":
+            return overlap(i, j + 1) or (i < len(first) and overlap(i + 1, j))
+        if i == len(first) or j == len(second):
+            return False
+        if first[i] == "?" or second[j] == "?" or first[i] == second[j]:
+            return overlap(i + 1, j + 1)
+        return False
+
+    return overlap(0, 0)
+
+
+def normalize_list(value) -> list:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+class CompiledStatement:
+    """CompiledStatement is a normalized policy statement, actions are lowercased since IAM matches them case-insensitively"""
+
+    def __init__(self, statement: dict):
+        self.effect = statement.get("Effect")
+        self.not_action = "NotAction" in statement
+        self.actions = [
+            action.lower()
+            for action in normalize_list(
+                statement.get("NotAction" if self.not_action else "Action")
+            )
+        ]
+        self.not_resource = "NotResource" in statement
+        self.resources = normalize_list(
+            statement.get("NotResource" if self.not_resource else "Resource")
+        )
+        self.conditional = bool(statement.get("Condition"))
+
+    def covers_action(self, action: str) -> bool:
+        # Every action matched by action is matched by this statement
+        if self.not_action:
+            return not any(
+                patterns_overlap(pattern, action) for pattern in self.actions
+            )
+        return any(pattern_covers(pattern, action) for pattern in self.actions)
+
+    def overlaps_action(self, action: str) -> bool:
+        # At least one action matched by action is matched by this statement
+        if self.not_action:
+            return not any(pattern_covers(pattern, action) for pattern in self.actions)
+        return any(patterns_overlap(pattern, action) for pattern in self.actions)
+
+    def denies_action(self, action: str) -> bool:
+        # Only an unconditional deny covering every action matched by action subtracts it from a grant
+        return not self.conditional and self.covers_action(action)
+
+    def covers_resource(self, resource: Optional[str]) -> bool:
+        if resource is None:
+            return True
+        if self.not_resource:
+            return not any(
+                patterns_overlap(pattern, resource) for pattern in self.resources
+            )
+        return any(pattern_covers(pattern, resource) for pattern in self.resources)
+
+
+class CompiledPolicy:
+    """CompiledPolicy parses a policy document once so its permissions can be queried many times
+
+    Condition blocks are not evaluated: conditional allow statements are considered to apply,
+    while conditional deny statements are not, since they may not apply to the request.
+    """
+
+    def __init__(self, document: Optional[dict]):
+        self.allow_statements = []
+        self.deny_statements = []
+        statements = normalize_list(document.get("Statement")) if document else []
+        for statement in statements:
+            compiled_statement = CompiledStatement(statement)
+            if compiled_statement.effect == "Allow":
+                self.allow_statements.append(compiled_statement)
+            elif compiled_statement.effect == "Deny":
+                self.deny_statements.append(compiled_statement)
+
+    def allows(self, action: str, resource: Optional[str] = None) -> bool:
+        """allows returns True if every action matched by action is allowed over resource and not entirely denied
+
+        action can be a literal action (iam:PassRole) or a pattern (kms:*, *).
+        If resource is None the resources of the allow statements are not taken into account.
+        """
+        return self.grants(action, resource) and not self.denies(action, resource)
+
+    def grants(self, action: str, resource: Optional[str] = None) -> bool:
+        """grants returns True if every action matched by action is allowed over resource, ignoring the deny statements"""
+        action = action.lower()
+        return any(
+            statement.covers_action(action) and statement.covers_resource(resource)
+            for statement in self.allow_statements
+        )
+
+    def denies(self, action: str, resource: Optional[str] = None) -> bool:
+        """denies returns True if every action matched by action is unconditionally denied over resource
+
+        A deny of only some of the actions, or of some of the resources, does not deny the whole pattern.
+        """
+        action = action.lower()
+        denied_resource = "*" if resource is None else resource
+        return any(
+            statement.denies_action(action)
+            and statement.covers_resource(denied_resource)
+            for statement in self.deny_statements
+        )
+
+    def allowed_actions(self, actions: set, resource: Optional[str] = None) -> set:
+        """allowed_actions returns the subset of actions allowed by the policy"""
+        return {action for action in actions if self.allows(action, resource)}
+
+    def allows_any(self, actions: set, resource: Optional[str] = None) -> bool:
+        return any(self.allows(action, resource) for action in actions)
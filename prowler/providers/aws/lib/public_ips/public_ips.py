@@ -0,0 +1,70 @@
+from functools import lru_cache
+from ipaddress import ip_address
+from typing import Iterable, Optional
+
+import awsipranges
+
+from prowler.lib.logger import logger
+
+
+class IPPrefixTable:
+    """IP networks by prefix length, to find the ones containing an IP address without going through all of them"""
+
+    def __init__(self, networks: Iterable):
+        # (IP version, prefix length) -> network addresses shifted to the prefix length
+        self.prefixes = {}
+        for network in networks:
+            host_bits = network.max_prefixlen - network.prefixlen
+            self.prefixes.setdefault((network.version, network.prefixlen), set()).add(
+                int(network.network_address) >> host_bits
+            )
+
+    def __contains__(self, ip: str) -> bool:
+        address = ip_address(ip)
+        for (version, prefixlen), networks in self.prefixes.items():
+            if version == address.version:
+                host_bits = address.max_prefixlen - prefixlen
+                if int(address) >> host_bits in networks:
+                    return True
+        return False
+
+
+@lru_cache(maxsize=None)
+def download_aws_ip_ranges() -> IPPrefixTable:
+    """Download the AWS IP address ranges only once, they are the same for every account
+
+    A failed download raises and is not cached, so it is retried the next time.
+    """
+    aws_ip_ranges = awsipranges.get_ranges()
+    return IPPrefixTable(
+        aws_ip_prefix.prefix
+        for aws_ip_prefix in aws_ip_ranges.ipv4_prefixes + aws_ip_ranges.ipv6_prefixes
+    )
+
+
+def get_aws_ip_ranges() -> Optional[IPPrefixTable]:
+    """Returns the AWS IP address ranges, or None if they could not be downloaded"""
+    try:
+        return download_aws_ip_ranges()
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        return None
+
+
+class PublicIPIndex:
+    """Public IP addresses of an account, built once to look up every DNS record"""
+
+    def __init__(self, account_public_ips: Iterable[str]):
+        self.account_public_ips = set(account_public_ips)
+
+    def belongs_to_account(self, ip: str) -> bool:
+        return ip in self.account_public_ips
+
+    def belongs_to_aws(self, ip: str) -> Optional[bool]:
+        """Returns None if the AWS IP address ranges are not available"""
+        aws_ip_ranges = get_aws_ip_ranges()
+        if aws_ip_ranges is None:
+            return None
+        return ip in aws_ip_ranges
@@ -1,6 +1,7 @@
 import csv
 import json
-from copy import deepcopy
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from alive_progress import alive_bar
 from botocore.client import ClientError
@@ -15,15 +16,23 @@ from prowler.config.config import (
 )
 from prowler.lib.logger import logger
 from prowler.lib.outputs.outputs import send_to_s3_bucket
+from prowler.providers.aws.aws_provider import max_workers
 from prowler.providers.aws.lib.arn.models import get_arn_resource_type
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 
+inventory_fields = [
+    "AWS_AccountID",
+    "AWS_Region",
+    "AWS_Partition",
+    "AWS_Service",
+    "AWS_ResourceType",
+    "AWS_ResourceID",
+    "AWS_ResourceARN",
+    "AWS_Tags",
+]
+
 
 def quick_inventory(audit_info: AWS_Audit_Info, args):
-    resources = []
-    global_resources = []
-    total_resources_per_region = {}
-    iam_was_scanned = False
     # If not inputed regions, check all of them
     if not audit_info.audited_regions:
         # EC2 client for describing all regions
@@ -35,6 +44,12 @@ def quick_inventory(audit_info: AWS_Audit_Info, args):
             region["RegionName"] for region in ec2_client.describe_regions()["Regions"]
         ]
 
+    output_file = (
+        f"prowler-inventory-{audit_info.audited_account}-{output_file_timestamp}"
+    )
+    inventory = QuickInventoryOutput(
+        audit_info.audited_account, args.output_directory, output_file
+    )
     with alive_bar(
         total=len(audit_info.audited_regions),
         ctrl_c=False,
@@ -43,70 +58,41 @@ def quick_inventory(audit_info: AWS_Audit_Info, args):
         stats=False,
         enrich_print=False,
     ) as bar:
-        for region in sorted(audit_info.audited_regions):
-            bar.title = f"Inventorying AWS Account {orange_color}{audit_info.audited_account}{Style.RESET_ALL}"
-            resources_in_region = []
-            # {
-            #   eu-west-1: 100,...
-            # }
-
-            try:
+        bar.title = f"Inventorying AWS Account {orange_color}{audit_info.audited_account}{Style.RESET_ALL}"
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 # Scan IAM only once
-                if not iam_was_scanned:
-                    global_resources.extend(get_iam_resources(audit_info.audit_session))
-                    iam_was_scanned = True
-
-                # Get regional S3 buckets since none-tagged buckets are not supported by the resourcegroupstaggingapi
-                resources_in_region.extend(get_regional_buckets(audit_info, region))
-
-                client = audit_info.audit_session.client(
-                    "resourcegroupstaggingapi", region_name=region
-                )
-                # Get all the resources
-                resources_count = 0
-                try:
-                    get_resources_paginator = client.get_paginator("get_resources")
-                    for page in get_resources_paginator.paginate():
-                        resources_count += len(page["ResourceTagMappingList"])
-                        for resource in page["ResourceTagMappingList"]:
-                            # Avoid adding S3 buckets again:
-                            if resource["ResourceARN"].split(":")[2] != "s3":
-                                # Check if region is not in ARN --> Global service
-                                if not resource["ResourceARN"].split(":")[3]:
-                                    global_resources.append(
-                                        {
-                                            "arn": resource["ResourceARN"],
-                                            "tags": resource["Tags"],
-                                        }
-                                    )
-                                else:
-                                    resources_in_region.append(
-                                        {
-                                            "arn": resource["ResourceARN"],
-                                            "tags": resource["Tags"],
-                                        }
-                                    )
-                except Exception as error:
-                    logger.error(
-                        f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-                bar()
-                if len(resources_in_region) > 0:
-                    total_resources_per_region[region] = len(resources_in_region)
-                bar.text = f"-> Found {Fore.GREEN}{len(resources_in_region)}{Style.RESET_ALL} resources in {region}"
-
-            except Exception as error:
-                logger.error(
-                    f"{region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                iam_future = executor.submit(
+                    get_iam_resources, audit_info.audit_session.client("iam"), inventory
                 )
-                bar()
-
-            resources.extend(resources_in_region)
+                # Get S3 buckets since none-tagged buckets are not supported by the resourcegroupstaggingapi
+                buckets_per_region = get_buckets_per_region(audit_info, executor)
+                # The boto3 session is not thread safe, the clients are created before
+                regional_futures = {
+                    executor.submit(
+                        get_regional_resources,
+                        audit_info.audit_session.client("s3", region_name=region),
+                        audit_info.audit_session.client(
+                            "resourcegroupstaggingapi", region_name=region
+                        ),
+                        audit_info.audited_partition,
+                        region,
+                        buckets_per_region.get(region, []),
+                        inventory,
+                    ): region
+                    for region in audit_info.audited_regions
+                }
+                for future in as_completed(regional_futures):
+                    bar()
+                    bar.text = f"-> Found {Fore.GREEN}{future.result()}{Style.RESET_ALL} resources in {regional_futures[future]}"
+                iam_future.result()
+        finally:
+            inventory.close()
         bar.title = f"-> {Fore.GREEN}Quick Inventory completed!{Style.RESET_ALL}"
 
-    resources.extend(global_resources)
-    total_resources_per_region["global"] = len(global_resources)
-    inventory_table = create_inventory_table(resources, total_resources_per_region)
+    inventory_table = create_inventory_table(
+        inventory.resources_type, inventory.resources_per_region
+    )
 
     print(
         f"\nQuick Inventory of AWS Account {Fore.YELLOW}{audit_info.audited_account}{Style.RESET_ALL}:"
@@ -117,81 +103,142 @@ def quick_inventory(audit_info: AWS_Audit_Info, args):
             inventory_table, headers="keys", tablefmt="rounded_grid", stralign="left"
         )
     )
-    print(f"\nTotal resources found: {Fore.GREEN}{len(resources)}{Style.RESET_ALL}")
-
-    create_output(resources, audit_info, args)
-
-
-def create_inventory_table(resources: list, resources_in_region: dict) -> dict:
-    regions_with_resources = list(resources_in_region.keys())
-    services = {}
-    # { "S3":
-    #       123,
-    #   "IAM":
-    #       239,
-    # }
-    resources_type = {}
-    # { "S3":
-    #       "Buckets":
-    #           eu-west-1: 10,
-    #           eu-west-2: 3,
-    #   "IAM":
-    #       "Roles":
-    #           us-east-1: 143,
-    #       "Users":
-    #           us-west-2: 22,
-    # }
+    print(
+        f"\nTotal resources found: {Fore.GREEN}{inventory.total_resources}{Style.RESET_ALL}"
+    )
 
+    create_output(output_file, audit_info, args)
+
+
+class QuickInventoryOutput:
+    """
+    Writes the CSV and JSON inventory files line by line as the resources are found,
+    keeping in memory only the resource counters for the inventory table
+    """
+
+    def __init__(self, audited_account: str, output_directory: str, output_file: str):
+        self.audited_account = audited_account
+        self.lock = threading.Lock()
+        self.total_resources = 0
+        # { "eu-west-1": 100, "global": 20 }
+        self.resources_per_region = {}
+        # { "S3":
+        #       "Buckets":
+        #           eu-west-1: 10,
+        #           eu-west-2: 3,
+        #   "IAM":
+        #       "Roles":
+        #           us-east-1: 143,
+        #       "Users":
+        #           us-west-2: 22,
+        # }
+        self.resources_type = {}
+        self.json_file = open(
+            f"{output_directory}/{output_file}{json_file_suffix}", "w"
+        )
+        self.csv_file = open(
+            f"{output_directory}/{output_file}{csv_file_suffix}", "w", newline=""
+        )
+        self.csv_writer = csv.DictWriter(self.csv_file, fieldnames=inventory_fields)
+        self.csv_writer.writeheader()
+        self.json_file.write("[")
+
+    def add_resource(self, arn: str, tags: list):
+        resource = get_inventory_resource(self.audited_account, arn, tags)
+        service = resource["AWS_Service"]
+        region = resource["AWS_Region"] or "global"
+        resource_type = get_arn_resource_type(arn, service)
+        # Same format as a JSON list with an indentation of 4 spaces
+        json_resource = json.dumps(resource, indent=4).replace("\n", "\n    ")
+        with self.lock:
+            if self.total_resources:
+                self.json_file.write(",")
+            self.json_file.write(f"\n    {json_resource}")
+            self.csv_writer.writerow(resource)
+            self.total_resources += 1
+            self.resources_per_region[region] = (
+                self.resources_per_region.get(region, 0) + 1
+            )
+            regions = self.resources_type.setdefault(service, {}).setdefault(
+                resource_type, {}
+            )
+            regions[region] = regions.get(region, 0) + 1
+
+    def close(self):
+        self.json_file.write("\n]" if self.total_resources else "]")
+        self.json_file.close()
+        self.csv_file.close()
+
+
+def get_inventory_resource(audited_account: str, arn: str, tags: list) -> dict:
+    arn_parts = arn.split(":")
+    resource_path = arn.split("/")
+    resource = {}
+    resource["AWS_AccountID"] = audited_account
+    resource["AWS_Region"] = arn_parts[3]
+    resource["AWS_Partition"] = arn_parts[1]
+    resource["AWS_Service"] = arn_parts[2]
+    resource["AWS_ResourceType"] = arn_parts[5].split("/")[0]
+    resource["AWS_ResourceID"] = ""
+    if len(resource_path) > 1:
+        resource["AWS_ResourceID"] = resource_path[-1]
+    elif len(arn_parts) > 6:
+        resource["AWS_ResourceID"] = arn_parts[-1]
+    resource["AWS_ResourceARN"] = arn
+    # Cover S3 case
+    if resource["AWS_Service"] == "s3":
+        resource["AWS_ResourceType"] = "bucket"
+        resource["AWS_ResourceID"] = arn_parts[-1]
+    # Cover WAFv2 case
+    if resource["AWS_Service"] == "wafv2":
+        resource["AWS_ResourceType"] = "/".join(arn_parts[-1].split("/")[:-2])
+        resource["AWS_ResourceID"] = "/".join(arn_parts[-1].split("/")[2:])
+    # Cover Config case
+    if resource["AWS_Service"] == "config":
+        resource["AWS_ResourceID"] = "/".join(arn_parts[-1].split("/")[1:])
+    resource["AWS_Tags"] = tags
+    return resource
+
+
+def create_inventory_table(resources_type: dict, resources_in_region: dict) -> dict:
+    total_resources = sum(resources_in_region.values())
+    regions_with_resources = sorted(resources_in_region)
     inventory_table = {
         "Service": [],
-        f"Total\n({Fore.GREEN}{str(len(resources))}{Style.RESET_ALL})": [],
+        f"Total\n({Fore.GREEN}{str(total_resources)}{Style.RESET_ALL})": [],
         "Total per\nresource type": [],
     }
 
-    for region, count in resources_in_region.items():
-        inventory_table[f"{region}\n({Fore.GREEN}{str(count)}{Style.RESET_ALL})"] = []
-
-    for resource in sorted(resources, key=lambda d: d["arn"]):
-        service = resource["arn"].split(":")[2]
-        region = resource["arn"].split(":")[3]
-        if not region:
-            region = "global"
-        if service not in services:
-            services[service] = 0
-        services[service] += 1
-
-        resource_type = get_arn_resource_type(resource["arn"], service)
-
-        if service not in resources_type:
-            resources_type[service] = {}
-        if resource_type not in resources_type[service]:
-            resources_type[service][resource_type] = {}
-        if region not in resources_type[service][resource_type]:
-            resources_type[service][resource_type][region] = 0
-        resources_type[service][resource_type][region] += 1
+    for region in regions_with_resources:
+        inventory_table[
+            f"{region}\n({Fore.GREEN}{str(resources_in_region[region])}{Style.RESET_ALL})"
+        ] = []
 
     # Add results to inventory table
-    for service in services:
-        pending_regions = deepcopy(regions_with_resources)
-        aux = {}
+    for service in sorted(resources_type):
         # {
         #  "region": summary,
         # }
+        aux = {region: "" for region in regions_with_resources}
         summary = ""
-        inventory_table["Service"].append(f"{service}")
-        inventory_table[
-            f"Total\n({Fore.GREEN}{str(len(resources))}{Style.RESET_ALL})"
-        ].append(f"{Fore.GREEN}{services[service]}{Style.RESET_ALL}")
-        for resource_type, regions in resources_type[service].items():
-            summary += f"{resource_type} {Fore.GREEN}{str(sum(regions.values()))}{Style.RESET_ALL}\n"
-            # Check if region does not have resource type
-            for region in pending_regions:
-                if region not in aux:
-                    aux[region] = ""
+        service_total = 0
+        for resource_type in sorted(resources_type[service]):
+            regions = resources_type[service][resource_type]
+            resource_type_total = sum(regions.values())
+            service_total += resource_type_total
+            summary += f"{resource_type} {Fore.GREEN}{str(resource_type_total)}{Style.RESET_ALL}\n"
+            for region in regions_with_resources:
+                # Check if region does not have resource type
                 if region not in regions:
                     aux[region] += "-\n"
-            for region, count in regions.items():
-                aux[region] += f"{Fore.GREEN}{str(count)}{Style.RESET_ALL}\n"
+                else:
+                    aux[
+                        region
+                    ] += f"{Fore.GREEN}{str(regions[region])}{Style.RESET_ALL}\n"
+        inventory_table["Service"].append(f"{service}")
+        inventory_table[
+            f"Total\n({Fore.GREEN}{str(total_resources)}{Style.RESET_ALL})"
+        ].append(f"{Fore.GREEN}{service_total}{Style.RESET_ALL}")
         # Add Total per resource type
         inventory_table["Total per\nresource type"].append(summary)
         # Add Total per region
@@ -199,78 +246,11 @@ def create_inventory_table(resources: list, resources_in_region: dict) -> dict:
             inventory_table[
                 f"{region}\n({Fore.GREEN}{str(resources_in_region[region])}{Style.RESET_ALL})"
             ].append(text)
-            if region in pending_regions:
-                pending_regions.remove(region)
-        for region_without_resource in pending_regions:
-            inventory_table[
-                f"{region_without_resource}\n ({Fore.GREEN}{str(resources_in_region[region_without_resource])}{Style.RESET_ALL})"
-            ].append("-")
 
     return inventory_table
 
 
-def create_output(resources: list, audit_info: AWS_Audit_Info, args):
-    json_output = []
-    output_file = (
-        f"prowler-inventory-{audit_info.audited_account}-{output_file_timestamp}"
-    )
-
-    for item in sorted(resources, key=lambda d: d["arn"]):
-        resource = {}
-        resource["AWS_AccountID"] = audit_info.audited_account
-        resource["AWS_Region"] = item["arn"].split(":")[3]
-        resource["AWS_Partition"] = item["arn"].split(":")[1]
-        resource["AWS_Service"] = item["arn"].split(":")[2]
-        resource["AWS_ResourceType"] = item["arn"].split(":")[5].split("/")[0]
-        resource["AWS_ResourceID"] = ""
-        if len(item["arn"].split("/")) > 1:
-            resource["AWS_ResourceID"] = item["arn"].split("/")[-1]
-        elif len(item["arn"].split(":")) > 6:
-            resource["AWS_ResourceID"] = item["arn"].split(":")[-1]
-        resource["AWS_ResourceARN"] = item["arn"]
-        # Cover S3 case
-        if resource["AWS_Service"] == "s3":
-            resource["AWS_ResourceType"] = "bucket"
-            resource["AWS_ResourceID"] = item["arn"].split(":")[-1]
-        # Cover WAFv2 case
-        if resource["AWS_Service"] == "wafv2":
-            resource["AWS_ResourceType"] = "/".join(
-                item["arn"].split(":")[-1].split("/")[:-2]
-            )
-            resource["AWS_ResourceID"] = "/".join(
-                item["arn"].split(":")[-1].split("/")[2:]
-            )
-        # Cover Config case
-        if resource["AWS_Service"] == "config":
-            resource["AWS_ResourceID"] = "/".join(
-                item["arn"].split(":")[-1].split("/")[1:]
-            )
-        resource["AWS_Tags"] = item["tags"]
-        json_output.append(resource)
-
-    # Serializing json
-    json_object = json.dumps(json_output, indent=4)
-
-    # Writing to sample.json
-    with open(
-        args.output_directory + "/" + output_file + json_file_suffix, "w"
-    ) as outfile:
-        outfile.write(json_object)
-
-    csv_file = open(
-        args.output_directory + "/" + output_file + csv_file_suffix, "w", newline=""
-    )
-    csv_writer = csv.writer(csv_file)
-
-    count = 0
-    for data in json_output:
-        if count == 0:
-            header = data.keys()
-            csv_writer.writerow(header)
-            count += 1
-        csv_writer.writerow(data.values())
-
-    csv_file.close()
+def create_output(output_file: str, audit_info: AWS_Audit_Info, args):
     print(
         f"\n{Fore.YELLOW}WARNING: Only resources that have or have had tags will appear (except for IAM and S3).\nSee more in https://docs.prowler.cloud/en/latest/tutorials/quick-inventory/#objections{Style.RESET_ALL}"
     )
@@ -298,51 +278,113 @@ def create_output(resources: list, audit_info: AWS_Audit_Info, args):
             )
 
 
-def get_regional_buckets(audit_info: AWS_Audit_Info, region: str) -> list:
-    regional_buckets = []
-    s3_client = audit_info.audit_session.client("s3", region_name=region)
+def get_regional_resources(
+    s3_client,
+    client,
+    audited_partition: str,
+    region: str,
+    buckets: list,
+    inventory: QuickInventoryOutput,
+) -> int:
+    resources_in_region = 0
     try:
-        buckets = s3_client.list_buckets()
-        for bucket in buckets["Buckets"]:
-            bucket_region = s3_client.get_bucket_location(Bucket=bucket["Name"])[
+        resources_in_region += get_regional_buckets(
+            s3_client, audited_partition, region, buckets, inventory
+        )
+        # Get all the resources
+        get_resources_paginator = client.get_paginator("get_resources")
+        for page in get_resources_paginator.paginate():
+            for resource in page["ResourceTagMappingList"]:
+                # Avoid adding S3 buckets again:
+                if resource["ResourceARN"].split(":")[2] != "s3":
+                    inventory.add_resource(resource["ResourceARN"], resource["Tags"])
+                    # Check if region is in ARN --> Not a global service
+                    if resource["ResourceARN"].split(":")[3]:
+                        resources_in_region += 1
+    except Exception as error:
+        logger.error(
+            f"{region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return resources_in_region
+
+
+def get_buckets_per_region(
+    audit_info: AWS_Audit_Info, executor: ThreadPoolExecutor
+) -> dict:
+    buckets_per_region = {}
+    s3_client = audit_info.audit_session.client(
+        "s3", region_name=audit_info.profile_region
+    )
+
+    def get_bucket_region(bucket_name):
+        try:
+            bucket_region = s3_client.get_bucket_location(Bucket=bucket_name)[
                 "LocationConstraint"
             ]
             if bucket_region == "EU":  # If EU, bucket_region is eu-west-1
                 bucket_region = "eu-west-1"
             if not bucket_region:  # If None, bucket_region is us-east-1
                 bucket_region = "us-east-1"
-            if bucket_region == region:  # Only add bucket if is in current region
-                try:
-                    bucket_tags = s3_client.get_bucket_tagging(Bucket=bucket["Name"])[
-                        "TagSet"
-                    ]
-                except ClientError as error:
-                    bucket_tags = []
-                    if error.response["Error"]["Code"] != "NoSuchTagSet":
-                        logger.error(
-                            f"{region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                bucket_arn = (
-                    f"arn:{audit_info.audited_partition}:s3:{region}::{bucket['Name']}"
-                )
-                regional_buckets.append({"arn": bucket_arn, "tags": bucket_tags})
+            return bucket_region
+        except Exception as error:
+            logger.error(
+                f"{bucket_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return None
+
+    try:
+        # List and locate the buckets only once, not for every region
+        bucket_names = [
+            bucket["Name"] for bucket in s3_client.list_buckets()["Buckets"]
+        ]
+        for bucket_name, bucket_region in zip(
+            bucket_names, executor.map(get_bucket_region, bucket_names)
+        ):
+            if bucket_region:
+                buckets_per_region.setdefault(bucket_region, []).append(bucket_name)
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
         )
+    return buckets_per_region
+
+
+def get_regional_buckets(
+    s3_client,
+    audited_partition: str,
+    region: str,
+    buckets: list,
+    inventory: QuickInventoryOutput,
+) -> int:
+    regional_buckets = 0
+    for bucket_name in buckets:
+        try:
+            try:
+                bucket_tags = s3_client.get_bucket_tagging(Bucket=bucket_name)["TagSet"]
+            except ClientError as error:
+                bucket_tags = []
+                if error.response["Error"]["Code"] != "NoSuchTagSet":
+                    logger.error(
+                        f"{region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    )
+            bucket_arn = f"arn:{audited_partition}:s3:{region}::{bucket_name}"
+            inventory.add_resource(bucket_arn, bucket_tags)
+            regional_buckets += 1
+        except Exception as error:
+            logger.error(
+                f"{region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
     return regional_buckets
 
 
-def get_iam_resources(session) -> list:
-    iam_resources = []
-    iam_client = session.client("iam")
+def get_iam_resources(iam_client, inventory: QuickInventoryOutput):
     try:
         get_roles_paginator = iam_client.get_paginator("list_roles")
         for page in get_roles_paginator.paginate():
             for role in page["Roles"]:
                 # Avoid aws-service-role roles
                 if "aws-service-role" not in role["Arn"]:
-                    iam_resources.append({"arn": role["Arn"], "tags": role.get("Tags")})
+                    inventory.add_resource(role["Arn"], role.get("Tags"))
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -351,7 +393,7 @@ def get_iam_resources(session) -> list:
         get_users_paginator = iam_client.get_paginator("list_users")
         for page in get_users_paginator.paginate():
             for user in page["Users"]:
-                iam_resources.append({"arn": user["Arn"], "tags": user.get("Tags")})
+                inventory.add_resource(user["Arn"], user.get("Tags"))
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -360,7 +402,7 @@ def get_iam_resources(session) -> list:
         get_groups_paginator = iam_client.get_paginator("list_groups")
         for page in get_groups_paginator.paginate():
             for group in page["Groups"]:
-                iam_resources.append({"arn": group["Arn"], "tags": []})
+                inventory.add_resource(group["Arn"], [])
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -369,17 +411,15 @@ def get_iam_resources(session) -> list:
         get_policies_paginator = iam_client.get_paginator("list_policies")
         for page in get_policies_paginator.paginate(Scope="Local"):
             for policy in page["Policies"]:
-                iam_resources.append({"arn": policy["Arn"], "tags": policy.get("Tags")})
+                inventory.add_resource(policy["Arn"], policy.get("Tags"))
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
         )
     try:
         for saml_provider in iam_client.list_saml_providers()["SAMLProviderList"]:
-            iam_resources.append({"arn": saml_provider["Arn"], "tags": []})
+            inventory.add_resource(saml_provider["Arn"], [])
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
         )
-
-    return iam_resources
@@ -1,4 +1,6 @@
 import sys
+import threading
+from typing import Optional
 
 from prowler.lib.logger import logger
 from prowler.providers.aws.aws_provider import generate_regional_clients
@@ -36,3 +38,116 @@ def get_tagged_resources(input_resource_tags: list, current_audit_info: AWS_Audi
         sys.exit(1)
     else:
         return tagged_resources
+
+
+# Resource Groups Tagging API resource types, as ARN service prefixes, of the services that read their tags from the TagStore
+tag_store_resource_types = {
+    "awslambda": ["lambda"],
+    "cloudtrail": ["cloudtrail"],
+    "cloudwatch": ["cloudwatch", "logs"],
+    "directoryservice": ["ds"],
+    "dynamodb": ["dynamodb", "dax"],
+    "elb": ["elasticloadbalancing"],
+    "elbv2": ["elasticloadbalancing"],
+    "kms": ["kms"],
+    "opensearch": ["es"],
+    "route53": ["route53"],
+    "sagemaker": ["sagemaker"],
+    "sns": ["sns"],
+    "sqs": ["sqs"],
+}
+
+
+class TagStore:
+    """
+    TagStore holds the tags of the audited account resources keyed by ARN.
+    Each region is filled once, the first time it is read, with the paginated resourcegroupstaggingapi get_resources
+    limited to the resource types of the audited services, so services do not need to list the tags resource by resource.
+    A resource type that was not part of the fill, e.g. read by a check of another service, is added to the region the first time it is read.
+    """
+
+    def __init__(self, audit_info: AWS_Audit_Info):
+        self.audit_info = audit_info
+        # Region -> {ARN: tags}, None if the region tags could not be retrieved
+        self.regions = {}
+        # Region -> resource types whose tags are in the store
+        self.regions_resource_types = {}
+        self.lock = threading.Lock()
+        self.region_locks = {}
+
+    def get_tags(self, arn: str, region: str) -> Optional[list]:
+        """
+        get_tags returns the tags of the resource as a list of {"Key": key, "Value": value},
+        an empty list if the resource is not tagged or None if the tags of the region could not be retrieved
+        """
+        region_tags = self.__get_region_tags__(region, arn.split(":")[2])
+        if region_tags is None:
+            return None
+        return region_tags.get(arn, [])
+
+    def __get_region_tags__(self, region: str, resource_type: str) -> Optional[dict]:
+        with self.lock:
+            region_lock = self.region_locks.setdefault(region, threading.Lock())
+        with region_lock:
+            resource_types = None
+            if region not in self.regions:
+                resource_types = self.__get_audited_resource_types__()
+                resource_types.add(resource_type)
+            elif (
+                self.regions[region] is not None
+                and resource_type not in self.regions_resource_types[region]
+            ):
+                resource_types = {resource_type}
+            if resource_types:
+                resources_tags = self.__get_resources__(region, resource_types)
+                if resources_tags is None:
+                    self.regions[region] = None
+                else:
+                    self.regions.setdefault(region, {}).update(resources_tags)
+                    self.regions_resource_types.setdefault(region, set()).update(
+                        resource_types
+                    )
+        return self.regions[region]
+
+    def __get_audited_resource_types__(self) -> set:
+        resource_types = set()
+        audit_metadata = self.audit_info.audit_metadata
+        for check in getattr(audit_metadata, "expected_checks", None) or []:
+            resource_types.update(tag_store_resource_types.get(check.split("_")[0], []))
+        return resource_types
+
+    def __get_resources__(self, region: str, resource_types: set) -> Optional[dict]:
+        logger.info(
+            f"Resource Groups Tagging - Getting {', '.join(sorted(resource_types))} resources tags in {region}..."
+        )
+        try:
+            # Sessions are not thread safe to create clients
+            with self.lock:
+                regional_client = self.audit_info.audit_session.client(
+                    "resourcegroupstaggingapi",
+                    region_name=region,
+                    config=self.audit_info.session_config,
+                )
+            region_tags = {}
+            get_resources_paginator = regional_client.get_paginator("get_resources")
+            for page in get_resources_paginator.paginate(
+                ResourceTypeFilters=sorted(resource_types)
+            ):
+                for resource in page["ResourceTagMappingList"]:
+                    region_tags[resource["ResourceARN"]] = resource.get("Tags", [])
+            return region_tags
+        except Exception as error:
+            # Services fall back to their own tags API
+            logger.warning(
+                f"{region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return None
+
+
+def get_stored_tags(
+    tag_store: Optional[TagStore], arn: str, region: str
+) -> Optional[list]:
+    """get_stored_tags returns the resource tags from the tag store, or None if there is no tag store or it does not have the tags of the region"""
+    if tag_store:
+        return tag_store.get_tags(arn, region)
+    return None
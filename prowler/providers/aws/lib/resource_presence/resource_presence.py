@@ -0,0 +1,301 @@
+import threading
+
+from prowler.lib.logger import logger
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    get_available_aws_service_regions,
+)
+from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+
+# Regional services whose checks only report on their own resources, so they can be skipped in the regions where they are empty.
+# Services with region-level configuration checks (e.g. guardduty, securityhub, config, accessanalyzer, ec2, ecr, glue) must never be included here.
+# Each service is keyed by its boto3 name and contains:
+#   - resource_types: resource types as used by the resourcegroupstaggingapi and resource-explorer-2
+#   - list_calls: cheap calls to confirm if the service has any resource in a region, as (operation, arguments, response key)
+prunable_regional_services = {
+    "apigateway": {
+        "resource_types": ["apigateway"],
+        "list_calls": [("get_rest_apis", {"limit": 1}, "items")],
+    },
+    "apigatewayv2": {
+        "resource_types": ["apigateway"],
+        "list_calls": [("get_apis", {"MaxResults": "1"}, "Items")],
+    },
+    "appstream": {
+        "resource_types": ["appstream:fleet"],
+        "list_calls": [("describe_fleets", {}, "Fleets")],
+    },
+    "autoscaling": {
+        "resource_types": ["autoscaling"],
+        "list_calls": [
+            (
+                "describe_launch_configurations",
+                {"MaxRecords": 1},
+                "LaunchConfigurations",
+            ),
+            ("describe_auto_scaling_groups", {"MaxRecords": 1}, "AutoScalingGroups"),
+        ],
+    },
+    "cloudformation": {
+        "resource_types": ["cloudformation:stack"],
+        "list_calls": [("describe_stacks", {}, "Stacks")],
+    },
+    "codebuild": {
+        "resource_types": ["codebuild:project"],
+        "list_calls": [("list_projects", {}, "projects")],
+    },
+    "dynamodb": {
+        "resource_types": ["dynamodb:table", "dax:cache"],
+        "list_calls": [("list_tables", {"Limit": 1}, "TableNames")],
+    },
+    "efs": {
+        "resource_types": ["elasticfilesystem:file-system"],
+        "list_calls": [("describe_file_systems", {"MaxItems": 1}, "FileSystems")],
+    },
+    "eks": {
+        "resource_types": ["eks:cluster"],
+        "list_calls": [("list_clusters", {"maxResults": 1}, "clusters")],
+    },
+    "ecs": {
+        "resource_types": ["ecs:task-definition"],
+        "list_calls": [
+            ("list_task_definitions", {"maxResults": 1}, "taskDefinitionArns")
+        ],
+    },
+    "elb": {
+        "resource_types": ["elasticloadbalancing:loadbalancer"],
+        "list_calls": [
+            ("describe_load_balancers", {"PageSize": 1}, "LoadBalancerDescriptions")
+        ],
+    },
+    "elbv2": {
+        "resource_types": ["elasticloadbalancing:loadbalancer"],
+        "list_calls": [("describe_load_balancers", {"PageSize": 1}, "LoadBalancers")],
+    },
+    "glacier": {
+        "resource_types": ["glacier"],
+        "list_calls": [("list_vaults", {"limit": "1"}, "VaultList")],
+    },
+    "kms": {
+        "resource_types": ["kms:key"],
+        "list_calls": [("list_keys", {"Limit": 1}, "Keys")],
+    },
+    "lambda": {
+        "resource_types": ["lambda:function"],
+        "list_calls": [("list_functions", {"MaxItems": 1}, "Functions")],
+    },
+    "opensearch": {
+        "resource_types": ["es:domain"],
+        "list_calls": [("list_domain_names", {}, "DomainNames")],
+    },
+    "redshift": {
+        "resource_types": ["redshift:cluster"],
+        "list_calls": [("describe_clusters", {"MaxRecords": 20}, "Clusters")],
+    },
+    "secretsmanager": {
+        "resource_types": ["secretsmanager:secret"],
+        "list_calls": [("list_secrets", {"MaxResults": 1}, "SecretList")],
+    },
+    "sns": {
+        "resource_types": ["sns"],
+        "list_calls": [("list_topics", {}, "Topics")],
+    },
+    "sqs": {
+        "resource_types": ["sqs"],
+        "list_calls": [("list_queues", {"MaxResults": 1}, "QueueUrls")],
+    },
+    "workspaces": {
+        "resource_types": ["workspaces:workspace"],
+        "list_calls": [("describe_workspaces", {"Limit": 1}, "Workspaces")],
+    },
+}
+
+# Sessions are not thread safe to create clients, and the regions are probed in threads
+client_creation_lock = threading.Lock()
+
+
+def get_regions_with_resources(audit_info: AWS_Audit_Info) -> dict:
+    """
+    get_regions_with_resources probes the regions of every prunable service and returns a dict of service -> set of regions with resources.
+    A service is present in a region if the resourcegroupstaggingapi or the resource-explorer-2 aggregator index return any of its resources,
+    otherwise a cheap list call decides it since both APIs can miss untagged or not yet indexed resources.
+    If a service cannot be probed in a region, e.g. the resourcegroupstaggingapi client cannot be created, it is assumed to be present to not skip any resource.
+    """
+    logger.info("Probing regions with resources ...")
+    regions_with_resources = {service: set() for service in prunable_regional_services}
+    probed_regions = set()
+    try:
+        resource_explorer = get_resource_explorer_aggregator(audit_info)
+        threads = []
+        for regional_client in generate_regional_clients(
+            "resourcegroupstaggingapi", audit_info
+        ).values():
+            threads.append(
+                threading.Thread(
+                    target=probe_region,
+                    args=(
+                        audit_info,
+                        regional_client,
+                        resource_explorer,
+                        regions_with_resources,
+                        probed_regions,
+                    ),
+                )
+            )
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # Keep the regions that could not be probed
+        for service in prunable_regional_services:
+            for region in get_available_aws_service_regions(service, audit_info):
+                if region not in probed_regions:
+                    regions_with_resources[service].add(region)
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        # Do not prune any region if the probe fails
+        return None
+    return regions_with_resources
+
+
+def get_resource_explorer_aggregator(audit_info: AWS_Audit_Info) -> tuple:
+    """get_resource_explorer_aggregator returns the resource-explorer-2 client of the aggregator index region and the regions with a local index, or None if there is no aggregator index"""
+    try:
+        client = audit_info.audit_session.client(
+            "resource-explorer-2",
+            region_name=audit_info.profile_region,
+            config=audit_info.session_config,
+        )
+        aggregator_region = None
+        indexed_regions = set()
+        for page in client.get_paginator("list_indexes").paginate():
+            for index in page["Indexes"]:
+                indexed_regions.add(index["Region"])
+                if index["Type"] == "AGGREGATOR":
+                    aggregator_region = index["Region"]
+        if aggregator_region:
+            aggregator_client = audit_info.audit_session.client(
+                "resource-explorer-2",
+                region_name=aggregator_region,
+                config=audit_info.session_config,
+            )
+            return (aggregator_client, indexed_regions)
+    except Exception as error:
+        logger.info(
+            f"Resource Explorer not available to probe regions -- {error.__class__.__name__}: {error}"
+        )
+    return None
+
+
+def probe_region(
+    audit_info: AWS_Audit_Info,
+    tagging_client,
+    resource_explorer: tuple,
+    regions_with_resources: dict,
+    probed_regions: set,
+):
+    region = tagging_client.region
+    services_to_probe = [
+        service
+        for service in prunable_regional_services
+        if region in get_available_aws_service_regions(service, audit_info)
+    ]
+    resource_types = set()
+    for service in services_to_probe:
+        resource_types.update(prunable_regional_services[service]["resource_types"])
+
+    present_resource_types = set()
+    try:
+        present_resource_types.update(
+            get_tagged_resource_types(tagging_client, resource_types)
+        )
+        # Resource Explorer also indexes untagged resources
+        if (
+            resource_explorer
+            and region in resource_explorer[1]
+            and not resource_types.issubset(present_resource_types)
+        ):
+            present_resource_types.update(
+                get_indexed_resource_types(
+                    resource_explorer[0],
+                    region,
+                    resource_types.difference(present_resource_types),
+                )
+            )
+    except Exception as error:
+        logger.error(
+            f"{region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+
+    for service in services_to_probe:
+        try:
+            # Neither API is exhaustive, so the empty services are confirmed with a list call
+            if present_resource_types.intersection(
+                prunable_regional_services[service]["resource_types"]
+            ) or service_has_listed_resources(audit_info, service, region):
+                regions_with_resources[service].add(region)
+        except Exception as error:
+            logger.error(
+                f"{region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            regions_with_resources[service].add(region)
+    probed_regions.add(region)
+
+
+def get_indexed_resource_types(client, region: str, resource_types: set) -> set:
+    """get_indexed_resource_types returns the resource types with resources in the region using the resource-explorer-2 aggregator index"""
+    # Filters of different types are ANDed while repeated ones are ORed, so only service filters are used
+    query_filters = " ".join(
+        f"service:{service}"
+        for service in sorted(
+            {resource_type.split(":")[0] for resource_type in resource_types}
+        )
+    )
+    present_resource_types = set()
+    search_paginator = client.get_paginator("search")
+    for page in search_paginator.paginate(
+        QueryString=f"region:{region} {query_filters}"
+    ):
+        for resource in page["Resources"]:
+            present_resource_types.add(resource["Service"])
+            present_resource_types.add(resource["ResourceType"])
+        # Stop paginating once every resource type has been found
+        if resource_types.issubset(present_resource_types):
+            break
+    return present_resource_types
+
+
+def get_tagged_resource_types(tagging_client, resource_types: set) -> set:
+    """get_tagged_resource_types returns the resource types with tagged resources in the client region"""
+    present_resource_types = set()
+    get_resources_paginator = tagging_client.get_paginator("get_resources")
+    for page in get_resources_paginator.paginate(
+        ResourceTypeFilters=sorted(resource_types)
+    ):
+        for resource in page["ResourceTagMappingList"]:
+            arn = resource["ResourceARN"].split(":")
+            resource_service = arn[2]
+            resource_type = arn[5].split("/")[0]
+            present_resource_types.add(resource_service)
+            present_resource_types.add(f"{resource_service}:{resource_type}")
+        # Stop paginating once every resource type has been found
+        if resource_types.issubset(present_resource_types):
+            break
+    return present_resource_types
+
+
+def service_has_listed_resources(
+    audit_info: AWS_Audit_Info, service: str, region: str
+) -> bool:
+    with client_creation_lock:
+        client = audit_info.audit_session.client(
+            service, region_name=region, config=audit_info.session_config
+        )
+    for operation, arguments, response_key in prunable_regional_services[service][
+        "list_calls"
+    ]:
+        if getattr(client, operation)(**arguments).get(response_key):
+            return True
+    return False
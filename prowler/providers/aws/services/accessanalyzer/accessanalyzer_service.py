@@ -1,7 +1,6 @@
 import threading
 from typing import Optional
 
-from botocore.exceptions import ClientError
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
@@ -19,8 +18,7 @@ class AccessAnalyzer:
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.analyzers = []
         self.__threading_call__(self.__list_analyzers__)
-        self.__list_findings__()
-        self.__get_finding_status__()
+        self.__threading_call__(self.__list_findings__)
 
     def __get_session__(self):
         return self.session
@@ -73,48 +71,26 @@ class AccessAnalyzer:
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __get_finding_status__(self):
-        logger.info("AccessAnalyzer - Get Finding status...")
-        try:
-            for analyzer in self.analyzers:
-                if analyzer.status == "ACTIVE":
-                    regional_client = self.regional_clients[analyzer.region]
-                    for finding in analyzer.findings:
-                        try:
-                            finding_information = regional_client.get_finding(
-                                analyzerArn=analyzer.arn, id=finding.id
-                            )
-                            finding.status = finding_information["finding"]["status"]
-                        except ClientError as error:
-                            if (
-                                error.response["Error"]["Code"]
-                                == "ResourceNotFoundException"
-                            ):
-                                logger.warning(
-                                    f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                )
-                                finding.status = ""
-                            continue
-
-        except Exception as error:
-            logger.error(
-                f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-            )
-
-    def __list_findings__(self):
+    def __list_findings__(self, regional_client):
         logger.info("AccessAnalyzer - Listing Findings per Analyzer...")
         try:
             for analyzer in self.analyzers:
-                if analyzer.status == "ACTIVE":
-                    regional_client = self.regional_clients[analyzer.region]
+                if (
+                    analyzer.status == "ACTIVE"
+                    and analyzer.region == regional_client.region
+                ):
                     list_findings_paginator = regional_client.get_paginator(
                         "list_findings"
                     )
+                    # Only the active findings are listed, their status is already returned so there is no need to get each finding
                     for page in list_findings_paginator.paginate(
-                        analyzerArn=analyzer.arn
+                        analyzerArn=analyzer.arn,
+                        filter={"status": {"eq": ["ACTIVE"]}},
                     ):
                         for finding in page["findings"]:
-                            analyzer.findings.append(Finding(id=finding["id"]))
+                            analyzer.findings.append(
+                                Finding(id=finding["id"], status=finding["status"])
+                            )
 
         except Exception as error:
             logger.error(
@@ -1,18 +1,24 @@
 import json
-import os
-import tempfile
-
-from detect_secrets import SecretsCollection
-from detect_secrets.settings import default_settings
 
 from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.utils.utils import detect_secrets_scan_batch
 from prowler.providers.aws.services.awslambda.awslambda_client import awslambda_client
 
 
 class awslambda_function_no_secrets_in_variables(Check):
     def execute(self):
         findings = []
-        for function in awslambda_client.functions.values():
+        functions = list(awslambda_client.functions.values())
+        # Scan the variables of all the functions at once
+        detect_secrets_outputs = detect_secrets_scan_batch(
+            [
+                json.dumps(function.environment, indent=2)
+                if function.environment
+                else ""
+                for function in functions
+            ]
+        )
+        for function, detect_secrets_output in zip(functions, detect_secrets_outputs):
             report = Check_Report_AWS(self.metadata())
             report.region = function.region
             report.resource_id = function.name
@@ -24,32 +30,16 @@ class awslambda_function_no_secrets_in_variables(Check):
                 f"No secrets found in Lambda function {function.name} variables"
             )
 
-            if function.environment:
-                temp_env_data_file = tempfile.NamedTemporaryFile(delete=False)
-                temp_env_data_file.write(
-                    bytes(
-                        json.dumps(function.environment, indent=2),
-                        encoding="raw_unicode_escape",
-                    )
+            if function.environment and detect_secrets_output:
+                environment_variable_names = list(function.environment.keys())
+                secrets_string = ", ".join(
+                    [
+                        f"{secret['type']} in variable {environment_variable_names[int(secret['line_number'])-2]}"
+                        for secret in detect_secrets_output
+                    ]
                 )
-                temp_env_data_file.close()
-                secrets = SecretsCollection()
-                with default_settings():
-                    secrets.scan_file(temp_env_data_file.name)
-
-                detect_secrets_output = secrets.json()
-                if detect_secrets_output:
-                    environment_variable_names = list(function.environment.keys())
-                    secrets_string = ", ".join(
-                        [
-                            f"{secret['type']} in variable {environment_variable_names[int(secret['line_number'])-2]}"
-                            for secret in detect_secrets_output[temp_env_data_file.name]
-                        ]
-                    )
-                    report.status = "FAIL"
-                    report.status_extended = f"Potential secret found in Lambda function {function.name} variables -> {secrets_string}"
-
-                os.remove(temp_env_data_file.name)
+                report.status = "FAIL"
+                report.status_extended = f"Potential secret found in Lambda function {function.name} variables -> {secrets_string}"
 
             findings.append(report)
 
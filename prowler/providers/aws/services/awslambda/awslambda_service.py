@@ -1,17 +1,30 @@
-import io
 import json
+import tempfile
 import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Optional
+from typing import Optional
 
 import requests
 from botocore.client import ClientError
 from pydantic import BaseModel
 
+from prowler.config.config import get_config_var
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.lib.utils.utils import scan_secrets_in_memory
+from prowler.providers.aws.aws_provider import generate_regional_clients, max_workers
+from prowler.providers.aws.lib.resource_api_tagging.resource_api_tagging import (
+    get_stored_tags,
+)
+
+# Downloaded code above this size is spooled to disk instead of kept in memory
+code_spool_max_memory_size = 10 * 1024 * 1024
+code_download_chunk_size = 1024 * 1024
+code_download_timeout = 60
+# Secrets found in the Lambda code already scanned, by CodeSha256
+lambda_code_secrets = {}
 
 
 ################## Lambda
@@ -21,6 +34,7 @@ class Lambda:
         self.session = audit_info.audit_session
         self.audited_account = audit_info.audited_account
         self.audit_resources = audit_info.audit_resources
+        self.tag_store = audit_info.tag_store
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.functions = {}
         self.__threading_call__(self.__list_functions__)
@@ -32,7 +46,7 @@ class Lambda:
             "awslambda_function_no_secrets_in_code"
             in audit_info.audit_metadata.expected_checks
         ):
-            self.__threading_call__(self.__get_function__)
+            self.__get_functions_code__()
 
         self.__threading_call__(self.__get_policy__)
         self.__threading_call__(self.__get_function_url_config__)
@@ -83,28 +97,134 @@ class Lambda:
                 f" {error}"
             )
 
-    def __get_function__(self, regional_client):
-        logger.info("Lambda - Getting Function...")
+    def __get_functions_code__(self):
+        logger.info("Lambda - Getting Functions Code...")
         try:
-            for function in self.functions.values():
-                if function.region == regional_client.region:
-                    function_information = regional_client.get_function(
-                        FunctionName=function.name
+            max_code_size = get_config_var("max_lambda_code_size_in_mb") * 1024 * 1024
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                functions_code = list(
+                    executor.map(self.__get_function_code__, self.functions.values())
+                )
+                # Functions with the same code are downloaded and scanned only once
+                code_locations = {}
+                code_not_scanned = {}
+                for function_code in functions_code:
+                    if function_code and function_code[2] not in lambda_code_secrets:
+                        code_locations.setdefault(function_code[2], function_code[1])
+                with requests.Session() as http_session:
+                    http_session.mount(
+                        "https://",
+                        requests.adapters.HTTPAdapter(
+                            pool_connections=max_workers, pool_maxsize=max_workers
+                        ),
                     )
-                    if "Location" in function_information["Code"]:
-                        code_location_uri = function_information["Code"]["Location"]
-                        raw_code_zip = requests.get(code_location_uri).content
-                        self.functions[function.arn].code = LambdaCode(
-                            location=code_location_uri,
-                            code_zip=zipfile.ZipFile(io.BytesIO(raw_code_zip)),
-                        )
+                    code_secrets = executor.map(
+                        lambda code_location: self.__scan_function_code__(
+                            http_session, code_location, max_code_size
+                        ),
+                        code_locations.values(),
+                    )
+                    # The code that could not be scanned is not cached, to retry it for the next account
+                    for code_sha256, (secrets, not_scanned_reason) in zip(
+                        code_locations, code_secrets
+                    ):
+                        if not_scanned_reason:
+                            code_not_scanned[code_sha256] = not_scanned_reason
+                        else:
+                            lambda_code_secrets[code_sha256] = secrets
 
+            for function_code in functions_code:
+                if function_code:
+                    function, code_location, code_sha256 = function_code
+                    function.code = LambdaCode(
+                        location=code_location,
+                        sha256=code_sha256,
+                        secrets=lambda_code_secrets.get(code_sha256, {}),
+                        not_scanned_reason=code_not_scanned.get(code_sha256),
+                    )
         except Exception as error:
             logger.error(
-                f"{regional_client.region} --"
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def __get_function_code__(self, function):
+        try:
+            regional_client = self.regional_clients[function.region]
+            function_information = regional_client.get_function(
+                FunctionName=function.name
+            )
+            if "Location" in function_information["Code"]:
+                return (
+                    function,
+                    function_information["Code"]["Location"],
+                    function_information["Configuration"]["CodeSha256"],
+                )
+        except Exception as error:
+            logger.error(
+                f"{function.region} --"
                 f" {error.__class__.__name__}[{error.__traceback__.tb_lineno}]:"
                 f" {error}"
             )
+        return None
+
+    def __scan_function_code__(self, http_session, code_location, max_code_size):
+        try:
+            with tempfile.SpooledTemporaryFile(
+                max_size=code_spool_max_memory_size
+            ) as code_file:
+                response = http_session.get(
+                    code_location, stream=True, timeout=code_download_timeout
+                )
+                try:
+                    response.raise_for_status()
+                    code_size = int(response.headers.get("Content-Length", 0))
+                    # Stop as soon as the code is known to be bigger than the limit
+                    if code_size <= max_code_size:
+                        for chunk in response.iter_content(
+                            chunk_size=code_download_chunk_size
+                        ):
+                            code_file.write(chunk)
+                            code_size = code_file.tell()
+                            if code_size > max_code_size:
+                                break
+                    if code_size > max_code_size:
+                        logger.warning(
+                            f"Lambda code bigger than {max_code_size} bytes not scanned: {code_location.split('?')[0]}"
+                        )
+                        return (
+                            None,
+                            f"the code is larger than {max_code_size // (1024 * 1024)} MB",
+                        )
+                finally:
+                    response.close()
+
+                # Scan the files one at a time so only one is in memory
+                secrets = {}
+                with zipfile.ZipFile(code_file) as code_zip:
+                    for code_file_info in code_zip.infolist():
+                        # Only the top-level files are scanned, not the directories like vendored dependencies
+                        if code_file_info.is_dir() or "/" in code_file_info.filename:
+                            continue
+                        try:
+                            code_file_data = code_zip.read(code_file_info).decode(
+                                "utf-8"
+                            )
+                        except UnicodeDecodeError:
+                            # Binary files are not scanned
+                            continue
+                        code_file_secrets = scan_secrets_in_memory(code_file_data)
+                        if code_file_secrets:
+                            secrets[code_file_info.filename] = code_file_secrets
+                return (secrets, None)
+        except Exception as error:
+            # The error message can contain the presigned code location, with its temporary credentials
+            logger.error(
+                f"Lambda code not scanned: {code_location.split('?')[0]} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]"
+            )
+            return (
+                None,
+                f"the code could not be downloaded or unzipped ({error.__class__.__name__})",
+            )
 
     def __get_policy__(self, regional_client):
         logger.info("Lambda - Getting Policy...")
@@ -164,6 +284,16 @@ class Lambda:
             for function in self.functions.values():
                 try:
                     regional_client = self.regional_clients[function.region]
+                    stored_tags = get_stored_tags(
+                        self.tag_store, function.arn, function.region
+                    )
+                    if stored_tags is not None:
+                        function.tags = (
+                            [{tag["Key"]: tag["Value"] for tag in stored_tags}]
+                            if stored_tags
+                            else []
+                        )
+                        continue
                     response = regional_client.list_tags(Resource=function.arn)["Tags"]
                     function.tags = [response]
                 except ClientError as e:
@@ -178,7 +308,11 @@ class Lambda:
 
 class LambdaCode(BaseModel):
     location: str
-    code_zip: Any
+    sha256: str
+    # Secrets found in the code, by file name
+    secrets: dict = {}
+    # Why the code was not scanned for secrets, if it was not
+    not_scanned_reason: Optional[str] = None
 
 
 class AuthType(Enum):
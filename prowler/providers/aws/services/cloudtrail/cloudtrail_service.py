@@ -10,6 +10,10 @@ from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import (
     generate_regional_clients,
     get_default_region,
+    threading_call_per_resource,
+)
+from prowler.providers.aws.lib.resource_api_tagging.resource_api_tagging import (
+    get_stored_tags,
 )
 
 
@@ -22,13 +26,23 @@ class Cloudtrail:
         self.audited_partition = audit_info.audited_partition
         self.audited_account_arn = audit_info.audited_account_arn
         self.audit_resources = audit_info.audit_resources
+        self.tag_store = audit_info.tag_store
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.region = get_default_region(self.service, audit_info)
         self.trails = []
         self.__threading_call__(self.__get_trails__)
-        self.__get_trail_status__()
-        self.__get_insight_selectors__()
-        self.__get_event_selectors__()
+        # Skip the placeholders of the regions without trails
+        trails = [trail for trail in self.trails if trail.name]
+        logger.info("Cloudtrail - Getting trails details...")
+        threading_call_per_resource(
+            self.__get_trail_status__, trails, self.regional_clients
+        )
+        threading_call_per_resource(
+            self.__get_insight_selectors__, trails, self.regional_clients
+        )
+        threading_call_per_resource(
+            self.__get_event_selectors__, trails, self.regional_clients
+        )
         self.__list_tags_for_resource__()
 
     def __get_session__(self):
@@ -90,96 +104,62 @@ class Cloudtrail:
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __get_trail_status__(self):
-        logger.info("Cloudtrail - Getting trail status")
+    def __get_trail_status__(self, regional_client, trail):
         try:
-            for trail in self.trails:
-                for region, client in self.regional_clients.items():
-                    if trail.region == region and trail.name:
-                        status = client.get_trail_status(Name=trail.arn)
-                        trail.is_logging = status["IsLogging"]
-                        if "LatestCloudWatchLogsDeliveryTime" in status:
-                            trail.latest_cloudwatch_delivery_time = status[
-                                "LatestCloudWatchLogsDeliveryTime"
-                            ]
+            status = regional_client.get_trail_status(Name=trail.arn)
+            trail.is_logging = status["IsLogging"]
+            if "LatestCloudWatchLogsDeliveryTime" in status:
+                trail.latest_cloudwatch_delivery_time = status[
+                    "LatestCloudWatchLogsDeliveryTime"
+                ]
 
         except Exception as error:
             logger.error(
-                f"{client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __get_event_selectors__(self):
-        logger.info("Cloudtrail - Getting event selector")
+    def __get_event_selectors__(self, regional_client, trail):
         try:
-            for trail in self.trails:
-                for region, client in self.regional_clients.items():
-                    if trail.region == region and trail.name:
-                        data_events = client.get_event_selectors(TrailName=trail.arn)
-                        # check if key exists and array associated to that key is not empty
-                        if (
-                            "EventSelectors" in data_events
-                            and data_events["EventSelectors"]
-                        ):
-                            for event in data_events["EventSelectors"]:
-                                event_selector = Event_Selector(
-                                    is_advanced=False, event_selector=event
-                                )
-                                trail.data_events.append(event_selector)
-                        # check if key exists and array associated to that key is not empty
-                        elif (
-                            "AdvancedEventSelectors" in data_events
-                            and data_events["AdvancedEventSelectors"]
-                        ):
-                            for event in data_events["AdvancedEventSelectors"]:
-                                event_selector = Event_Selector(
-                                    is_advanced=True, event_selector=event
-                                )
-                                trail.data_events.append(event_selector)
+            data_events = regional_client.get_event_selectors(TrailName=trail.arn)
+            # check if key exists and array associated to that key is not empty
+            if "EventSelectors" in data_events and data_events["EventSelectors"]:
+                for event in data_events["EventSelectors"]:
+                    event_selector = Event_Selector(
+                        is_advanced=False, event_selector=event
+                    )
+                    trail.data_events.append(event_selector)
+            # check if key exists and array associated to that key is not empty
+            elif (
+                "AdvancedEventSelectors" in data_events
+                and data_events["AdvancedEventSelectors"]
+            ):
+                for event in data_events["AdvancedEventSelectors"]:
+                    event_selector = Event_Selector(
+                        is_advanced=True, event_selector=event
+                    )
+                    trail.data_events.append(event_selector)
 
         except Exception as error:
             logger.error(
-                f"{client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __get_insight_selectors__(self):
-        logger.info("Cloudtrail - Getting trail insihgt selectors...")
-
+    def __get_insight_selectors__(self, regional_client, trail):
+        trail.has_insight_selectors = None
         try:
-            for trail in self.trails:
-                for region, client in self.regional_clients.items():
-                    if trail.region == region and trail.name:
-                        insight_selectors = None
-                        trail.has_insight_selectors = None
-                        try:
-                            client_insight_selectors = client.get_insight_selectors(
-                                TrailName=trail.arn
-                            )
-                            insight_selectors = client_insight_selectors.get(
-                                "InsightSelectors"
-                            )
-                        except ClientError as error:
-                            if (
-                                error.response["Error"]["Code"]
-                                == "InsightNotEnabledException"
-                            ):
-                                continue
-                            else:
-                                logger.error(
-                                    f"{client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                )
-                        except Exception as error:
-                            logger.error(
-                                f"{client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                            )
-                            continue
-                        if insight_selectors:
-                            trail.has_insight_selectors = insight_selectors[0].get(
-                                "InsightType"
-                            )
-
+            insight_selectors = regional_client.get_insight_selectors(
+                TrailName=trail.arn
+            ).get("InsightSelectors")
+            if insight_selectors:
+                trail.has_insight_selectors = insight_selectors[0].get("InsightType")
+        except ClientError as error:
+            if error.response["Error"]["Code"] != "InsightNotEnabledException":
+                logger.error(
+                    f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
-                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
     def __list_tags_for_resource__(self):
@@ -192,6 +172,12 @@ class Cloudtrail:
                     and self.audited_account in trail.arn
                 ):
                     regional_client = self.regional_clients[trail.region]
+                    stored_tags = get_stored_tags(
+                        self.tag_store, trail.arn, trail.region
+                    )
+                    if stored_tags is not None:
+                        trail.tags = stored_tags
+                        continue
                     response = regional_client.list_tags(ResourceIdList=[trail.arn])[
                         "ResourceTagList"
                     ][0]
@@ -1,13 +1,26 @@
 import threading
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from json import dumps, loads
+from queue import Queue
 from typing import Optional
 
 from botocore.exceptions import ClientError
 from pydantic import BaseModel
 
+from prowler.config.config import get_config_var
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.lib.utils.utils import detect_secrets_scan, detect_secrets_scan_batch
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    threading_call_per_resource,
+)
+from prowler.providers.aws.lib.resource_api_tagging.resource_api_tagging import (
+    get_stored_tags,
+)
+
+# Log groups whose sampled events are kept in memory to be scanned together in one batch
+log_groups_scan_batch_size = 50
 
 
 ################## CloudWatch
@@ -17,6 +30,7 @@ class CloudWatch:
         self.session = audit_info.audit_session
         self.audited_account = audit_info.audited_account
         self.audit_resources = audit_info.audit_resources
+        self.tag_store = audit_info.tag_store
         self.audited_partition = audit_info.audited_partition
         self.region = list(
             generate_regional_clients(
@@ -74,9 +88,13 @@ class CloudWatch:
         try:
             for metric_alarm in self.metric_alarms:
                 regional_client = self.regional_clients[metric_alarm.region]
-                response = regional_client.list_tags_for_resource(
-                    ResourceARN=metric_alarm.arn
-                )["Tags"]
+                response = get_stored_tags(
+                    self.tag_store, metric_alarm.arn, metric_alarm.region
+                )
+                if response is None:
+                    response = regional_client.list_tags_for_resource(
+                        ResourceARN=metric_alarm.arn
+                    )["Tags"]
                 metric_alarm.tags = response
         except Exception as error:
             logger.error(
@@ -92,6 +110,7 @@ class Logs:
         self.audited_account = audit_info.audited_account
         self.audited_partition = audit_info.audited_partition
         self.audit_resources = audit_info.audit_resources
+        self.tag_store = audit_info.tag_store
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.metric_filters = []
         self.log_groups = []
@@ -101,10 +120,25 @@ class Logs:
             "cloudwatch_log_group_no_secrets_in_logs"
             in audit_info.audit_metadata.expected_checks
         ):
-            self.events_per_log_group_threshold = (
-                1000  # The threshold for number of events to return per log group.
+            # The thresholds for the events to sample from each log group
+            self.events_per_log_group_threshold = get_config_var(
+                "max_log_events_per_log_group"
+            )
+            self.events_size_per_log_group_threshold = (
+                get_config_var("max_log_events_size_in_kb_per_log_group") * 1024
             )
-            self.__threading_call__(self.__get_log_events__)
+            # Log groups without events since this time are not sampled
+            self.events_start_time = None
+            log_events_sampling_days = get_config_var("log_events_sampling_days")
+            if log_events_sampling_days:
+                self.events_start_time = int(
+                    (
+                        datetime.now(timezone.utc)
+                        - timedelta(days=log_events_sampling_days)
+                    ).timestamp()
+                    * 1000
+                )
+            self.__sample_log_events__()
         self.__list_tags_for_resource__()
 
     def __get_session__(self):
@@ -178,37 +212,113 @@ class Logs:
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __get_log_events__(self, regional_client):
-        regional_log_groups = [
-            log_group
-            for log_group in self.log_groups
-            if log_group.region == regional_client.region
-        ]
-        total_log_groups = len(regional_log_groups)
+    def __sample_log_events__(self):
+        """The events are fetched concurrently in each region and scanned for secrets in batches by this thread only"""
+        log_events_queue = Queue(maxsize=log_groups_scan_batch_size)
         logger.info(
-            f"CloudWatch Logs - Retrieving log events for {total_log_groups} log groups in {regional_client.region}..."
+            f"CloudWatch Logs - Retrieving log events for {len(self.log_groups)} log groups..."
         )
+
+        def get_log_events():
+            try:
+                threading_call_per_resource(
+                    lambda regional_client, log_group: self.__get_log_events__(
+                        regional_client, log_group, log_events_queue
+                    ),
+                    self.log_groups,
+                    self.regional_clients,
+                )
+            finally:
+                # Tells the scanner that no more log events will come
+                log_events_queue.put(None)
+
+        threading.Thread(target=get_log_events).start()
+        log_groups_batch = []
+        while True:
+            log_group_events = log_events_queue.get()
+            if log_group_events:
+                log_groups_batch.append(log_group_events)
+            if log_groups_batch and (
+                log_group_events is None
+                or len(log_groups_batch) == log_groups_scan_batch_size
+            ):
+                try:
+                    scan_log_groups_streams(*zip(*log_groups_batch))
+                except Exception as error:
+                    for log_group, _ in log_groups_batch:
+                        log_group.events_sampling = "ERROR"
+                    logger.error(
+                        f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    )
+                log_groups_batch = []
+            if log_group_events is None:
+                break
+
+    def __get_log_events__(self, regional_client, log_group, log_events_queue):
+        log_group_streams = self.__get_log_group_events__(regional_client, log_group)
+        # Waits while the scanner is behind, so the memory stays bounded
+        if log_group_streams:
+            log_events_queue.put((log_group, log_group_streams))
+
+    def __get_log_group_events__(self, regional_client, log_group):
         try:
-            for count, log_group in enumerate(regional_log_groups, start=1):
-                events = regional_client.filter_log_events(
+            filter_log_events_args = {"logGroupName": log_group.name}
+            if self.events_start_time:
+                # The most recently written log stream goes first
+                log_streams = regional_client.describe_log_streams(
                     logGroupName=log_group.name,
-                    limit=self.events_per_log_group_threshold,
-                )["events"]
-                for event in events:
-                    if event["logStreamName"] not in log_group.log_streams:
-                        log_group.log_streams[event["logStreamName"]] = []
-                    log_group.log_streams[event["logStreamName"]].append(event)
-                if count % 10 == 0:
-                    logger.info(
-                        f"CloudWatch Logs - Retrieved log events for {count}/{total_log_groups} log groups in {regional_client.region}..."
-                    )
+                    orderBy="LastEventTime",
+                    descending=True,
+                    limit=1,
+                )["logStreams"]
+                if (
+                    not log_streams
+                    or log_streams[0].get("lastEventTimestamp", 0)
+                    < self.events_start_time
+                ):
+                    log_group.events_sampling = "SKIPPED"
+                    return {}
+                filter_log_events_args["startTime"] = self.events_start_time
+            log_streams = {}
+            events_count = 0
+            events_size = 0
+            log_group.events_sampling = "COMPLETE"
+            while True:
+                response = regional_client.filter_log_events(
+                    limit=self.events_per_log_group_threshold - events_count,
+                    **filter_log_events_args,
+                )
+                page_events_count = 0
+                for event in response["events"]:
+                    if event["logStreamName"] not in log_streams:
+                        log_streams[event["logStreamName"]] = []
+                    log_streams[event["logStreamName"]].append(event)
+                    page_events_count += 1
+                    events_count += 1
+                    events_size += len(event["message"])
+                    if events_size >= self.events_size_per_log_group_threshold:
+                        break
+                if (
+                    page_events_count == len(response["events"])
+                    and "nextToken" not in response
+                ):
+                    break
+                # There are more events than the sampling caps allow
+                if (
+                    events_count >= self.events_per_log_group_threshold
+                    or events_size >= self.events_size_per_log_group_threshold
+                ):
+                    log_group.events_sampling = "TRUNCATED"
+                    break
+                filter_log_events_args["nextToken"] = response["nextToken"]
+            log_group.sampled_events = events_count
+            return log_streams
         except Exception as error:
+            log_group.events_sampling = "ERROR"
             logger.error(
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
-        logger.info(
-            f"CloudWatch Logs - Finished retrieving log events in {regional_client.region}..."
-        )
+            return {}
 
     def __list_tags_for_resource__(self):
         logger.info("CloudWatch Logs - List Tags...")
@@ -216,6 +326,21 @@ class Logs:
             for log_group in self.log_groups:
                 try:
                     regional_client = self.regional_clients[log_group.region]
+                    # The tagging API log group ARNs do not end with the ":*" wildcard
+                    stored_tags = get_stored_tags(
+                        self.tag_store,
+                        log_group.arn[:-2]
+                        if log_group.arn.endswith(":*")
+                        else log_group.arn,
+                        log_group.region,
+                    )
+                    if stored_tags is not None:
+                        log_group.tags = (
+                            [{tag["Key"]: tag["Value"] for tag in stored_tags}]
+                            if stored_tags
+                            else []
+                        )
+                        continue
                     response = regional_client.list_tags_log_group(
                         logGroupName=log_group.name
                     )["tags"]
@@ -256,9 +381,14 @@ class LogGroup(BaseModel):
     never_expire: bool
     kms_id: Optional[str]
     region: str
-    log_streams: dict[
-        str, list[str]
-    ] = {}  # Log stream name as the key, array of events as the value
+    secrets: dict[
+        str, dict
+    ] = (
+        {}
+    )  # Log stream name as the key, secrets found by CloudWatch timestamp as the value
+    # COMPLETE, TRUNCATED when the sampling caps were reached, SKIPPED without recent events or ERROR, None if the events were not sampled
+    events_sampling: Optional[str] = None
+    sampled_events: int = 0
     tags: Optional[list] = []
 
 
@@ -277,3 +407,79 @@ def convert_to_cloudwatch_timestamp_format(epoch_time):
         + ":"
         + datetime_parts[2][-2:]
     )  # Removes the microseconds, and places a ':' character in the timezone offset
+
+
+def scan_log_groups_streams(log_groups: list, log_groups_streams: list):
+    """scan_log_groups_streams scans the sampled log streams of the log groups in one batch and keeps only the secrets found in each log group"""
+    log_streams = []
+    for log_group, log_group_streams in zip(log_groups, log_groups_streams):
+        for log_stream_name, log_stream_events in log_group_streams.items():
+            log_streams.append((log_group, log_stream_name, log_stream_events))
+    log_streams_secrets_output = detect_secrets_scan_batch(
+        [
+            get_log_stream_data(log_stream_events)
+            for _, _, log_stream_events in log_streams
+        ]
+    )
+    for (log_group, log_stream_name, log_stream_events), secrets_output in zip(
+        log_streams, log_streams_secrets_output
+    ):
+        log_stream_secrets = get_log_stream_secrets(log_stream_events, secrets_output)
+        if log_stream_secrets:
+            log_group.secrets[log_stream_name] = log_stream_secrets
+
+
+def get_log_stream_secrets(
+    log_stream_events: list, log_stream_secrets_output: Optional[list]
+) -> dict:
+    log_stream_secrets = {}
+    for secret in log_stream_secrets_output or []:
+        flagged_event = log_stream_events[secret["line_number"] - 1]
+        cloudwatch_timestamp = convert_to_cloudwatch_timestamp_format(
+            flagged_event["timestamp"]
+        )
+        if cloudwatch_timestamp not in log_stream_secrets:
+            log_stream_secrets[cloudwatch_timestamp] = SecretsDict()
+
+        log_event_data = get_log_event_data(flagged_event)
+        if len(log_event_data.split("\n")) > 1:
+            # Can get more informative output if there is more than 1 line.
+            # Will rescan just this event to get the type of secret and the line number
+            event_detect_secrets_output = detect_secrets_scan(log_event_data)
+            for event_secret in event_detect_secrets_output or []:
+                log_stream_secrets[cloudwatch_timestamp].add_secret(
+                    event_secret["line_number"], event_secret["type"]
+                )
+        else:
+            log_stream_secrets[cloudwatch_timestamp].add_secret(1, secret["type"])
+    return log_stream_secrets
+
+
+def get_log_stream_data(log_stream_events: list) -> str:
+    return "\n".join([dumps(event["message"]) for event in log_stream_events])
+
+
+def get_log_event_data(log_event: dict) -> str:
+    try:
+        return dumps(loads(log_event["message"]), indent=2)
+    except Exception:
+        return dumps(log_event["message"], indent=2)
+
+
+class SecretsDict(dict):
+    # Using this dict to remove duplicates of the secret type showing up multiple times on the same line
+    # Also includes the to_string method
+    def add_secret(self, line_number, secret_type):
+        if line_number not in self.keys():
+            self[line_number] = [secret_type]
+        else:
+            if secret_type not in self[line_number]:
+                self[line_number] += [secret_type]
+
+    def to_string(self):
+        return ", ".join(
+            [
+                f"{', '.join(secret_types)} on line {line_number}"
+                for line_number, secret_types in sorted(self.items())
+            ]
+        )
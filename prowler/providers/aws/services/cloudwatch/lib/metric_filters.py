@@ -0,0 +1,83 @@
+import re
+from functools import lru_cache
+
+# Last monitoring index built, the checks of the same account share it
+monitoring_index_cache = {}
+
+
+@lru_cache(maxsize=None)
+def compile_metric_filter_pattern(metric_filter_pattern: str) -> re.Pattern:
+    """Compile each CIS metric filter pattern only once, they are the same for every account"""
+    return re.compile(metric_filter_pattern)
+
+
+class MonitoringIndex:
+    """
+    CloudTrail log groups -> metric filters -> alarms, built once for all the
+    CloudWatch monitoring checks of an account
+    """
+
+    def __init__(self, trails: list, metric_filters: list, metric_alarms: list):
+        trails_log_groups = {
+            trail.log_group_arn.split(":")[6] for trail in trails if trail.log_group_arn
+        }
+        # Only the metric filters of the CloudTrail trails log groups, in order
+        self.metric_filters = [
+            metric_filter
+            for metric_filter in metric_filters
+            if metric_filter.log_group in trails_log_groups
+        ]
+        self.metric_alarms = {}
+        for metric_alarm in metric_alarms:
+            self.metric_alarms.setdefault(metric_alarm.metric, []).append(metric_alarm)
+        self.matching_metric_filters = {}
+
+    def get_metric_filters(self, metric_filter_pattern: str) -> list:
+        """Return the trails metric filters whose pattern matches the CIS pattern"""
+        if metric_filter_pattern not in self.matching_metric_filters:
+            compiled_pattern = compile_metric_filter_pattern(metric_filter_pattern)
+            self.matching_metric_filters[metric_filter_pattern] = [
+                metric_filter
+                for metric_filter in self.metric_filters
+                if compiled_pattern.search(metric_filter.pattern)
+            ]
+        return self.matching_metric_filters[metric_filter_pattern]
+
+    def has_alarms(self, metric: str) -> bool:
+        return metric in self.metric_alarms
+
+
+def get_monitoring_index(
+    trails: list, metric_filters: list, metric_alarms: list
+) -> MonitoringIndex:
+    # Keep only the last index built, the previous account is not needed anymore
+    resources = (trails, metric_filters, metric_alarms)
+    cached_resources = monitoring_index_cache.get("resources", ())
+    if len(cached_resources) != len(resources) or any(
+        cached is not current for cached, current in zip(cached_resources, resources)
+    ):
+        monitoring_index_cache["resources"] = resources
+        monitoring_index_cache["index"] = MonitoringIndex(*resources)
+    return monitoring_index_cache["index"]
+
+
+def check_cloudwatch_log_metric_filter(
+    metric_filter_pattern: str,
+    trails: list,
+    metric_filters: list,
+    metric_alarms: list,
+    report,
+):
+    monitoring_index = get_monitoring_index(trails, metric_filters, metric_alarms)
+    # 1. Get the metric filters of the CloudTrail trails log groups matching the pattern
+    for metric_filter in monitoring_index.get_metric_filters(metric_filter_pattern):
+        report.resource_id = metric_filter.log_group
+        report.resource_arn = metric_filter.arn
+        report.region = metric_filter.region
+        report.status = "FAIL"
+        report.status_extended = f"CloudWatch log group {metric_filter.log_group} found with metric filter {metric_filter.name} but no alarms associated."
+        # 2. Check if there is an alarm for the metric
+        if monitoring_index.has_alarms(metric_filter.metric):
+            report.status = "PASS"
+            report.status_extended = f"CloudWatch log group {metric_filter.log_group} found with metric filter {metric_filter.name} and alarms set."
+    return report
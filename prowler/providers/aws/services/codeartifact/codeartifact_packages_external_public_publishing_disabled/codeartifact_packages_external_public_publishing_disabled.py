@@ -33,6 +33,9 @@ class codeartifact_packages_external_public_publishing_disabled(Check):
                         report.status = "PASS"
                         report.status_extended = f"Internal package {package.name} is not vulnerable to dependency confusion in repository {repository.arn}"
 
+                if repository.packages_truncated:
+                    report.status_extended += f" (not all the packages of repository {repository.arn} were evaluated since they are capped by codeartifact_max_packages_per_repository)"
+
                 findings.append(report)
 
         return findings
@@ -5,9 +5,13 @@ from typing import Optional
 from botocore.exceptions import ClientError
 from pydantic import BaseModel
 
+from prowler.config.config import get_config_var
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    call_per_regional_resource,
+    generate_regional_clients,
+)
 
 
 ################## CodeArtifact
@@ -20,6 +24,13 @@ class CodeArtifact:
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         # repositories is a dictionary containing all the codeartifact service information
         self.repositories = {}
+        # Repositories mirroring public upstreams can hold a huge number of packages
+        self.only_internal_packages = get_config_var(
+            "codeartifact_only_internal_packages"
+        )
+        self.max_packages_per_repository = get_config_var(
+            "codeartifact_max_packages_per_repository"
+        )
         self.__threading_call__(self.__list_repositories__)
         self.__threading_call__(self.__list_packages__)
         self.__list_tags_for_resource__()
@@ -70,85 +81,40 @@ class CodeArtifact:
 
     def __list_packages__(self, regional_client):
         logger.info("CodeArtifact - Listing Packages and retrieving information...")
-        for repository in self.repositories:
+        for repository in self.repositories.values():
             try:
-                if self.repositories[repository].region == regional_client.region:
+                if repository.region == regional_client.region:
                     list_packages_paginator = regional_client.get_paginator(
                         "list_packages"
                     )
                     list_packages_parameters = {
-                        "domain": self.repositories[repository].domain_name,
-                        "domainOwner": self.repositories[repository].domain_owner,
-                        "repository": repository,
+                        "domain": repository.domain_name,
+                        "domainOwner": repository.domain_owner,
+                        "repository": repository.name,
                     }
                     packages = []
                     for page in list_packages_paginator.paginate(
                         **list_packages_parameters
                     ):
                         for package in page["packages"]:
-                            # Package information
-                            package_format = package["format"]
-                            package_namespace = package.get("namespace")
-                            package_name = package["package"]
-                            package_origin_configuration_restrictions_publish = package[
-                                "originConfiguration"
-                            ]["restrictions"]["publish"]
-                            package_origin_configuration_restrictions_upstream = (
-                                package["originConfiguration"]["restrictions"][
-                                    "upstream"
-                                ]
-                            )
-                            # Get Latest Package Version
-                            latest_version_information = (
-                                regional_client.list_package_versions(
-                                    domain=self.repositories[repository].domain_name,
-                                    domainOwner=self.repositories[
-                                        repository
-                                    ].domain_owner,
-                                    repository=repository,
-                                    format=package_format,
-                                    package=package_name,
-                                    sortBy="PUBLISHED_TIME",
-                                )
-                            )
-                            latest_version = ""
-                            latest_origin_type = "UNKNOWN"
-                            latest_status = "Published"
-                            if latest_version_information.get("versions"):
-                                latest_version = latest_version_information["versions"][
-                                    0
-                                ].get("version")
-                                latest_origin_type = (
-                                    latest_version_information["versions"][0]
-                                    .get("origin", {})
-                                    .get("originType", "UNKNOWN")
-                                )
-                                latest_status = latest_version_information["versions"][
-                                    0
-                                ].get("status", "Published")
-
-                            packages.append(
-                                Package(
-                                    name=package_name,
-                                    namespace=package_namespace,
-                                    format=package_format,
-                                    origin_configuration=OriginConfiguration(
-                                        restrictions=Restrictions(
-                                            publish=package_origin_configuration_restrictions_publish,
-                                            upstream=package_origin_configuration_restrictions_upstream,
-                                        )
-                                    ),
-                                    latest_version=LatestPackageVersion(
-                                        version=latest_version,
-                                        status=latest_status,
-                                        origin=OriginInformation(
-                                            origin_type=latest_origin_type
-                                        ),
-                                    ),
-                                )
-                            )
-                    # Save all the packages information
-                    self.repositories[repository].packages = packages
+                            if (
+                                self.max_packages_per_repository
+                                and len(packages) >= self.max_packages_per_repository
+                            ):
+                                repository.packages_truncated = True
+                                break
+                            packages.append(package)
+                        if repository.packages_truncated:
+                            break
+
+                    # Get the latest version of the packages concurrently and save their information
+                    call_per_regional_resource(
+                        lambda regional_client, package: self.__get_package__(
+                            regional_client, repository, package
+                        ),
+                        regional_client,
+                        packages,
+                    )
 
             except ClientError as error:
                 if error.response["Error"]["Code"] == "ResourceNotFoundException":
@@ -166,6 +132,79 @@ class CodeArtifact:
                     f" {error}"
                 )
 
+    def __get_package__(self, regional_client, repository, package):
+        try:
+            # Package information
+            package_format = package["format"]
+            package_namespace = package.get("namespace")
+            package_name = package["package"]
+            package_origin_configuration_restrictions_publish = package[
+                "originConfiguration"
+            ]["restrictions"]["publish"]
+            package_origin_configuration_restrictions_upstream = package[
+                "originConfiguration"
+            ]["restrictions"]["upstream"]
+            # Get Latest Package Version
+            list_package_versions_parameters = {
+                "domain": repository.domain_name,
+                "domainOwner": repository.domain_owner,
+                "repository": repository.name,
+                "format": package_format,
+                "package": package_name,
+                "sortBy": "PUBLISHED_TIME",
+                "maxResults": 1,
+            }
+            if package_namespace:
+                list_package_versions_parameters["namespace"] = package_namespace
+            latest_version_information = regional_client.list_package_versions(
+                **list_package_versions_parameters
+            )
+            latest_version = ""
+            latest_origin_type = "UNKNOWN"
+            latest_status = "Published"
+            if latest_version_information.get("versions"):
+                latest_version = latest_version_information["versions"][0].get(
+                    "version"
+                )
+                latest_origin_type = (
+                    latest_version_information["versions"][0]
+                    .get("origin", {})
+                    .get("originType", "UNKNOWN")
+                )
+                latest_status = latest_version_information["versions"][0].get(
+                    "status", "Published"
+                )
+
+            # Packages ingested from external connections are not evaluated if only the internal ones are requested
+            if self.only_internal_packages and latest_origin_type == "EXTERNAL":
+                return
+
+            repository.packages.append(
+                Package(
+                    name=package_name,
+                    namespace=package_namespace,
+                    format=package_format,
+                    origin_configuration=OriginConfiguration(
+                        restrictions=Restrictions(
+                            publish=package_origin_configuration_restrictions_publish,
+                            upstream=package_origin_configuration_restrictions_upstream,
+                        )
+                    ),
+                    latest_version=LatestPackageVersion(
+                        version=latest_version,
+                        status=latest_status,
+                        origin=OriginInformation(origin_type=latest_origin_type),
+                    ),
+                )
+            )
+
+        except Exception as error:
+            logger.error(
+                f"{regional_client.region} --"
+                f" {error.__class__.__name__}[{error.__traceback__.tb_lineno}]:"
+                f" {error}"
+            )
+
     def __list_tags_for_resource__(self):
         logger.info("CodeArtifact - List Tags...")
         try:
@@ -258,5 +297,7 @@ class Repository(BaseModel):
     domain_name: str
     domain_owner: str
     packages: list[Package] = []
+    # True if only the first packages of the repository were evaluated
+    packages_truncated: bool = False
     region: str
     tags: Optional[list] = []
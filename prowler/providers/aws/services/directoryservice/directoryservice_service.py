@@ -9,6 +9,9 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.resource_api_tagging.resource_api_tagging import (
+    get_stored_tags,
+)
 
 
 ################## DirectoryService
@@ -17,7 +20,9 @@ class DirectoryService:
         self.service = "ds"
         self.session = audit_info.audit_session
         self.audited_account = audit_info.audited_account
+        self.audited_partition = audit_info.audited_partition
         self.audit_resources = audit_info.audit_resources
+        self.tag_store = audit_info.tag_store
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.directories = {}
         self.__threading_call__(self.__describe_directories__)
@@ -70,6 +75,7 @@ class DirectoryService:
                         self.directories[directory_id] = Directory(
                             name=directory_name,
                             id=directory_id,
+                            arn=f"arn:{self.audited_partition}:ds:{regional_client.region}:{self.audited_account}:directory/{directory_id}",
                             type=directory_type,
                             region=regional_client.region,
                             radius_settings=RadiusSettings(
@@ -224,9 +230,13 @@ class DirectoryService:
         try:
             for directory in self.directories.values():
                 regional_client = self.regional_clients[directory.region]
-                response = regional_client.list_tags_for_resource(
-                    ResourceId=directory.id
-                )["Tags"]
+                response = get_stored_tags(
+                    self.tag_store, directory.arn, directory.region
+                )
+                if response is None:
+                    response = regional_client.list_tags_for_resource(
+                        ResourceId=directory.id
+                    )["Tags"]
                 directory.tags = response
         except Exception as error:
             logger.error(
@@ -311,6 +321,7 @@ class DirectoryType(Enum):
 class Directory(BaseModel):
     name: str
     id: str
+    arn: str
     type: DirectoryType
     log_subscriptions: list[LogSubscriptions] = []
     event_topics: list[EventTopics] = []
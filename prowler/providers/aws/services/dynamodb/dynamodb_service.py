@@ -6,7 +6,13 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    threading_call_per_resource,
+)
+from prowler.providers.aws.lib.resource_api_tagging.resource_api_tagging import (
+    get_stored_tags,
+)
 
 
 ################## DynamoDB
@@ -16,12 +22,18 @@ class DynamoDB:
         self.session = audit_info.audit_session
         self.audited_account = audit_info.audited_account
         self.audit_resources = audit_info.audit_resources
+        self.tag_store = audit_info.tag_store
         self.audited_partition = audit_info.audited_partition
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.tables = []
         self.__threading_call__(self.__list_tables__)
-        self.__describe_table__()
-        self.__describe_continuous_backups__()
+        logger.info("DynamoDB - Getting Tables details...")
+        threading_call_per_resource(
+            self.__describe_table__, self.tables, self.regional_clients
+        )
+        threading_call_per_resource(
+            self.__describe_continuous_backups__, self.tables, self.regional_clients
+        )
         self.__list_tags_for_resource__()
 
     def __get_session__(self):
@@ -60,43 +72,35 @@ class DynamoDB:
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __describe_table__(self):
-        logger.info("DynamoDB - Describing Table...")
+    def __describe_table__(self, regional_client, table):
         try:
-            for table in self.tables:
-                regional_client = self.regional_clients[table.region]
-                properties = regional_client.describe_table(TableName=table.name)[
-                    "Table"
-                ]
-                if "SSEDescription" in properties:
-                    if "SSEType" in properties["SSEDescription"]:
-                        table.encryption_type = properties["SSEDescription"]["SSEType"]
-                if table.encryption_type == "KMS":
-                    table.kms_arn = properties["SSEDescription"]["KMSMasterKeyArn"]
+            properties = regional_client.describe_table(TableName=table.name)["Table"]
+            if "SSEDescription" in properties:
+                if "SSEType" in properties["SSEDescription"]:
+                    table.encryption_type = properties["SSEDescription"]["SSEType"]
+            if table.encryption_type == "KMS":
+                table.kms_arn = properties["SSEDescription"]["KMSMasterKeyArn"]
         except Exception as error:
             logger.error(
-                f"{error.__class__.__name__}:{error.__traceback__.tb_lineno} -- {error}"
+                f"{regional_client.region} -- {error.__class__.__name__}:{error.__traceback__.tb_lineno} -- {error}"
             )
 
-    def __describe_continuous_backups__(self):
-        logger.info("DynamoDB - Describing Continuous Backups...")
+    def __describe_continuous_backups__(self, regional_client, table):
         try:
-            for table in self.tables:
-                regional_client = self.regional_clients[table.region]
-                properties = regional_client.describe_continuous_backups(
-                    TableName=table.name
-                )["ContinuousBackupsDescription"]
-                if "PointInTimeRecoveryDescription" in properties:
-                    if (
-                        properties["PointInTimeRecoveryDescription"][
-                            "PointInTimeRecoveryStatus"
-                        ]
-                        == "ENABLED"
-                    ):
-                        table.pitr = True
+            properties = regional_client.describe_continuous_backups(
+                TableName=table.name
+            )["ContinuousBackupsDescription"]
+            if "PointInTimeRecoveryDescription" in properties:
+                if (
+                    properties["PointInTimeRecoveryDescription"][
+                        "PointInTimeRecoveryStatus"
+                    ]
+                    == "ENABLED"
+                ):
+                    table.pitr = True
         except Exception as error:
             logger.error(
-                f"{error.__class__.__name__}:{error.__traceback__.tb_lineno} -- {error}"
+                f"{regional_client.region} -- {error.__class__.__name__}:{error.__traceback__.tb_lineno} -- {error}"
             )
 
     def __list_tags_for_resource__(self):
@@ -105,9 +109,11 @@ class DynamoDB:
             for table in self.tables:
                 try:
                     regional_client = self.regional_clients[table.region]
-                    response = regional_client.list_tags_of_resource(
-                        ResourceArn=table.arn
-                    )["Tags"]
+                    response = get_stored_tags(self.tag_store, table.arn, table.region)
+                    if response is None:
+                        response = regional_client.list_tags_of_resource(
+                            ResourceArn=table.arn
+                        )["Tags"]
                     table.tags = response
                 except ClientError as error:
                     if error.response["Error"]["Code"] == "ResourceNotFoundException":
@@ -132,6 +138,7 @@ class DAX:
         self.session = audit_info.audit_session
         self.audited_account = audit_info.audited_account
         self.audit_resources = audit_info.audit_resources
+        self.tag_store = audit_info.tag_store
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.clusters = []
         self.__threading_call__(self.__describe_clusters__)
@@ -184,8 +191,12 @@ class DAX:
         for cluster in self.clusters:
             try:
                 regional_client = self.regional_clients[cluster.region]
-                # In the DAX service to call list_tags we need to pass the cluster ARN as the resource name
-                response = regional_client.list_tags(ResourceName=cluster.arn)["Tags"]
+                response = get_stored_tags(self.tag_store, cluster.arn, cluster.region)
+                if response is None:
+                    # In the DAX service to call list_tags we need to pass the cluster ARN as the resource name
+                    response = regional_client.list_tags(ResourceName=cluster.arn)[
+                        "Tags"
+                    ]
                 cluster.tags = response
 
             except ClientError as error:
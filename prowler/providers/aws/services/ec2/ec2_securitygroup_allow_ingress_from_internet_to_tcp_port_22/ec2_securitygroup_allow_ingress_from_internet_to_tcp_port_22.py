@@ -1,6 +1,5 @@
 from prowler.lib.check.models import Check, Check_Report_AWS
 from prowler.providers.aws.services.ec2.ec2_client import ec2_client
-from prowler.providers.aws.services.ec2.lib.security_groups import check_security_group
 
 
 class ec2_securitygroup_allow_ingress_from_internet_to_tcp_port_22(Check):
@@ -16,14 +15,11 @@ class ec2_securitygroup_allow_ingress_from_internet_to_tcp_port_22(Check):
             report.resource_arn = security_group.arn
             report.resource_tags = security_group.tags
             if not security_group.public_ports:
-                # Loop through every security group's ingress rule and check it
-                for ingress_rule in security_group.ingress_rules:
-                    if check_security_group(
-                        ingress_rule, "tcp", check_ports, any_address=True
-                    ):
-                        report.status = "FAIL"
-                        report.status_extended = f"Security group {security_group.name} ({security_group.id}) has SSH port 22 open to the Internet."
-                        break
+                if security_group.ingress_index.is_public(
+                    "tcp", check_ports, any_address=True
+                ):
+                    report.status = "FAIL"
+                    report.status_extended = f"Security group {security_group.name} ({security_group.id}) has SSH port 22 open to the Internet."
             findings.append(report)
 
         return findings
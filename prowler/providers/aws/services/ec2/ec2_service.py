@@ -1,14 +1,22 @@
 import threading
+import zlib
+from base64 import b64decode
 from datetime import datetime
 from typing import Optional
 
 from botocore.client import ClientError
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
-from prowler.providers.aws.services.ec2.lib.security_groups import check_security_group
+from prowler.lib.utils.utils import detect_secrets_scan
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    threading_call_per_resource,
+)
+from prowler.providers.aws.services.ec2.lib.security_groups import (
+    SecurityGroupRulesIndex,
+)
 
 
 ################## EC2
@@ -24,17 +32,27 @@ class EC2:
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.instances = []
         self.__threading_call__(self.__describe_instances__)
-        self.__get_instance_user_data__()
+        # The user data is only retrieved to be scanned by its check, just the verdict is kept
+        if "ec2_instance_secrets_user_data" in self.audited_checks:
+            logger.info("EC2 - Getting instance user data...")
+            threading_call_per_resource(
+                self.__get_instance_user_data__,
+                [
+                    instance
+                    for instance in self.instances
+                    if instance.state != "terminated"
+                ],
+                self.regional_clients,
+            )
         self.security_groups = []
         self.__threading_call__(self.__describe_security_groups__)
         self.network_acls = []
         self.__threading_call__(self.__describe_network_acls__)
         self.snapshots = []
         self.__threading_call__(self.__describe_snapshots__)
-        self.__get_snapshot_public__()
+        self.__threading_call__(self.__get_snapshot_public__)
         self.network_interfaces = []
-        self.__threading_call__(self.__describe_public_network_interfaces__)
-        self.__threading_call__(self.__describe_sg_network_interfaces__)
+        self.__threading_call__(self.__describe_network_interfaces__)
         self.images = []
         self.__threading_call__(self.__describe_images__)
         self.volumes = []
@@ -127,30 +145,27 @@ class EC2:
                     if not self.audit_resources or (
                         is_resource_filtered(arn, self.audit_resources)
                     ):
+                        security_group = SecurityGroup(
+                            name=sg["GroupName"],
+                            arn=arn,
+                            region=regional_client.region,
+                            id=sg["GroupId"],
+                            ingress_rules=sg["IpPermissions"],
+                            egress_rules=sg["IpPermissionsEgress"],
+                            public_ports=False,
+                            tags=sg.get("Tags"),
+                        )
                         # check if sg has public access to all ports to reduce noise
-                        all_public_ports = False
-                        for ingress_rule in sg["IpPermissions"]:
-                            if (
-                                check_security_group(
-                                    ingress_rule, "-1", any_address=True
+                        if (
+                            "ec2_securitygroup_allow_ingress_from_internet_to_any_port"
+                            in self.audited_checks
+                        ):
+                            security_group.public_ports = (
+                                security_group.ingress_index.is_public(
+                                    "-1", any_address=True
                                 )
-                                and "ec2_securitygroup_allow_ingress_from_internet_to_any_port"
-                                in self.audited_checks
-                            ):
-                                all_public_ports = True
-                                break
-                        self.security_groups.append(
-                            SecurityGroup(
-                                name=sg["GroupName"],
-                                arn=arn,
-                                region=regional_client.region,
-                                id=sg["GroupId"],
-                                ingress_rules=sg["IpPermissions"],
-                                egress_rules=sg["IpPermissionsEgress"],
-                                public_ports=all_public_ports,
-                                tags=sg.get("Tags"),
                             )
-                        )
+                        self.security_groups.append(security_group)
         except Exception as error:
             logger.error(
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -211,42 +226,44 @@ class EC2:
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __get_snapshot_public__(self):
-        logger.info("EC2 - Gettting snapshots encryption...")
-        for snapshot in self.snapshots:
-            try:
-                regional_client = self.regional_clients[snapshot.region]
-                snapshot_public = regional_client.describe_snapshot_attribute(
-                    Attribute="createVolumePermission", SnapshotId=snapshot.id
-                )
-                for permission in snapshot_public["CreateVolumePermissions"]:
-                    if "Group" in permission:
-                        if permission["Group"] == "all":
-                            snapshot.public = True
-
-            except ClientError as error:
-                if error.response["Error"]["Code"] == "InvalidSnapshot.NotFound":
-                    logger.warning(
-                        f"{snapshot.region} --"
-                        f" {error.__class__.__name__}[{error.__traceback__.tb_lineno}]:"
-                        f" {error}"
-                    )
-                    continue
-
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+    def __get_snapshot_public__(self, regional_client):
+        logger.info("EC2 - Getting public snapshots...")
+        try:
+            # The snapshots restorable by all the users are the public ones, so they are listed at once instead of describing the attributes of each snapshot
+            public_snapshots = set()
+            describe_snapshots_paginator = regional_client.get_paginator(
+                "describe_snapshots"
+            )
+            for page in describe_snapshots_paginator.paginate(
+                OwnerIds=["self"], RestorableByUserIds=["all"]
+            ):
+                for snapshot in page["Snapshots"]:
+                    public_snapshots.add(snapshot["SnapshotId"])
+            for snapshot in self.snapshots:
+                if (
+                    snapshot.region == regional_client.region
+                    and snapshot.id in public_snapshots
+                ):
+                    snapshot.public = True
+        except Exception as error:
+            logger.error(
+                f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
-    def __describe_public_network_interfaces__(self, regional_client):
+    def __describe_network_interfaces__(self, regional_client):
         logger.info("EC2 - Describing Network Interfaces...")
         try:
-            # Get Network Interfaces with Public IPs
+            # A single listing per region gets both the Network Interfaces with Public IPs and the ones of each Security Group
+            sg_network_interfaces = {}
             describe_network_interfaces_paginator = regional_client.get_paginator(
                 "describe_network_interfaces"
             )
             for page in describe_network_interfaces_paginator.paginate():
                 for interface in page["NetworkInterfaces"]:
+                    for group in interface.get("Groups", []):
+                        sg_network_interfaces.setdefault(group["GroupId"], []).append(
+                            interface["NetworkInterfaceId"]
+                        )
                     if interface.get("Association"):
                         self.network_interfaces.append(
                             NetworkInterface(
@@ -259,77 +276,67 @@ class EC2:
                                 tags=interface.get("TagSet"),
                             )
                         )
+            for sg in self.security_groups:
+                if sg.region == regional_client.region:
+                    sg.network_interfaces = sg_network_interfaces.get(sg.id, [])
 
         except Exception as error:
             logger.error(
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __describe_sg_network_interfaces__(self, regional_client):
-        logger.info("EC2 - Describing Network Interfaces...")
+    def __get_instance_user_data__(self, regional_client, instance):
         try:
-            # Get Network Interfaces for Security Groups
-            for sg in self.security_groups:
-                regional_client = self.regional_clients[sg.region]
-                describe_network_interfaces_paginator = regional_client.get_paginator(
-                    "describe_network_interfaces"
+            user_data = regional_client.describe_instance_attribute(
+                Attribute="userData", InstanceId=instance.id
+            )["UserData"]
+            if user_data.get("Value"):
+                try:
+                    decoded_user_data = decode_user_data(user_data["Value"])
+                except (ValueError, zlib.error) as error:
+                    # Binary or non UTF-8 User Data, including UnicodeDecodeError
+                    instance.user_data_not_scanned_reason = (
+                        "it could not be decoded as text."
+                    )
+                    logger.warning(
+                        f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    )
+                    return
+                instance.user_data_secrets = bool(
+                    detect_secrets_scan(decoded_user_data)
+                )
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "InvalidInstanceID.NotFound":
+                instance.user_data_not_scanned_reason = "the instance was not found."
+                logger.warning(
+                    f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                instance.user_data_not_scanned_reason = "it could not be retrieved."
+                logger.error(
+                    f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
-                for page in describe_network_interfaces_paginator.paginate(
-                    Filters=[
-                        {
-                            "Name": "group-id",
-                            "Values": [
-                                sg.id,
-                            ],
-                        },
-                    ],
-                ):
-                    for interface in page["NetworkInterfaces"]:
-                        sg.network_interfaces.append(interface["NetworkInterfaceId"])
         except Exception as error:
+            instance.user_data_not_scanned_reason = "it could not be scanned."
             logger.error(
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __get_instance_user_data__(self):
-        logger.info("EC2 - Gettting instance user data...")
-        for instance in self.instances:
-            try:
-                regional_client = self.regional_clients[instance.region]
-                user_data = regional_client.describe_instance_attribute(
-                    Attribute="userData", InstanceId=instance.id
-                )["UserData"]
-                if "Value" in user_data:
-                    instance.user_data = user_data["Value"]
-
-            except ClientError as error:
-                if error.response["Error"]["Code"] == "InvalidInstanceID.NotFound":
-                    logger.warning(
-                        f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-                    continue
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
-
     def __describe_images__(self, regional_client):
         logger.info("EC2 - Describing Images...")
         try:
-            public = False
+            # The public launch permission of the images is already returned by describe_images, no attribute call is needed
             for image in regional_client.describe_images(Owners=["self"])["Images"]:
                 arn = f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:image/{image['ImageId']}"
                 if not self.audit_resources or (
                     is_resource_filtered(arn, self.audit_resources)
                 ):
-                    if image["Public"]:
-                        public = True
                     self.images.append(
                         Image(
                             id=image["ImageId"],
                             arn=arn,
                             name=image["Name"],
-                            public=public,
+                            public=image.get("Public", False),
                             region=regional_client.region,
                             tags=image.get("Tags"),
                         )
@@ -414,6 +421,13 @@ class EC2:
             )
 
 
+def decode_user_data(user_data: str) -> str:
+    user_data = b64decode(user_data)
+    if user_data[0:2] == b"\x1f\x8b":  # GZIP magic number
+        return zlib.decompress(user_data, zlib.MAX_WBITS | 32).decode("utf-8")
+    return user_data.decode("utf-8")
+
+
 class Instance(BaseModel):
     id: str
     arn: str
@@ -426,7 +440,10 @@ class Instance(BaseModel):
     private_ip: Optional[str]
     public_dns: Optional[str]
     public_ip: Optional[str]
-    user_data: Optional[str]
+    # Whether the user data has secrets, None if there is no user data or it was not scanned
+    user_data_secrets: Optional[bool]
+    # Why the user data was not scanned for secrets, if it was not
+    user_data_not_scanned_reason: Optional[str] = None
     http_tokens: Optional[str]
     http_endpoint: Optional[str]
     instance_profile: Optional[dict]
@@ -460,6 +477,14 @@ class SecurityGroup(BaseModel):
     ingress_rules: list[dict]
     egress_rules: list[dict]
     tags: Optional[list] = []
+    _ingress_index: Optional[SecurityGroupRulesIndex] = PrivateAttr(default=None)
+
+    @property
+    def ingress_index(self) -> SecurityGroupRulesIndex:
+        # Normalize the ingress rules only once, they are shared by all the security group checks
+        if self._ingress_index is None:
+            self._ingress_index = SecurityGroupRulesIndex(self.ingress_rules)
+        return self._ingress_index
 
 
 class NetworkACL(BaseModel):
@@ -1,5 +1,14 @@
 import ipaddress
-from typing import Any
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
+
+# Source classes of the normalized security group rules
+any_address_source = "any_address"
+public_source = "public"
+private_source = "private"
+security_group_source = "security_group"
+
+all_ports = (0, 65535)
 
 
 ################## Security Groups
@@ -35,70 +44,91 @@ def check_security_group(
 
     @param any_address: If True, only 0.0.0.0/0 will be public and do not search for public addresses. (Default: False)
     """
-    # Check for all traffic ingress rules regardless of the protocol
-    if ingress_rule["IpProtocol"] == "-1":
-        for ip_ingress_rule in ingress_rule["IpRanges"]:
-            if _is_cidr_public(ip_ingress_rule["CidrIp"], any_address):
-                return True
-        for ip_ingress_rule in ingress_rule["Ipv6Ranges"]:
-            if _is_cidr_public(ip_ingress_rule["CidrIpv6"], any_address):
-                return True
+    return SecurityGroupRulesIndex([ingress_rule]).is_public(
+        protocol, ports, any_address
+    )
 
-    # Check for specific ports in ingress rules
-    if "FromPort" in ingress_rule:
-        # If there is a port range
-        if ingress_rule["FromPort"] != ingress_rule["ToPort"]:
-            # Calculate port range, adding 1
-            diff = (ingress_rule["ToPort"] - ingress_rule["FromPort"]) + 1
-            ingress_port_range = []
-            for x in range(diff):
-                ingress_port_range.append(int(ingress_rule["FromPort"]) + x)
-        # If FromPort and ToPort are the same
-        else:
-            ingress_port_range = []
-            ingress_port_range.append(int(ingress_rule["FromPort"]))
-
-        # Test Security Group
-        # IPv4
-        for ip_ingress_rule in ingress_rule["IpRanges"]:
-            if _is_cidr_public(ip_ingress_rule["CidrIp"], any_address):
-                # If there are input ports to check
-                if ports:
-                    for port in ports:
-                        if (
-                            port in ingress_port_range
-                            and ingress_rule["IpProtocol"] == protocol
-                        ):
-                            return True
-                # If no input ports check if all ports are open
-                if len(set(ingress_port_range)) == 65536:
-                    return True
 
-        # IPv6
-        for ip_ingress_rule in ingress_rule["Ipv6Ranges"]:
-            if _is_cidr_public(ip_ingress_rule["CidrIpv6"]):
-                # If there are input ports to check
-                if ports:
+class SecurityGroupRule(NamedTuple):
+    protocol: str
+    # None if the rule has no port range, e.g. for all the protocols
+    port_range: Optional[tuple]
+    source: str
+
+
+class SecurityGroupRulesIndex:
+    """
+    Security group ingress rules normalized once, as (protocol, port interval, source class),
+    so the checks can test them without parsing the CIDRs or expanding the port ranges again
+    """
+
+    def __init__(self, ingress_rules: list):
+        self.rules = []
+        for ingress_rule in ingress_rules:
+            protocol = str(ingress_rule["IpProtocol"])
+            port_range = None
+            if "FromPort" in ingress_rule:
+                port_range = (
+                    int(ingress_rule["FromPort"]),
+                    int(ingress_rule["ToPort"]),
+                )
+            for ip_range in ingress_rule.get("IpRanges", []):
+                self.rules.append(
+                    SecurityGroupRule(
+                        protocol, port_range, _get_cidr_source(ip_range["CidrIp"])
+                    )
+                )
+            for ip_range in ingress_rule.get("Ipv6Ranges", []):
+                self.rules.append(
+                    SecurityGroupRule(
+                        protocol, port_range, _get_cidr_source(ip_range["CidrIpv6"])
+                    )
+                )
+            for _ in ingress_rule.get("UserIdGroupPairs", []):
+                self.rules.append(
+                    SecurityGroupRule(protocol, port_range, security_group_source)
+                )
+
+    def is_public(
+        self, protocol: str, ports: list = [], any_address: bool = False
+    ) -> bool:
+        """
+        Check if any of the ingress rules has public access to the ports using the protocol,
+        or to every port or protocol
+
+        @param procotol: Protocol to check.
+
+        @param ports: List of ports to check. (Default: [])
+
+        @param any_address: If True, only 0.0.0.0/0 will be public and do not search for public addresses. (Default: False)
+        """
+        public_sources = {any_address_source}
+        if not any_address:
+            public_sources.add(public_source)
+        for rule in self.rules:
+            if rule.source not in public_sources:
+                continue
+            # All traffic regardless of the protocol
+            if rule.protocol == "-1":
+                return True
+            if rule.port_range:
+                from_port, to_port = rule.port_range
+                if rule.protocol == protocol:
                     for port in ports:
-                        if (
-                            port in ingress_port_range
-                            and ingress_rule["IpProtocol"] == protocol
-                        ):
+                        if from_port <= port <= to_port:
                             return True
-                # If no input ports check if all ports are open
-                if len(set(ingress_port_range)) == 65536:
+                # Every port is open
+                if rule.port_range == all_ports:
                     return True
-
-    return False
+        return False
 
 
-def _is_cidr_public(cidr: str, any_address: bool = False) -> bool:
+@lru_cache(maxsize=None)
+def _get_cidr_source(cidr: str) -> str:
     """
-    Check if an input CIDR is public
+    Classify an input CIDR as any address, public or private
 
     @param cidr: CIDR 10.22.33.44/8
-
-    @param any_address: If True, only 0.0.0.0/0 will be public and do not search for public addresses. (Default: False)
     """
     public_IPv4 = "0.0.0.0/0"
     public_IPv6 = "::/0"
@@ -106,6 +136,21 @@ def _is_cidr_public(cidr: str, any_address: bool = False) -> bool:
     # PR https://github.com/python/cpython/pull/97733
     # Issue https://github.com/python/cpython/issues/82836
     if cidr in (public_IPv4, public_IPv6):
-        return True
-    if not any_address:
-        return ipaddress.ip_network(cidr).is_global
+        return any_address_source
+    if ipaddress.ip_network(cidr).is_global:
+        return public_source
+    return private_source
+
+
+def _is_cidr_public(cidr: str, any_address: bool = False) -> bool:
+    """
+    Check if an input CIDR is public
+
+    @param cidr: CIDR 10.22.33.44/8
+
+    @param any_address: If True, only 0.0.0.0/0 will be public and do not search for public addresses. (Default: False)
+    """
+    cidr_source = _get_cidr_source(cidr)
+    return cidr_source == any_address_source or (
+        not any_address and cidr_source == public_source
+    )
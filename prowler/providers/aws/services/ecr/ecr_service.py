@@ -1,14 +1,19 @@
 import threading
 from datetime import datetime
+from heapq import heappush, heappushpop
 from json import loads
 from typing import Optional
 
 from botocore.exceptions import ClientError
 from pydantic import BaseModel
 
+from prowler.config.config import get_config_var
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    threading_call_per_resource,
+)
 
 
 ################################ ECR
@@ -20,9 +25,25 @@ class ECR:
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.registry_id = audit_info.audited_account
         self.registries = {}
+        # Only the latest images of each repository are kept unless the full image inventory is enabled
+        self.full_image_inventory = get_config_var("ecr_full_image_inventory")
+        self.latest_images_per_repository = (
+            get_config_var("ecr_latest_images_per_repository") or 1
+        )
         self.__threading_call__(self.__describe_registries_and_repositories__)
         self.__threading_call__(self.__describe_repository_policies__)
-        self.__threading_call__(self.__get_image_details__)
+        logger.info("ECR - Getting images details...")
+        threading_call_per_resource(
+            self.__get_repository_images__,
+            # There is nothing to do if the repository is not scanning pushed images
+            [
+                repository
+                for registry in self.registries.values()
+                for repository in registry.repositories
+                if repository.scan_on_push
+            ],
+            self.regional_clients,
+        )
         self.__threading_call__(self.__get_repository_lifecycle_policy__)
         self.__threading_call__(self.__get_registry_scanning_configuration__)
         self.__threading_call__(self.__list_tags_for_resource__)
@@ -125,68 +146,34 @@ class ECR:
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __get_image_details__(self, regional_client):
-        logger.info("ECR - Getting images details...")
+    def __get_repository_images__(self, regional_client, repository):
         try:
-            if regional_client.region in self.registries:
-                for repository in self.registries[regional_client.region].repositories:
-                    # There is nothing to do if the repository is not scanning pushed images
-                    if repository.scan_on_push:
-                        client = self.regional_clients[repository.region]
-                        describe_images_paginator = client.get_paginator(
-                            "describe_images"
-                        )
-                        for page in describe_images_paginator.paginate(
-                            registryId=self.registries[regional_client.region].id,
-                            repositoryName=repository.name,
-                            PaginationConfig={"PageSize": 1000},
+            # Heap of (pushed at, index, image) with the latest images, the index breaks the ties between images pushed at the same time
+            images = []
+            images_count = 0
+            describe_images_paginator = regional_client.get_paginator("describe_images")
+            for page in describe_images_paginator.paginate(
+                registryId=self.registry_id,
+                repositoryName=repository.name,
+                PaginationConfig={"PageSize": 1000},
+            ):
+                for image in page["imageDetails"]:
+                    # The following condition is required since sometimes
+                    # the AWS ECR API returns None using the iterator
+                    if image is not None:
+                        image_entry = (image["imagePushedAt"], images_count, image)
+                        images_count += 1
+                        if (
+                            self.full_image_inventory
+                            or len(images) < self.latest_images_per_repository
                         ):
-                            for image in page["imageDetails"]:
-                                # The following condition is required since sometimes
-                                # the AWS ECR API returns None using the iterator
-                                if image is not None:
-                                    severity_counts = None
-                                    last_scan_status = None
-                                    if "imageScanStatus" in image:
-                                        last_scan_status = image["imageScanStatus"][
-                                            "status"
-                                        ]
-
-                                    if "imageScanFindingsSummary" in image:
-                                        severity_counts = FindingSeverityCounts(
-                                            critical=0, high=0, medium=0
-                                        )
-                                        finding_severity_counts = image[
-                                            "imageScanFindingsSummary"
-                                        ]["findingSeverityCounts"]
-                                        if "CRITICAL" in finding_severity_counts:
-                                            severity_counts.critical = (
-                                                finding_severity_counts["CRITICAL"]
-                                            )
-                                        if "HIGH" in finding_severity_counts:
-                                            severity_counts.high = (
-                                                finding_severity_counts["HIGH"]
-                                            )
-                                        if "MEDIUM" in finding_severity_counts:
-                                            severity_counts.medium = (
-                                                finding_severity_counts["MEDIUM"]
-                                            )
-                                    latest_tag = "None"
-                                    if image.get("imageTags"):
-                                        latest_tag = image["imageTags"][0]
-                                    repository.images_details.append(
-                                        ImageDetails(
-                                            latest_tag=latest_tag,
-                                            image_pushed_at=image["imagePushedAt"],
-                                            latest_digest=image["imageDigest"],
-                                            scan_findings_status=last_scan_status,
-                                            scan_findings_severity_count=severity_counts,
-                                        )
-                                    )
-                                    # Sort the repository images by date pushed
-                                    repository.images_details.sort(
-                                        key=lambda image: image.image_pushed_at
-                                    )
+                            heappush(images, image_entry)
+                        else:
+                            heappushpop(images, image_entry)
+
+            # Sort the repository images by date pushed
+            for _, _, image in sorted(images, key=lambda entry: entry[:2]):
+                repository.images_details.append(get_image_details(image))
 
         except Exception as error:
             logger.error(
@@ -258,6 +245,36 @@ class ECR:
             )
 
 
+def get_image_details(image: dict) -> "ImageDetails":
+    """get_image_details returns the ImageDetails of an image returned by describe_images"""
+    severity_counts = None
+    last_scan_status = None
+    if "imageScanStatus" in image:
+        last_scan_status = image["imageScanStatus"]["status"]
+
+    if "imageScanFindingsSummary" in image:
+        severity_counts = FindingSeverityCounts(critical=0, high=0, medium=0)
+        finding_severity_counts = image["imageScanFindingsSummary"][
+            "findingSeverityCounts"
+        ]
+        if "CRITICAL" in finding_severity_counts:
+            severity_counts.critical = finding_severity_counts["CRITICAL"]
+        if "HIGH" in finding_severity_counts:
+            severity_counts.high = finding_severity_counts["HIGH"]
+        if "MEDIUM" in finding_severity_counts:
+            severity_counts.medium = finding_severity_counts["MEDIUM"]
+    latest_tag = "None"
+    if image.get("imageTags"):
+        latest_tag = image["imageTags"][0]
+    return ImageDetails(
+        latest_tag=latest_tag,
+        image_pushed_at=image["imagePushedAt"],
+        latest_digest=image["imageDigest"],
+        scan_findings_status=last_scan_status,
+        scan_findings_severity_count=severity_counts,
+    )
+
+
 class FindingSeverityCounts(BaseModel):
     critical: int
     high: int
@@ -1,18 +1,28 @@
-import os
-import tempfile
 from json import dumps
 
-from detect_secrets import SecretsCollection
-from detect_secrets.settings import default_settings
-
 from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.utils.utils import detect_secrets_scan_batch
 from prowler.providers.aws.services.ecs.ecs_client import ecs_client
 
 
 class ecs_task_definitions_no_environment_secrets(Check):
     def execute(self):
         findings = []
+        env_data_list = []
         for task_definition in ecs_client.task_definitions:
+            env_data = ""
+            if task_definition.environment_variables:
+                dump_env_vars = {}
+                for env_var in task_definition.environment_variables:
+                    dump_env_vars.update({env_var.name: env_var.value})
+                env_data = dumps(dump_env_vars, indent=2)
+            env_data_list.append(env_data)
+        # Scan the variables of all the revisions at once, most of them are repeated
+        detect_secrets_outputs = detect_secrets_scan_batch(env_data_list)
+
+        for task_definition, detect_secrets_output in zip(
+            ecs_client.task_definitions, detect_secrets_outputs
+        ):
             report = Check_Report_AWS(self.metadata())
             report.region = task_definition.region
             report.resource_id = f"{task_definition.name}:{task_definition.revision}"
@@ -20,33 +30,15 @@ class ecs_task_definitions_no_environment_secrets(Check):
             report.resource_tags = task_definition.tags
             report.status = "PASS"
             report.status_extended = f"No secrets found in variables of ECS task definition {task_definition.name} with revision {task_definition.revision}"
-            if task_definition.environment_variables:
-                dump_env_vars = {}
-                for env_var in task_definition.environment_variables:
-                    dump_env_vars.update({env_var.name: env_var.value})
-
-                temp_env_data_file = tempfile.NamedTemporaryFile(delete=False)
-
-                env_data = dumps(dump_env_vars, indent=2)
-                temp_env_data_file.write(bytes(env_data, encoding="raw_unicode_escape"))
-                temp_env_data_file.close()
-
-                secrets = SecretsCollection()
-                with default_settings():
-                    secrets.scan_file(temp_env_data_file.name)
-
-                detect_secrets_output = secrets.json()
-                if detect_secrets_output:
-                    secrets_string = ", ".join(
-                        [
-                            f"{secret['type']} on line {secret['line_number']}"
-                            for secret in detect_secrets_output[temp_env_data_file.name]
-                        ]
-                    )
-                    report.status = "FAIL"
-                    report.status_extended = f"Potential secret found in variables of ECS task definition {task_definition.name} with revision {task_definition.revision} -> {secrets_string}"
-
-                os.remove(temp_env_data_file.name)
+            if task_definition.environment_variables and detect_secrets_output:
+                secrets_string = ", ".join(
+                    [
+                        f"{secret['type']} on line {secret['line_number']}"
+                        for secret in detect_secrets_output
+                    ]
+                )
+                report.status = "FAIL"
+                report.status_extended = f"Potential secret found in variables of ECS task definition {task_definition.name} with revision {task_definition.revision} -> {secrets_string}"
 
             findings.append(report)
 
@@ -6,6 +6,9 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.resource_api_tagging.resource_api_tagging import (
+    get_stored_tags,
+)
 
 
 ################### ELB
@@ -16,6 +19,7 @@ class ELB:
         self.audited_partition = audit_info.audited_partition
         self.audited_account = audit_info.audited_account
         self.audit_resources = audit_info.audit_resources
+        self.tag_store = audit_info.tag_store
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.loadbalancers = []
         self.__threading_call__(self.__describe_load_balancers__)
@@ -91,6 +95,10 @@ class ELB:
         try:
             for lb in self.loadbalancers:
                 regional_client = self.regional_clients[lb.region]
+                stored_tags = get_stored_tags(self.tag_store, lb.arn, lb.region)
+                if stored_tags is not None:
+                    lb.tags = stored_tags
+                    continue
                 response = regional_client.describe_tags(LoadBalancerNames=[lb.name])[
                     "TagDescriptions"
                 ][0]
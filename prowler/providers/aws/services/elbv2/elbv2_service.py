@@ -7,6 +7,9 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.resource_api_tagging.resource_api_tagging import (
+    get_stored_tags,
+)
 
 
 ################### ELBv2
@@ -15,6 +18,7 @@ class ELBv2:
         self.service = "elbv2"
         self.session = audit_info.audit_session
         self.audit_resources = audit_info.audit_resources
+        self.tag_store = audit_info.tag_store
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.loadbalancersv2 = []
         self.__threading_call__(self.__describe_load_balancers__)
@@ -154,6 +158,10 @@ class ELBv2:
         try:
             for lb in self.loadbalancersv2:
                 regional_client = self.regional_clients[lb.region]
+                stored_tags = get_stored_tags(self.tag_store, lb.arn, lb.region)
+                if stored_tags is not None:
+                    lb.tags = stored_tags
+                    continue
                 response = regional_client.describe_tags(ResourceArns=[lb.arn])[
                     "TagDescriptions"
                 ][0]
@@ -2,7 +2,6 @@ from copy import deepcopy
 
 from prowler.lib.check.models import Check, Check_Report_AWS
 from prowler.providers.aws.services.ec2.ec2_client import ec2_client
-from prowler.providers.aws.services.ec2.lib.security_groups import check_security_group
 from prowler.providers.aws.services.emr.emr_client import emr_client
 from prowler.providers.aws.services.emr.emr_service import ClusterStatus
 
@@ -42,10 +41,8 @@ class emr_cluster_publicly_accesible(Check):
                         master_sg_public = False
                         for sg in ec2_client.security_groups:
                             if sg.id == master_sg:
-                                for ingress_rule in sg.ingress_rules:
-                                    if check_security_group(ingress_rule, -1):
-                                        master_sg_public = True
-                                        break
+                                if sg.ingress_index.is_public("-1"):
+                                    master_sg_public = True
                             if master_sg_public:
                                 master_public_security_groups.append(sg.id)
                                 break
@@ -64,10 +61,8 @@ class emr_cluster_publicly_accesible(Check):
                         slave_sg_public = False
                         for sg in ec2_client.security_groups:
                             if sg.id == slave_sg:
-                                for ingress_rule in sg.ingress_rules:
-                                    if check_security_group(ingress_rule, -1):
-                                        slave_sg_public = True
-                                        break
+                                if sg.ingress_index.is_public("-1"):
+                                    slave_sg_public = True
                             if slave_sg_public:
                                 slave_public_security_groups.append(sg.id)
                                 break
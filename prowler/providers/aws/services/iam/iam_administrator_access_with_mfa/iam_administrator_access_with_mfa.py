@@ -27,13 +27,12 @@ class iam_administrator_access_with_mfa(Check):
                         # users in group are Administrators
                         if group.users:
                             for group_user in group.users:
-                                for user in iam_client.credential_report:
-                                    if (
-                                        user["user"] == group_user.name
-                                        and user["mfa_active"] == "false"
-                                    ):
-                                        report.status = "FAIL"
-                                        report.status_extended = f"Group {group.name} provides administrator access to User {group_user.name} with MFA disabled."
+                                user = iam_client.credential_report_by_arn.get(
+                                    group_user.arn
+                                )
+                                if user and user["mfa_active"] == "false":
+                                    report.status = "FAIL"
+                                    report.status_extended = f"Group {group.name} provides administrator access to User {group_user.name} with MFA disabled."
                         else:
                             report.status_extended = f"Group {group.name} provides administrative access but does not have users."
 
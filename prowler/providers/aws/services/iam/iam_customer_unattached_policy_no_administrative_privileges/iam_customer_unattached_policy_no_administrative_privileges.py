@@ -15,28 +15,9 @@ class iam_customer_unattached_policy_no_administrative_privileges(Check):
                 report.resource_tags = policy.tags
                 report.status = "PASS"
                 report.status_extended = f"{policy.type} policy {policy.name} is unattached and does not allow '*:*' administrative privileges"
-                if policy.document:
-                    # Check the statements, if one includes *:* stop iterating over the rest
-                    if type(policy.document["Statement"]) != list:
-                        policy_statements = [policy.document["Statement"]]
-                    else:
-                        policy_statements = policy.document["Statement"]
-                    for statement in policy_statements:
-                        # Check policies with "Effect": "Allow" with "Action": "*" over "Resource": "*".
-                        if (
-                            statement["Effect"] == "Allow"
-                            and "Action" in statement
-                            and (
-                                statement["Action"] == "*"
-                                or statement["Action"] == ["*"]
-                            )
-                            and (
-                                statement["Resource"] == "*"
-                                or statement["Resource"] == ["*"]
-                            )
-                        ):
-                            report.status = "FAIL"
-                            report.status_extended = f"{policy.type} policy {policy.name} is unattached and allows '*:*' administrative privileges"
-                            break
+                # Check if the policy allows "Action": "*" over "Resource": "*"
+                if policy.compiled.allows("*", resource="*"):
+                    report.status = "FAIL"
+                    report.status_extended = f"{policy.type} policy {policy.name} is unattached and allows '*:*' administrative privileges"
                 findings.append(report)
         return findings
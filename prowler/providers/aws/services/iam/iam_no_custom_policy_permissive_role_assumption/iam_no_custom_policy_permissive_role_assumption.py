@@ -15,37 +15,13 @@ class iam_no_custom_policy_permissive_role_assumption(Check):
                 report.resource_tags = policy.tags
                 report.status = "PASS"
                 report.status_extended = f"Custom Policy {policy.name} does not allow permissive STS Role assumption"
-                if policy.document:
-                    if type(policy.document["Statement"]) != list:
-                        policy_statements = [policy.document["Statement"]]
-                    else:
-                        policy_statements = policy.document["Statement"]
-                    for statement in policy_statements:
-                        if (
-                            statement["Effect"] == "Allow"
-                            and "Action" in statement
-                            and "Resource" in statement
-                            and "*" in statement["Resource"]
-                        ):
-                            if type(statement["Action"]) == list:
-                                for action in statement["Action"]:
-                                    if (
-                                        action == "sts:AssumeRole"
-                                        or action == "sts:*"
-                                        or action == "*"
-                                    ):
-                                        report.status = "FAIL"
-                                        report.status_extended = f"Custom Policy {policy.name} allows permissive STS Role assumption"
-                                        break
-                            else:
-                                if (
-                                    statement["Action"] == "sts:AssumeRole"
-                                    or statement["Action"] == "sts:*"
-                                    or statement["Action"] == "*"
-                                ):
-                                    report.status = "FAIL"
-                                    report.status_extended = f"Custom Policy {policy.name} allows permissive STS Role assumption"
-                            break
+                # Check if the policy allows assuming any role of any account
+                if policy.compiled.allows(
+                    "sts:AssumeRole",
+                    resource=f"arn:{iam_client.partition}:iam::*:role/*",
+                ):
+                    report.status = "FAIL"
+                    report.status_extended = f"Custom Policy {policy.name} allows permissive STS Role assumption"
 
                 findings.append(report)
 
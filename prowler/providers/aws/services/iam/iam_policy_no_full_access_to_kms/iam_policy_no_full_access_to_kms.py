@@ -17,25 +17,9 @@ class iam_policy_no_full_access_to_kms(Check):
                 report.resource_tags = policy.tags
                 report.status = "PASS"
                 report.status_extended = f"Custom Policy {policy.name} does not allow '{critical_service}:*' privileges"
-                if policy.document:
-                    if type(policy.document["Statement"]) != list:
-                        policy_statements = [policy.document["Statement"]]
-                    else:
-                        policy_statements = policy.document["Statement"]
-                    # Check the statements, if one includes kms:* stop iterating over the rest
-                    for statement in policy_statements:
-                        if (
-                            statement["Effect"] == "Allow"
-                            and "Action" in statement
-                            and critical_service + ":*" in statement["Action"]
-                            and (
-                                statement["Resource"] == "*"
-                                or statement["Resource"] == ["*"]
-                            )
-                        ):
-                            report.status = "FAIL"
-                            report.status_extended = f"Custom Policy {policy.name} allows '{critical_service}:*' privileges"
-                            break
+                if policy.compiled.allows(f"{critical_service}:*", resource="*"):
+                    report.status = "FAIL"
+                    report.status_extended = f"Custom Policy {policy.name} allows '{critical_service}:*' privileges"
 
                 findings.append(report)
         return findings
@@ -0,0 +1,44 @@
+from prowler.config.config import get_config_var
+from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.providers.aws.services.iam.iam_client import iam_client
+from prowler.providers.aws.services.iam.lib.privilege_escalation import (
+    PrivilegeEscalationGraph,
+)
+
+
+class iam_principal_privilege_escalation_path(Check):
+    def execute(self) -> Check_Report_AWS:
+        findings = []
+        max_depth = get_config_var("max_privilege_escalation_path_depth")
+        graph = PrivilegeEscalationGraph(
+            iam_client.users,
+            iam_client.roles,
+            iam_client.groups,
+            iam_client.policies,
+            max_depth,
+        )
+        for principal_type, principals in [
+            ("User", iam_client.users),
+            ("Role", iam_client.roles),
+        ]:
+            for principal in principals:
+                # Administrators are covered by the administrative privileges checks
+                if principal.arn in graph.administrators:
+                    continue
+                report = Check_Report_AWS(self.metadata())
+                report.region = iam_client.region
+                report.resource_id = principal.name
+                report.resource_arn = principal.arn
+                report.resource_tags = principal.tags
+                path = graph.get_escalation_path(principal.arn)
+                if path:
+                    steps = " -> ".join(
+                        f"{technique} -> {target}" for technique, target in path
+                    )
+                    report.status = "FAIL"
+                    report.status_extended = f"{principal_type} {principal.name} can escalate to administrative privileges through {principal.arn} -> {steps}"
+                else:
+                    report.status = "PASS"
+                    report.status_extended = f"{principal_type} {principal.name} cannot escalate to administrative privileges in {max_depth} steps or less"
+                findings.append(report)
+        return findings
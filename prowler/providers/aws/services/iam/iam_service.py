@@ -1,13 +1,28 @@
 import csv
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from time import sleep
 from typing import Optional
 
 from botocore.client import ClientError
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
+from prowler.config.config import get_config_var
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import generate_regional_clients, max_workers
+from prowler.providers.aws.lib.managed_policies.managed_policies import (
+    aws_managed_policy_documents,
+    is_aws_managed_policy,
+)
+from prowler.providers.aws.lib.policy_analysis.policy_analysis import CompiledPolicy
+
+# AWS keeps the last generated credential report for 4 hours
+credential_report_max_age = timedelta(hours=4)
+# Backoff of the credential report generation, up to about 5 minutes
+credential_report_max_attempts = 12
+credential_report_max_delay = 30
 
 
 def is_service_role(role):
@@ -61,18 +76,41 @@ class IAM:
         )
         self.client = list(global_client.values())[0]
         self.region = self.client.region
+        # The credential report is generated while the rest of IAM is retrieved
+        credential_report_thread = threading.Thread(
+            target=self.__get_credential_report__
+        )
+        credential_report_thread.start()
         self.users = self.__get_users__()
-        self.roles = self.__get_roles__()
+        self.roles = []
+        self.groups = []
+        # List both Customer (attached and unattached) and AWS Managed (only attached) policies
+        self.policies = []
         self.account_summary = self.__get_account_summary__()
         self.virtual_mfa_devices = self.__list_virtual_mfa_devices__()
-        self.credential_report = self.__get_credential_report__()
-        self.groups = self.__get_groups__()
-        self.__get_group_users__()
-        self.__list_attached_group_policies__()
-        self.__list_attached_user_policies__()
-        self.__list_attached_role_policies__()
-        self.__list_inline_user_policies__()
-        self.__list_mfa_devices__()
+        # AWS managed policy documents are shared by all the accounts, and optionally by the next executions
+        aws_managed_policy_documents.load(
+            get_config_var("aws_managed_policies_cache_file")
+        )
+        # Roles, groups, policies and their relationships are retrieved in bulk, using per entity calls only if it is not allowed
+        if not self.__get_account_authorization_details__():
+            self.roles = self.__get_roles__()
+            self.groups = self.__get_groups__()
+            self.__get_group_users__()
+            self.__list_attached_group_policies__()
+            self.__list_attached_user_policies__()
+            self.__list_attached_role_policies__()
+            self.__list_inline_user_policies__()
+            self.__list_inline_role_policies__()
+            self.__list_inline_group_policies__()
+            self.policies.extend(self.__list_policies__("AWS"))
+            self.policies.extend(self.__list_policies__("Local"))
+            self.__threading_call__(self.__get_policy_version__, self.policies)
+            self.__threading_call__(self.__list_role_tags__, self.roles)
+            self.__threading_call__(self.__list_user_tags__, self.users)
+        self.__threading_call__(self.__list_mfa_devices__, self.users)
+        self.__threading_call__(self.__list_policy_tags__, self.policies)
+        aws_managed_policy_documents.save()
         self.password_policy = self.__get_password_policy__()
         support_policy_arn = (
             "arn:aws:iam::aws:policy/aws-service-role/AWSSupportServiceRolePolicy"
@@ -84,14 +122,9 @@ class IAM:
         self.entities_role_attached_to_securityaudit_policy = (
             self.__list_entities_role_for_policy__(securityaudit_policy_arn)
         )
-        # List both Customer (attached and unattached) and AWS Managed (only attached) policies
-        self.policies = []
-        self.policies.extend(self.__list_policies__("AWS"))
-        self.policies.extend(self.__list_policies__("Local"))
-        self.__list_policies_version__(self.policies)
         self.saml_providers = self.__list_saml_providers__()
         self.server_certificates = self.__list_server_certificates__()
-        self.__list_tags_for_resource__()
+        credential_report_thread.join()
 
     def __get_client__(self):
         return self.client
@@ -99,6 +132,160 @@ class IAM:
     def __get_session__(self):
         return self.session
 
+    def __threading_call__(self, call, iterator):
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(call, iterator))
+
+    def __get_account_authorization_details__(self):
+        logger.info("IAM - Get Account Authorization Details...")
+        try:
+            users_details = {}
+            roles = []
+            groups = []
+            aws_policies = []
+            custom_policies = []
+            policies_details = []
+            # Policies attached to any user, role or group
+            attached_policies_arns = set()
+            get_account_authorization_details_paginator = self.client.get_paginator(
+                "get_account_authorization_details"
+            )
+            for page in get_account_authorization_details_paginator.paginate(
+                Filter=[
+                    "User",
+                    "Role",
+                    "Group",
+                    "LocalManagedPolicy",
+                    "AWSManagedPolicy",
+                ]
+            ):
+                for user in page["UserDetailList"]:
+                    users_details[user["Arn"]] = user
+                for role in page["RoleDetailList"]:
+                    if not self.audit_resources or (
+                        is_resource_filtered(role["Arn"], self.audit_resources)
+                    ):
+                        roles.append(
+                            Role(
+                                name=role["RoleName"],
+                                arn=role["Arn"],
+                                assume_role_policy=role["AssumeRolePolicyDocument"],
+                                is_service_role=is_service_role(role),
+                                attached_policies=role.get(
+                                    "AttachedManagedPolicies", []
+                                ),
+                                inline_policies_documents=[
+                                    policy["PolicyDocument"]
+                                    for policy in role.get("RolePolicyList", [])
+                                ],
+                                tags=role.get("Tags", []),
+                            )
+                        )
+                for group in page["GroupDetailList"]:
+                    if not self.audit_resources or (
+                        is_resource_filtered(group["Arn"], self.audit_resources)
+                    ):
+                        groups.append(
+                            Group(
+                                name=group["GroupName"],
+                                arn=group["Arn"],
+                                attached_policies=group.get(
+                                    "AttachedManagedPolicies", []
+                                ),
+                                inline_policies_documents=[
+                                    policy["PolicyDocument"]
+                                    for policy in group.get("GroupPolicyList", [])
+                                ],
+                            )
+                        )
+                for entity in (
+                    page["UserDetailList"]
+                    + page["RoleDetailList"]
+                    + page["GroupDetailList"]
+                ):
+                    for attached_policy in entity.get("AttachedManagedPolicies", []):
+                        attached_policies_arns.add(attached_policy["PolicyArn"])
+                policies_details.extend(page["Policies"])
+
+            # Keep the same order than list_policies
+            for policy in sorted(
+                policies_details, key=lambda policy: policy["PolicyName"]
+            ):
+                policy_type = (
+                    "AWS" if policy["Arn"].split(":")[4] == "aws" else "Custom"
+                )
+                attached = policy["Arn"] in attached_policies_arns
+                # Look for only Attached policies when AWS Managed
+                if policy_type == "AWS" and not attached:
+                    continue
+                if not self.audit_resources or (
+                    is_resource_filtered(policy["Arn"], self.audit_resources)
+                ):
+                    policy_document = None
+                    for policy_version in policy.get("PolicyVersionList", []):
+                        if policy_version["IsDefaultVersion"]:
+                            policy_document = policy_version.get("Document")
+                    if policy_type == "AWS":
+                        aws_managed_policy_documents.add_document(
+                            policy["Arn"], policy["DefaultVersionId"], policy_document
+                        )
+                    new_policy = Policy(
+                        name=policy["PolicyName"],
+                        arn=policy["Arn"],
+                        version_id=policy["DefaultVersionId"],
+                        type=policy_type,
+                        attached=attached,
+                        document=policy_document,
+                    )
+                    if policy_type == "AWS":
+                        aws_policies.append(new_policy)
+                    else:
+                        custom_policies.append(new_policy)
+
+            # Complete the listed users with their details
+            for user in self.users:
+                if user.arn in users_details:
+                    user_details = users_details[user.arn]
+                    user.attached_policies = user_details.get(
+                        "AttachedManagedPolicies", []
+                    )
+                    user.inline_policies = [
+                        policy["PolicyName"]
+                        for policy in user_details.get("UserPolicyList", [])
+                    ]
+                    user.inline_policies_documents = [
+                        policy["PolicyDocument"]
+                        for policy in user_details.get("UserPolicyList", [])
+                    ]
+                    user.tags = user_details.get("Tags", [])
+            # Group users are taken from the groups of every user
+            users_last_password_used = {
+                user.arn: user.password_last_used for user in self.users
+            }
+            groups_by_name = {group.name: group for group in groups}
+            for user_details in users_details.values():
+                for group_name in user_details.get("GroupList", []):
+                    if group_name in groups_by_name:
+                        groups_by_name[group_name].users.append(
+                            User(
+                                name=user_details["UserName"],
+                                arn=user_details["Arn"],
+                                password_last_used=users_last_password_used.get(
+                                    user_details["Arn"]
+                                ),
+                            )
+                        )
+
+            self.roles = roles
+            self.groups = groups
+            self.policies = aws_policies + custom_policies
+            return True
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return False
+
     def __get_roles__(self):
         logger.info("IAM - List Roles...")
         try:
@@ -126,31 +313,73 @@ class IAM:
 
     def __get_credential_report__(self):
         logger.info("IAM - Get Credential Report...")
-        report_is_completed = False
-        credential_list = []
+        credential_report = []
         try:
-            while not report_is_completed:
-                report_status = self.client.generate_credential_report()
-                if report_status["State"] == "COMPLETE":
-                    report_is_completed = True
+            report = self.__get_fresh_credential_report__()
+            if not report:
+                if not self.__generate_credential_report__():
+                    logger.error(
+                        f"{self.region} -- Credential report generation did not complete after {credential_report_max_attempts} attempts"
+                    )
+                    return
+                report = self.client.get_credential_report()
             # Convert credential report to list of dictionaries
-            credential = self.client.get_credential_report()["Content"].decode("utf-8")
-            credential_lines = credential.split("\n")
+            credential_lines = report["Content"].decode("utf-8").split("\n")
             csv_reader = csv.DictReader(credential_lines, delimiter=",")
-            credential_list = list(csv_reader)
+            credential_report = list(csv_reader)
 
         except ClientError as error:
-            if error.response["Error"]["Code"] == "LimitExceededException":
+            if error.response["Error"]["Code"] == "LimitExceeded":
                 logger.warning(
                     f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
 
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
         finally:
-            return credential_list
+            self.credential_report = credential_report
+            self.credential_report_by_arn = {
+                user["arn"]: user for user in credential_report
+            }
+
+    def __get_fresh_credential_report__(self):
+        # Reuse the last generated report if it is fresh enough
+        try:
+            report = self.client.get_credential_report()
+            if (
+                datetime.now(timezone.utc) - report["GeneratedTime"]
+                <= credential_report_max_age
+            ):
+                return report
+        except ClientError as error:
+            if error.response["Error"]["Code"] not in [
+                "ReportNotPresent",
+                "ReportExpired",
+                "ReportInProgress",
+            ]:
+                raise
+        return None
+
+    def __generate_credential_report__(self) -> bool:
+        # Poll the report generation with exponential backoff, False if it does not complete
+        delay = 1
+        for _ in range(credential_report_max_attempts):
+            try:
+                report_status = self.client.generate_credential_report()
+                if report_status["State"] == "COMPLETE":
+                    return True
+            except ClientError as error:
+                if error.response["Error"]["Code"] != "LimitExceeded":
+                    raise
+            sleep(delay)
+            delay = min(delay * 2, credential_report_max_delay)
+        return False
 
     def __get_groups__(self):
         logger.info("IAM - Get Groups...")
@@ -315,24 +544,19 @@ class IAM:
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __list_mfa_devices__(self):
+    def __list_mfa_devices__(self, user):
         logger.info("IAM - List MFA Devices...")
         try:
-            for user in self.users:
-                list_mfa_devices_paginator = self.client.get_paginator(
-                    "list_mfa_devices"
-                )
-                mfa_devices = []
-                for page in list_mfa_devices_paginator.paginate(UserName=user.name):
-                    for mfa_device in page["MFADevices"]:
-                        mfa_serial_number = mfa_device["SerialNumber"]
-                        mfa_type = (
-                            mfa_device["SerialNumber"].split(":")[5].split("/")[0]
-                        )
-                        mfa_devices.append(
-                            MFADevice(serial_number=mfa_serial_number, type=mfa_type)
-                        )
-                user.mfa_devices = mfa_devices
+            list_mfa_devices_paginator = self.client.get_paginator("list_mfa_devices")
+            mfa_devices = []
+            for page in list_mfa_devices_paginator.paginate(UserName=user.name):
+                for mfa_device in page["MFADevices"]:
+                    mfa_serial_number = mfa_device["SerialNumber"]
+                    mfa_type = mfa_device["SerialNumber"].split(":")[5].split("/")[0]
+                    mfa_devices.append(
+                        MFADevice(serial_number=mfa_serial_number, type=mfa_type)
+                    )
+            user.mfa_devices = mfa_devices
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -401,6 +625,62 @@ class IAM:
                         inline_user_policies.append(policy)
 
                 user.inline_policies = inline_user_policies
+                user.inline_policies_documents = [
+                    self.client.get_user_policy(UserName=user.name, PolicyName=policy)[
+                        "PolicyDocument"
+                    ]
+                    for policy in inline_user_policies
+                ]
+
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def __list_inline_role_policies__(self):
+        logger.info("IAM - List Inline Role Policies...")
+        try:
+            for role in self.roles:
+                inline_role_policies_documents = []
+                get_role_inline_policies_paginator = self.client.get_paginator(
+                    "list_role_policies"
+                )
+                for page in get_role_inline_policies_paginator.paginate(
+                    RoleName=role.name
+                ):
+                    for policy in page["PolicyNames"]:
+                        inline_role_policies_documents.append(
+                            self.client.get_role_policy(
+                                RoleName=role.name, PolicyName=policy
+                            )["PolicyDocument"]
+                        )
+
+                role.inline_policies_documents = inline_role_policies_documents
+
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def __list_inline_group_policies__(self):
+        logger.info("IAM - List Inline Group Policies...")
+        try:
+            for group in self.groups:
+                inline_group_policies_documents = []
+                get_group_inline_policies_paginator = self.client.get_paginator(
+                    "list_group_policies"
+                )
+                for page in get_group_inline_policies_paginator.paginate(
+                    GroupName=group.name
+                ):
+                    for policy in page["PolicyNames"]:
+                        inline_group_policies_documents.append(
+                            self.client.get_group_policy(
+                                GroupName=group.name, PolicyName=policy
+                            )["PolicyDocument"]
+                        )
+
+                group.inline_policies_documents = inline_group_policies_documents
 
         except Exception as error:
             logger.error(
@@ -451,14 +731,22 @@ class IAM:
         finally:
             return policies
 
-    def __list_policies_version__(self, policies):
-        logger.info("IAM - List Policies Version...")
+    def __get_policy_version__(self, policy):
         try:
-            for policy in policies:
-                policy_version = self.client.get_policy_version(
-                    PolicyArn=policy.arn, VersionId=policy.version_id
+            # AWS managed policies are only retrieved if they were not retrieved for another account
+            if is_aws_managed_policy(policy.arn):
+                policy.document = aws_managed_policy_documents.get_document(
+                    policy.arn, policy.version_id
                 )
-                policy.document = policy_version["PolicyVersion"]["Document"]
+                if policy.document:
+                    return
+            policy_version = self.client.get_policy_version(
+                PolicyArn=policy.arn, VersionId=policy.version_id
+            )
+            policy.document = policy_version["PolicyVersion"]["Document"]
+            aws_managed_policy_documents.add_document(
+                policy.arn, policy.version_id, policy.document
+            )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -501,47 +789,46 @@ class IAM:
         finally:
             return server_certificates
 
-    def __list_tags_for_resource__(self):
-        logger.info("IAM - List Tags...")
+    def __list_role_tags__(self, role):
         try:
-            for role in self.roles:
-                try:
-                    response = self.client.list_role_tags(RoleName=role.name)["Tags"]
-                    role.tags = response
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntityException":
-                        role.tags = []
-
+            role.tags = self.client.list_role_tags(RoleName=role.name)["Tags"]
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                role.tags = []
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def __list_user_tags__(self, user):
         try:
-            for user in self.users:
-                try:
-                    response = self.client.list_user_tags(UserName=user.name)["Tags"]
-                    user.tags = response
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntityException":
-                        user.tags = []
-
+            user.tags = self.client.list_user_tags(UserName=user.name)["Tags"]
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                user.tags = []
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def __list_policy_tags__(self, policy):
         try:
-            for policy in self.policies:
-                try:
-                    response = self.client.list_policy_tags(PolicyArn=policy.arn)[
-                        "Tags"
-                    ]
-                    policy.tags = response
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntityException":
-                        policy.tags = []
-
+            policy.tags = self.client.list_policy_tags(PolicyArn=policy.arn)["Tags"]
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                policy.tags = []
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -560,6 +847,7 @@ class User(BaseModel):
     password_last_used: Optional[datetime]
     attached_policies: list[dict] = []
     inline_policies: list[str] = []
+    inline_policies_documents: list[dict] = []
     tags: Optional[list] = []
 
 
@@ -569,6 +857,7 @@ class Role(BaseModel):
     assume_role_policy: dict
     is_service_role: bool
     attached_policies: list[dict] = []
+    inline_policies_documents: list[dict] = []
     tags: Optional[list] = []
 
 
@@ -576,6 +865,7 @@ class Group(BaseModel):
     name: str
     arn: str
     attached_policies: list[dict] = []
+    inline_policies_documents: list[dict] = []
     users: list[User] = []
 
 
@@ -607,3 +897,11 @@ class Policy(BaseModel):
     attached: bool
     document: Optional[dict]
     tags: Optional[list] = []
+    _compiled: Optional[CompiledPolicy] = PrivateAttr(default=None)
+
+    @property
+    def compiled(self) -> CompiledPolicy:
+        # Parse the document only once, it is shared by all the IAM checks
+        if self._compiled is None:
+            self._compiled = CompiledPolicy(self.document)
+        return self._compiled
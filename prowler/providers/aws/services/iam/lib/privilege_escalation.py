@@ -0,0 +1,294 @@
+from collections import defaultdict, deque
+from typing import Optional
+
+from prowler.providers.aws.lib.policy_analysis.policy_analysis import (
+    CompiledPolicy,
+    normalize_list,
+    pattern_covers,
+)
+
+# Virtual node reached by every principal with administrative privileges
+administrator = "administrator"
+
+# Actions that let a user take over another user
+user_takeover_actions = [
+    "iam:CreateAccessKey",
+    "iam:CreateLoginProfile",
+    "iam:UpdateLoginProfile",
+]
+
+# Services that run code with a passed role and the actions needed to do it
+passrole_services = {
+    "ec2.amazonaws.com": [["ec2:RunInstances"]],
+    "lambda.amazonaws.com": [
+        ["lambda:CreateFunction", "lambda:InvokeFunction"],
+        ["lambda:CreateFunction", "lambda:CreateEventSourceMapping"],
+    ],
+    "glue.amazonaws.com": [["glue:CreateDevEndpoint"]],
+    "cloudformation.amazonaws.com": [["cloudformation:CreateStack"]],
+    "datapipeline.amazonaws.com": [
+        [
+            "datapipeline:CreatePipeline",
+            "datapipeline:PutPipelineDefinition",
+            "datapipeline:ActivatePipeline",
+        ]
+    ],
+}
+
+
+class Principal:
+    """Principal holds the compiled policies of an IAM user or role, including the ones of its groups"""
+
+    def __init__(self, arn: str, policies: list[CompiledPolicy]):
+        self.arn = arn
+        self.account = arn.split(":")[4]
+        self.policies = policies
+        self.allows_cache = {}
+
+    def allows(self, action: str, resource: Optional[str] = None) -> bool:
+        # Any policy allows the action and none of them denies it
+        key = (action, resource)
+        if key not in self.allows_cache:
+            self.allows_cache[key] = any(
+                policy.grants(action, resource) for policy in self.policies
+            ) and not any(policy.denies(action, resource) for policy in self.policies)
+        return self.allows_cache[key]
+
+    def allows_on(self, action: str, resources: list) -> list:
+        """allows_on returns the resources, with an arn attribute, on which the action is allowed"""
+        action = action.lower()
+        # Only the statements about the action are evaluated for each resource
+        allow_statements = [
+            statement
+            for policy in self.policies
+            for statement in policy.allow_statements
+            if statement.covers_action(action)
+        ]
+        deny_statements = [
+            statement
+            for policy in self.policies
+            for statement in policy.deny_statements
+            if statement.denies_action(action)
+        ]
+        if not allow_statements:
+            return []
+        if not deny_statements and any(
+            statement.covers_resource("*") for statement in allow_statements
+        ):
+            return resources
+        return [
+            resource
+            for resource in resources
+            if any(
+                statement.covers_resource(resource.arn)
+                for statement in allow_statements
+            )
+            and not any(
+                statement.covers_resource(resource.arn) for statement in deny_statements
+            )
+        ]
+
+
+class PrivilegeEscalationGraph:
+    """PrivilegeEscalationGraph links IAM principals with the techniques that let one become another
+
+    Paths to administrative privileges are searched once for all the principals
+    with a breadth-first search from the administrators over the reversed edges,
+    bounded to max_depth steps. Condition blocks are not evaluated.
+    """
+
+    def __init__(
+        self,
+        users: list,
+        roles: list,
+        groups: list,
+        policies: list,
+        max_depth: int,
+    ):
+        self.max_depth = max_depth
+        self.principals = {}
+        self.administrators = set()
+        # source -> [(target, technique)]
+        self.edges = defaultdict(list)
+        self.next_hop = {}
+
+        compiled_policies = {policy.arn: policy.compiled for policy in policies}
+        self.user_groups = defaultdict(list)
+        for group in groups:
+            for user in group.users:
+                self.user_groups[user.arn].append(group)
+        self.group_policies = {
+            group.arn: self.__get_policies__(group, compiled_policies)
+            for group in groups
+        }
+        for user in users:
+            policies = self.__get_policies__(user, compiled_policies)
+            for group in self.user_groups[user.arn]:
+                policies += self.group_policies[group.arn]
+            self.principals[user.arn] = Principal(user.arn, policies)
+        for role in roles:
+            self.principals[role.arn] = Principal(
+                role.arn, self.__get_policies__(role, compiled_policies)
+            )
+
+        self.users = users
+        self.roles = roles
+        self.entities = {entity.arn: entity for entity in users + roles}
+        self.administrator_groups = [
+            group
+            for group in groups
+            if any(policy.allows("*", "*") for policy in self.group_policies[group.arn])
+        ]
+        self.__index_trust_policies__()
+        for principal in self.principals.values():
+            if principal.allows("*", "*"):
+                self.administrators.add(principal.arn)
+            else:
+                self.__add_edges__(principal)
+        self.__search_paths__()
+
+    def __get_policies__(self, entity, compiled_policies: dict) -> list:
+        policies = [
+            compiled_policies[attached_policy["PolicyArn"]]
+            for attached_policy in entity.attached_policies
+            if attached_policy["PolicyArn"] in compiled_policies
+        ]
+        policies += [
+            CompiledPolicy(document) for document in entity.inline_policies_documents
+        ]
+        return policies
+
+    def __index_trust_policies__(self):
+        # Roles by the principals allowed to assume them
+        self.trusted_arns = defaultdict(list)
+        self.trusted_accounts = defaultdict(list)
+        self.trusted_services = defaultdict(list)
+        self.trusted_by_anyone = []
+        for role in self.roles:
+            for statement in normalize_list(role.assume_role_policy.get("Statement")):
+                if statement.get("Effect") != "Allow" or not any(
+                    pattern_covers(action.lower(), "sts:assumerole")
+                    for action in normalize_list(statement.get("Action"))
+                ):
+                    continue
+                principal = statement.get("Principal", {})
+                if principal == "*":
+                    self.trusted_by_anyone.append(role)
+                    continue
+                for aws_principal in normalize_list(principal.get("AWS")):
+                    if aws_principal == "*":
+                        self.trusted_by_anyone.append(role)
+                    elif aws_principal.isdigit():
+                        self.trusted_accounts[aws_principal].append(role)
+                    elif aws_principal.endswith(":root"):
+                        self.trusted_accounts[aws_principal.split(":")[4]].append(role)
+                    else:
+                        self.trusted_arns[aws_principal].append(role)
+                for service in normalize_list(principal.get("Service")):
+                    self.trusted_services[service].append(role)
+
+    def __add_edge__(self, source: str, target: str, technique: str):
+        if source != target:
+            self.edges[source].append((target, technique))
+
+    def __add_edges__(self, principal: Principal):
+        arn = principal.arn
+        # Grant more permissions to itself
+        if arn.split(":")[5].startswith("user/"):
+            for action in ["iam:PutUserPolicy", "iam:AttachUserPolicy"]:
+                if principal.allows(action, arn):
+                    self.__add_edge__(arn, administrator, action)
+            for group in self.user_groups[arn]:
+                for action in ["iam:PutGroupPolicy", "iam:AttachGroupPolicy"]:
+                    if principal.allows(action, group.arn):
+                        self.__add_edge__(
+                            arn, administrator, f"{action} on {group.arn}"
+                        )
+            for group in principal.allows_on(
+                "iam:AddUserToGroup", self.administrator_groups
+            ):
+                self.__add_edge__(
+                    arn, administrator, f"iam:AddUserToGroup on {group.arn}"
+                )
+        else:
+            for action in ["iam:PutRolePolicy", "iam:AttachRolePolicy"]:
+                if principal.allows(action, arn):
+                    self.__add_edge__(arn, administrator, action)
+        if principal.allows("iam:CreatePolicyVersion"):
+            for policy_arn in self.__get_customer_policies_arns__(arn):
+                if principal.allows("iam:CreatePolicyVersion", policy_arn):
+                    self.__add_edge__(
+                        arn, administrator, f"iam:CreatePolicyVersion on {policy_arn}"
+                    )
+
+        # Take over other users
+        for action in user_takeover_actions:
+            for user in principal.allows_on(action, self.users):
+                self.__add_edge__(arn, user.arn, action)
+
+        # Assume roles trusting the principal
+        for role in self.trusted_arns[arn]:
+            self.__add_edge__(arn, role.arn, "sts:AssumeRole")
+        for role in principal.allows_on(
+            "sts:AssumeRole",
+            self.trusted_accounts[principal.account] + self.trusted_by_anyone,
+        ):
+            self.__add_edge__(arn, role.arn, "sts:AssumeRole")
+        for role in principal.allows_on(
+            "sts:AssumeRole",
+            principal.allows_on("iam:UpdateAssumeRolePolicy", self.roles),
+        ):
+            self.__add_edge__(
+                arn, role.arn, "iam:UpdateAssumeRolePolicy and sts:AssumeRole"
+            )
+
+        # Pass roles to services running code controlled by the principal
+        if principal.allows("iam:PassRole"):
+            for service, actions_sets in passrole_services.items():
+                for actions in actions_sets:
+                    if all(principal.allows(action) for action in actions):
+                        for role in principal.allows_on(
+                            "iam:PassRole", self.trusted_services[service]
+                        ):
+                            self.__add_edge__(
+                                arn,
+                                role.arn,
+                                f"iam:PassRole and {' and '.join(actions)}",
+                            )
+                        break
+
+    def __get_customer_policies_arns__(self, arn: str) -> set:
+        entities = [self.entities[arn]] + self.user_groups[arn]
+        return {
+            attached_policy["PolicyArn"]
+            for entity in entities
+            for attached_policy in entity.attached_policies
+            if attached_policy["PolicyArn"].split(":")[4] != "aws"
+        }
+
+    def __search_paths__(self):
+        # Breadth-first search from the administrators over the reversed edges
+        reversed_edges = defaultdict(list)
+        for source, targets in self.edges.items():
+            for target, technique in targets:
+                reversed_edges[target].append((source, technique))
+        depth = {administrator: 0}
+        depth.update({arn: 0 for arn in self.administrators})
+        queue = deque(depth)
+        while queue:
+            node = queue.popleft()
+            if depth[node] == self.max_depth:
+                continue
+            for source, technique in reversed_edges[node]:
+                if source not in depth:
+                    depth[source] = depth[node] + 1
+                    self.next_hop[source] = (technique, node)
+                    queue.append(source)
+
+    def get_escalation_path(self, arn: str) -> list:
+        """get_escalation_path returns the shortest list of (technique, target) steps from the principal to administrative privileges"""
+        path = []
+        while arn in self.next_hop:
+            technique, arn = self.next_hop[arn]
+            path.append((technique, arn))
+        return path
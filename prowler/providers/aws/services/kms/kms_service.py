@@ -6,7 +6,13 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    threading_call_per_resource,
+)
+from prowler.providers.aws.lib.resource_api_tagging.resource_api_tagging import (
+    get_stored_tags,
+)
 
 
 ################## KMS
@@ -16,13 +22,21 @@ class KMS:
         self.session = audit_info.audit_session
         self.audited_account = audit_info.audited_account
         self.audit_resources = audit_info.audit_resources
+        self.tag_store = audit_info.tag_store
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.keys = []
         self.__threading_call__(self.__list_keys__)
         if self.keys:
-            self.__describe_key__()
-            self.__get_key_rotation_status__()
-            self.__get_key_policy__()
+            logger.info("KMS - Getting Keys details...")
+            threading_call_per_resource(
+                self.__describe_key__, self.keys, self.regional_clients
+            )
+            threading_call_per_resource(
+                self.__get_key_rotation_status__, self.keys, self.regional_clients
+            )
+            threading_call_per_resource(
+                self.__get_key_policy__, self.keys, self.regional_clients
+            )
             self.__list_resource_tags__()
 
     def __get_session__(self):
@@ -58,53 +72,44 @@ class KMS:
                 f"{regional_client.region} -- {error.__class__.__name__}:{error.__traceback__.tb_lineno} -- {error}"
             )
 
-    def __describe_key__(self):
-        logger.info("KMS - Describing Key...")
+    def __describe_key__(self, regional_client, key):
         try:
-            for key in self.keys:
-                regional_client = self.regional_clients[key.region]
-                response = regional_client.describe_key(KeyId=key.id)
-                key.state = response["KeyMetadata"]["KeyState"]
-                key.origin = response["KeyMetadata"]["Origin"]
-                key.manager = response["KeyMetadata"]["KeyManager"]
-                key.spec = response["KeyMetadata"]["CustomerMasterKeySpec"]
+            response = regional_client.describe_key(KeyId=key.id)
+            key.state = response["KeyMetadata"]["KeyState"]
+            key.origin = response["KeyMetadata"]["Origin"]
+            key.manager = response["KeyMetadata"]["KeyManager"]
+            key.spec = response["KeyMetadata"]["CustomerMasterKeySpec"]
         except Exception as error:
             logger.error(
                 f"{regional_client.region} -- {error.__class__.__name__}:{error.__traceback__.tb_lineno} -- {error}"
             )
 
-    def __get_key_rotation_status__(self):
-        logger.info("KMS - Get Key Rotation Status...")
+    def __get_key_rotation_status__(self, regional_client, key):
         try:
-            for key in self.keys:
-                if (
-                    key.origin
-                    and key.manager
-                    and "EXTERNAL" not in key.origin
-                    and "AWS" not in key.manager
-                ):
-                    regional_client = self.regional_clients[key.region]
-                    key.rotation_enabled = regional_client.get_key_rotation_status(
-                        KeyId=key.id
-                    )["KeyRotationEnabled"]
+            if (
+                key.origin
+                and key.manager
+                and "EXTERNAL" not in key.origin
+                and "AWS" not in key.manager
+            ):
+                key.rotation_enabled = regional_client.get_key_rotation_status(
+                    KeyId=key.id
+                )["KeyRotationEnabled"]
         except Exception as error:
             logger.error(
                 f"{regional_client.region} -- {error.__class__.__name__}:{error.__traceback__.tb_lineno} -- {error}"
             )
 
-    def __get_key_policy__(self):
-        logger.info("KMS - Get Key Policy...")
+    def __get_key_policy__(self, regional_client, key):
         try:
-            for key in self.keys:
-                if (
-                    key.manager and key.manager == "CUSTOMER"
-                ):  # only customer KMS have policies
-                    regional_client = self.regional_clients[key.region]
-                    key.policy = json.loads(
-                        regional_client.get_key_policy(
-                            KeyId=key.id, PolicyName="default"
-                        )["Policy"]
-                    )
+            if (
+                key.manager and key.manager == "CUSTOMER"
+            ):  # only customer KMS have policies
+                key.policy = json.loads(
+                    regional_client.get_key_policy(KeyId=key.id, PolicyName="default")[
+                        "Policy"
+                    ]
+                )
         except Exception as error:
             logger.error(
                 f"{regional_client.region} -- {error.__class__.__name__}:{error.__traceback__.tb_lineno} -- {error}"
@@ -118,6 +123,13 @@ class KMS:
             ):  # only check customer KMS keys
                 try:
                     regional_client = self.regional_clients[key.region]
+                    stored_tags = get_stored_tags(self.tag_store, key.arn, key.region)
+                    if stored_tags is not None:
+                        key.tags = [
+                            {"TagKey": tag["Key"], "TagValue": tag["Value"]}
+                            for tag in stored_tags
+                        ]
+                        continue
                     response = regional_client.list_resource_tags(
                         KeyId=key.id,
                     )["Tags"]
@@ -6,7 +6,13 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    threading_call_per_resource,
+)
+from prowler.providers.aws.lib.resource_api_tagging.resource_api_tagging import (
+    get_stored_tags,
+)
 
 
 ################################ OpenSearch
@@ -15,13 +21,21 @@ class OpenSearchService:
         self.service = "opensearch"
         self.session = audit_info.audit_session
         self.audit_resources = audit_info.audit_resources
+        self.tag_store = audit_info.tag_store
         self.audited_partition = audit_info.audited_partition
         self.audited_account = audit_info.audited_account
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.opensearch_domains = []
         self.__threading_call__(self.__list_domain_names__)
-        self.__describe_domain_config__(self.regional_clients)
-        self.__describe_domain__(self.regional_clients)
+        logger.info("OpenSearch - describing domains...")
+        threading_call_per_resource(
+            self.__describe_domain_config__,
+            self.opensearch_domains,
+            self.regional_clients,
+        )
+        threading_call_per_resource(
+            self.__describe_domain__, self.opensearch_domains, self.regional_clients
+        )
         self.__list_tags__()
 
     def __get_session__(self):
@@ -57,87 +71,76 @@ class OpenSearchService:
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __describe_domain_config__(self, regional_clients):
-        logger.info("OpenSearch - describing domain configurations...")
+    def __describe_domain_config__(self, regional_client, domain):
         try:
-            for domain in self.opensearch_domains:
-                regional_client = regional_clients[domain.region]
-                describe_domain = regional_client.describe_domain_config(
-                    DomainName=domain.name
-                )
-                for logging_key in [
-                    "SEARCH_SLOW_LOGS",
-                    "INDEX_SLOW_LOGS",
-                    "AUDIT_LOGS",
-                ]:
-                    if (
-                        logging_key
-                        in describe_domain["DomainConfig"]["LogPublishingOptions"][
-                            "Options"
-                        ]
-                    ):
-                        domain.logging.append(
-                            PublishingLoggingOption(
-                                name=logging_key,
-                                enabled=describe_domain["DomainConfig"][
-                                    "LogPublishingOptions"
-                                ]["Options"][logging_key]["Enabled"],
-                            )
+            describe_domain = regional_client.describe_domain_config(
+                DomainName=domain.name
+            )
+            for logging_key in [
+                "SEARCH_SLOW_LOGS",
+                "INDEX_SLOW_LOGS",
+                "AUDIT_LOGS",
+            ]:
+                if (
+                    logging_key
+                    in describe_domain["DomainConfig"]["LogPublishingOptions"][
+                        "Options"
+                    ]
+                ):
+                    domain.logging.append(
+                        PublishingLoggingOption(
+                            name=logging_key,
+                            enabled=describe_domain["DomainConfig"][
+                                "LogPublishingOptions"
+                            ]["Options"][logging_key]["Enabled"],
                         )
-                try:
-                    domain.access_policy = loads(
-                        describe_domain["DomainConfig"]["AccessPolicies"]["Options"]
-                    )
-                except JSONDecodeError as error:
-                    logger.error(
-                        f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                     )
-                    continue
+            try:
+                domain.access_policy = loads(
+                    describe_domain["DomainConfig"]["AccessPolicies"]["Options"]
+                )
+            except JSONDecodeError as error:
+                logger.error(
+                    f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
 
         except Exception as error:
             logger.error(
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __describe_domain__(self, regional_clients):
-        logger.info("OpenSearch - describing domain configurations...")
+    def __describe_domain__(self, regional_client, domain):
         try:
-            for domain in self.opensearch_domains:
-                regional_client = regional_clients[domain.region]
-                describe_domain = regional_client.describe_domain(
-                    DomainName=domain.name
-                )
-                domain.arn = describe_domain["DomainStatus"]["ARN"]
-                domain.endpoint_vpc = None
-                if "Endpoints" in describe_domain["DomainStatus"]:
-                    if "vpc" in describe_domain["DomainStatus"]["Endpoints"]:
-                        domain.endpoint_vpc = describe_domain["DomainStatus"][
-                            "Endpoints"
-                        ]["vpc"]
-                domain.vpc_id = None
-                if "VPCOptions" in describe_domain["DomainStatus"]:
-                    domain.vpc_id = describe_domain["DomainStatus"]["VPCOptions"][
-                        "VPCId"
+            describe_domain = regional_client.describe_domain(DomainName=domain.name)
+            domain.arn = describe_domain["DomainStatus"]["ARN"]
+            domain.endpoint_vpc = None
+            if "Endpoints" in describe_domain["DomainStatus"]:
+                if "vpc" in describe_domain["DomainStatus"]["Endpoints"]:
+                    domain.endpoint_vpc = describe_domain["DomainStatus"]["Endpoints"][
+                        "vpc"
                     ]
-                domain.cognito_options = describe_domain["DomainStatus"][
-                    "CognitoOptions"
-                ]["Enabled"]
-                domain.encryption_at_rest = describe_domain["DomainStatus"][
-                    "EncryptionAtRestOptions"
-                ]["Enabled"]
-                domain.node_to_node_encryption = describe_domain["DomainStatus"][
-                    "NodeToNodeEncryptionOptions"
-                ]["Enabled"]
-                domain.enforce_https = describe_domain["DomainStatus"][
-                    "DomainEndpointOptions"
-                ]["EnforceHTTPS"]
-                domain.internal_user_database = describe_domain["DomainStatus"][
-                    "AdvancedSecurityOptions"
-                ]["InternalUserDatabaseEnabled"]
-                domain.update_available = describe_domain["DomainStatus"][
-                    "ServiceSoftwareOptions"
-                ]["UpdateAvailable"]
-                domain.version = describe_domain["DomainStatus"]["EngineVersion"]
+            domain.vpc_id = None
+            if "VPCOptions" in describe_domain["DomainStatus"]:
+                domain.vpc_id = describe_domain["DomainStatus"]["VPCOptions"]["VPCId"]
+            domain.cognito_options = describe_domain["DomainStatus"]["CognitoOptions"][
+                "Enabled"
+            ]
+            domain.encryption_at_rest = describe_domain["DomainStatus"][
+                "EncryptionAtRestOptions"
+            ]["Enabled"]
+            domain.node_to_node_encryption = describe_domain["DomainStatus"][
+                "NodeToNodeEncryptionOptions"
+            ]["Enabled"]
+            domain.enforce_https = describe_domain["DomainStatus"][
+                "DomainEndpointOptions"
+            ]["EnforceHTTPS"]
+            domain.internal_user_database = describe_domain["DomainStatus"][
+                "AdvancedSecurityOptions"
+            ]["InternalUserDatabaseEnabled"]
+            domain.update_available = describe_domain["DomainStatus"][
+                "ServiceSoftwareOptions"
+            ]["UpdateAvailable"]
+            domain.version = describe_domain["DomainStatus"]["EngineVersion"]
         except Exception as error:
             logger.error(
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -148,9 +151,11 @@ class OpenSearchService:
         for domain in self.opensearch_domains:
             try:
                 regional_client = self.regional_clients[domain.region]
-                response = regional_client.list_tags(
-                    ARN=domain.arn,
-                )["TagList"]
+                response = get_stored_tags(self.tag_store, domain.arn, domain.region)
+                if response is None:
+                    response = regional_client.list_tags(
+                        ARN=domain.arn,
+                    )["TagList"]
                 domain.tags = response
             except Exception as error:
                 logger.error(
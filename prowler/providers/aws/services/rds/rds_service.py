@@ -6,7 +6,10 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    threading_call_per_resource,
+)
 
 
 ################## RDS
@@ -26,10 +29,21 @@ class RDS:
         self.__threading_call__(self.__describe_db_instances__)
         self.__threading_call__(self.__describe_db_parameters__)
         self.__threading_call__(self.__describe_db_snapshots__)
-        self.__threading_call__(self.__describe_db_snapshot_attributes__)
+        # RDS has no filtered listing of the public snapshots of the account, so their attributes are described concurrently
+        logger.info("RDS - Describe Snapshot Attributes...")
+        threading_call_per_resource(
+            self.__describe_db_snapshot_attributes__,
+            self.db_snapshots,
+            self.regional_clients,
+        )
         self.__threading_call__(self.__describe_db_clusters__)
         self.__threading_call__(self.__describe_db_cluster_snapshots__)
-        self.__threading_call__(self.__describe_db_cluster_snapshot_attributes__)
+        logger.info("RDS - Describe Cluster Snapshot Attributes...")
+        threading_call_per_resource(
+            self.__describe_db_cluster_snapshot_attributes__,
+            self.db_cluster_snapshots,
+            self.regional_clients,
+        )
         self.__threading_call__(self.__describe_db_engine_versions__)
 
     def __get_session__(self):
@@ -143,27 +157,27 @@ class RDS:
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __describe_db_snapshot_attributes__(self, regional_client):
-        logger.info("RDS - Describe Snapshot Attributes...")
-        for snapshot in self.db_snapshots:
-            try:
-                if snapshot.region == regional_client.region:
-                    response = regional_client.describe_db_snapshot_attributes(
-                        DBSnapshotIdentifier=snapshot.id
-                    )["DBSnapshotAttributesResult"]
-                    for att in response["DBSnapshotAttributes"]:
-                        if "all" in att["AttributeValues"]:
-                            snapshot.public = True
-            except ClientError as error:
-                if error.response["Error"]["Code"] == "DBSnapshotNotFound":
-                    logger.warning(
-                        f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-                    continue
-            except Exception as error:
+    def __describe_db_snapshot_attributes__(self, regional_client, snapshot):
+        try:
+            response = regional_client.describe_db_snapshot_attributes(
+                DBSnapshotIdentifier=snapshot.id
+            )["DBSnapshotAttributesResult"]
+            for att in response["DBSnapshotAttributes"]:
+                if "all" in att["AttributeValues"]:
+                    snapshot.public = True
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "DBSnapshotNotFound":
+                logger.warning(
+                    f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
                 logger.error(
                     f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
+        except Exception as error:
+            logger.error(
+                f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
     def __describe_db_clusters__(self, regional_client):
         logger.info("RDS - Describe Clusters...")
@@ -238,18 +252,14 @@ class RDS:
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __describe_db_cluster_snapshot_attributes__(self, regional_client):
-        logger.info("RDS - Describe Cluster Snapshot Attributes...")
+    def __describe_db_cluster_snapshot_attributes__(self, regional_client, snapshot):
         try:
-            for snapshot in self.db_cluster_snapshots:
-                if snapshot.region == regional_client.region:
-                    response = regional_client.describe_db_cluster_snapshot_attributes(
-                        DBClusterSnapshotIdentifier=snapshot.id
-                    )["DBClusterSnapshotAttributesResult"]
-                    for att in response["DBClusterSnapshotAttributes"]:
-                        if "all" in att["AttributeValues"]:
-                            snapshot.public = True
-
+            response = regional_client.describe_db_cluster_snapshot_attributes(
+                DBClusterSnapshotIdentifier=snapshot.id
+            )["DBClusterSnapshotAttributesResult"]
+            for att in response["DBClusterSnapshotAttributes"]:
+                if "all" in att["AttributeValues"]:
+                    snapshot.public = True
         except Exception as error:
             logger.error(
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -4,7 +4,13 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    get_global_region,
+)
+from prowler.providers.aws.lib.resource_api_tagging.resource_api_tagging import (
+    get_stored_tags,
+)
 
 
 ################## Route53
@@ -14,6 +20,9 @@ class Route53:
         self.session = audit_info.audit_session
         self.audited_partition = audit_info.audited_partition
         self.audit_resources = audit_info.audit_resources
+        self.tag_store = audit_info.tag_store
+        # The Resource Groups Tagging API only returns the hosted zones in the partition global region
+        self.tags_region = get_global_region(audit_info)
         self.hosted_zones = {}
         self.record_sets = []
         global_client = generate_regional_clients(
@@ -68,6 +77,9 @@ class Route53:
                     HostedZoneId=zone_id
                 ):
                     for record in page["ResourceRecordSets"]:
+                        # Only the IPv4 address records are evaluated
+                        if record["Type"] != "A":
+                            continue
                         self.record_sets.append(
                             RecordSet(
                                 name=record["Name"],
@@ -115,6 +127,12 @@ class Route53:
         logger.info("Route53Domains - List Tags...")
         for hosted_zone in self.hosted_zones.values():
             try:
+                stored_tags = get_stored_tags(
+                    self.tag_store, hosted_zone.arn, self.tags_region
+                )
+                if stored_tags is not None:
+                    hosted_zone.tags = stored_tags
+                    continue
                 response = self.client.list_tags_for_resource(
                     ResourceType="hostedzone", ResourceId=hosted_zone.id
                 )["ResourceTagSet"]
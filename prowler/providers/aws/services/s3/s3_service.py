@@ -1,5 +1,5 @@
 import json
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from botocore.client import ClientError
@@ -7,7 +7,7 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import generate_regional_clients, max_workers
 
 
 ################## S3
@@ -22,73 +22,88 @@ class S3:
         self.audited_account_arn = audit_info.audited_account_arn
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.buckets = self.__list_buckets__(audit_info)
-        self.__threading_call__(self.__get_bucket_versioning__)
-        self.__threading_call__(self.__get_bucket_logging__)
-        self.__threading_call__(self.__get_bucket_policy__)
-        self.__threading_call__(self.__get_bucket_acl__)
-        self.__threading_call__(self.__get_public_access_block__)
-        self.__threading_call__(self.__get_bucket_encryption__)
-        self.__threading_call__(self.__get_bucket_ownership_controls__)
-        self.__threading_call__(self.__get_object_lock_configuration__)
-        self.__threading_call__(self.__get_bucket_tagging__)
+        self.__threading_call__(self.__get_bucket_attributes__, self.buckets)
 
     def __get_session__(self):
         return self.session
 
-    def __threading_call__(self, call):
-        threads = []
-        for bucket in self.buckets:
-            threads.append(threading.Thread(target=call, args=(bucket,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+    def __threading_call__(self, call, iterator):
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(call, iterator))
 
     def __list_buckets__(self, audit_info):
         logger.info("S3 - Listing buckets...")
         buckets = []
         try:
-            list_buckets = self.client.list_buckets()
-            for bucket in list_buckets["Buckets"]:
-                bucket_region = self.client.get_bucket_location(Bucket=bucket["Name"])[
-                    "LocationConstraint"
-                ]
-                if bucket_region == "EU":  # If EU, bucket_region is eu-west-1
-                    bucket_region = "eu-west-1"
-                if not bucket_region:  # If None, bucket_region is us-east-1
-                    bucket_region = "us-east-1"
-                # Arn
+            bucket_names = []
+            for bucket in self.client.list_buckets()["Buckets"]:
                 arn = f"arn:{self.audited_partition}:s3:::{bucket['Name']}"
                 if not self.audit_resources or (
                     is_resource_filtered(arn, self.audit_resources)
                 ):
-                    # Check if there are filter regions
-                    if audit_info.audited_regions:
-                        if bucket_region in audit_info.audited_regions:
-                            buckets.append(
-                                Bucket(
-                                    name=bucket["Name"], arn=arn, region=bucket_region
-                                )
-                            )
-                    else:
-                        buckets.append(
-                            Bucket(name=bucket["Name"], arn=arn, region=bucket_region)
+                    bucket_names.append(bucket["Name"])
+            # Resolve the buckets location concurrently
+            bucket_regions = self.__threading_call__(
+                self.__get_bucket_location__, bucket_names
+            )
+            for bucket_name, bucket_region in zip(bucket_names, bucket_regions):
+                # Skip buckets deleted after being listed
+                if not bucket_region:
+                    continue
+                # Check if there are filter regions
+                if (
+                    not audit_info.audited_regions
+                    or bucket_region in audit_info.audited_regions
+                ):
+                    buckets.append(
+                        Bucket(
+                            name=bucket_name,
+                            arn=f"arn:{self.audited_partition}:s3:::{bucket_name}",
+                            region=bucket_region,
                         )
+                    )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return buckets
+
+    def __get_bucket_location__(self, bucket_name):
+        try:
+            bucket_region = self.client.get_bucket_location(Bucket=bucket_name)[
+                "LocationConstraint"
+            ]
+            if bucket_region == "EU":  # If EU, bucket_region is eu-west-1
+                bucket_region = "eu-west-1"
+            if not bucket_region:  # If None, bucket_region is us-east-1
+                bucket_region = "us-east-1"
+            return bucket_region
         except ClientError as error:
             if error.response["Error"]["Code"] == "NoSuchBucket":
                 logger.warning(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
-        except Exception as error:
-            if bucket:
-                logger.error(
-                    f"{bucket['Name']} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    f"{bucket_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
             else:
                 logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    f"{bucket_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
-        return buckets
+        except Exception as error:
+            logger.error(
+                f"{bucket_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return None
+
+    def __get_bucket_attributes__(self, bucket):
+        # All the attributes of a bucket are retrieved in the same worker, using the bucket regional client
+        self.__get_bucket_versioning__(bucket)
+        self.__get_bucket_logging__(bucket)
+        self.__get_bucket_policy__(bucket)
+        self.__get_bucket_acl__(bucket)
+        self.__get_public_access_block__(bucket)
+        self.__get_bucket_encryption__(bucket)
+        self.__get_bucket_ownership_controls__(bucket)
+        self.__get_object_lock_configuration__(bucket)
+        self.__get_bucket_tagging__(bucket)
 
     def __get_bucket_versioning__(self, bucket):
         logger.info("S3 - Get buckets versioning...")
@@ -125,7 +140,12 @@ class S3:
                 "SSEAlgorithm"
             ]
         except ClientError as error:
-            if error.response["Error"]["Code"] == "NoSuchBucket":
+            if (
+                error.response["Error"]["Code"]
+                == "ServerSideEncryptionConfigurationNotFoundError"
+            ):
+                bucket.encryption = None
+            elif error.response["Error"]["Code"] == "NoSuchBucket":
                 logger.warning(
                     f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
@@ -134,9 +154,7 @@ class S3:
                     f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
         except Exception as error:
-            if "ServerSideEncryptionConfigurationNotFoundError" in str(error):
-                bucket.encryption = None
-            elif regional_client:
+            if regional_client:
                 logger.error(
                     f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
@@ -7,6 +7,9 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.resource_api_tagging.resource_api_tagging import (
+    get_stored_tags,
+)
 
 
 ################################ SageMaker
@@ -15,6 +18,7 @@ class SageMaker:
         self.service = "sagemaker"
         self.session = audit_info.audit_session
         self.audit_resources = audit_info.audit_resources
+        self.tag_store = audit_info.tag_store
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.sagemaker_notebook_instances = []
         self.sagemaker_models = []
@@ -208,7 +212,9 @@ class SageMaker:
         try:
             for model in self.sagemaker_models:
                 regional_client = self.regional_clients[model.region]
-                response = regional_client.list_tags(ResourceArn=model.arn)["Tags"]
+                response = get_stored_tags(self.tag_store, model.arn, model.region)
+                if response is None:
+                    response = regional_client.list_tags(ResourceArn=model.arn)["Tags"]
                 model.tags = response
         except Exception as error:
             logger.error(
@@ -217,7 +223,13 @@ class SageMaker:
         try:
             for instance in self.sagemaker_notebook_instances:
                 regional_client = self.regional_clients[instance.region]
-                response = regional_client.list_tags(ResourceArn=instance.arn)["Tags"]
+                response = get_stored_tags(
+                    self.tag_store, instance.arn, instance.region
+                )
+                if response is None:
+                    response = regional_client.list_tags(ResourceArn=instance.arn)[
+                        "Tags"
+                    ]
                 instance.tags = response
         except Exception as error:
             logger.error(
@@ -226,7 +238,9 @@ class SageMaker:
         try:
             for job in self.sagemaker_training_jobs:
                 regional_client = self.regional_clients[job.region]
-                response = regional_client.list_tags(ResourceArn=job.arn)["Tags"]
+                response = get_stored_tags(self.tag_store, job.arn, job.region)
+                if response is None:
+                    response = regional_client.list_tags(ResourceArn=job.arn)["Tags"]
                 job.tags = response
         except Exception as error:
             logger.error(
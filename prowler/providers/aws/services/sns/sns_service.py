@@ -6,7 +6,13 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    threading_call_per_resource,
+)
+from prowler.providers.aws.lib.resource_api_tagging.resource_api_tagging import (
+    get_stored_tags,
+)
 
 
 ################################ SNS
@@ -15,10 +21,14 @@ class SNS:
         self.service = "sns"
         self.session = audit_info.audit_session
         self.audit_resources = audit_info.audit_resources
+        self.tag_store = audit_info.tag_store
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.topics = []
         self.__threading_call__(self.__list_topics__)
-        self.__get_topic_attributes__(self.regional_clients)
+        logger.info("SNS - Getting topic attributes...")
+        threading_call_per_resource(
+            self.__get_topic_attributes__, self.topics, self.regional_clients
+        )
         self.__list_tags_for_resource__()
 
     def __get_session__(self):
@@ -56,20 +66,15 @@ class SNS:
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __get_topic_attributes__(self, regional_clients):
-        logger.info("SNS - getting topic attributes...")
+    def __get_topic_attributes__(self, regional_client, topic):
         try:
-            for topic in self.topics:
-                regional_client = regional_clients[topic.region]
-                topic_attributes = regional_client.get_topic_attributes(
-                    TopicArn=topic.arn
-                )
-                if "Policy" in topic_attributes["Attributes"]:
-                    topic.policy = loads(topic_attributes["Attributes"]["Policy"])
-                if "KmsMasterKeyId" in topic_attributes["Attributes"]:
-                    topic.kms_master_key_id = topic_attributes["Attributes"][
-                        "KmsMasterKeyId"
-                    ]
+            topic_attributes = regional_client.get_topic_attributes(TopicArn=topic.arn)
+            if "Policy" in topic_attributes["Attributes"]:
+                topic.policy = loads(topic_attributes["Attributes"]["Policy"])
+            if "KmsMasterKeyId" in topic_attributes["Attributes"]:
+                topic.kms_master_key_id = topic_attributes["Attributes"][
+                    "KmsMasterKeyId"
+                ]
         except Exception as error:
             logger.error(
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -80,9 +85,11 @@ class SNS:
         try:
             for topic in self.topics:
                 regional_client = self.regional_clients[topic.region]
-                response = regional_client.list_tags_for_resource(
-                    ResourceArn=topic.arn
-                )["Tags"]
+                response = get_stored_tags(self.tag_store, topic.arn, topic.region)
+                if response is None:
+                    response = regional_client.list_tags_for_resource(
+                        ResourceArn=topic.arn
+                    )["Tags"]
                 topic.tags = response
         except Exception as error:
             logger.error(
@@ -6,7 +6,13 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    threading_call_per_resource,
+)
+from prowler.providers.aws.lib.resource_api_tagging.resource_api_tagging import (
+    get_stored_tags,
+)
 
 
 ################################ SQS
@@ -15,12 +21,16 @@ class SQS:
         self.service = "sqs"
         self.session = audit_info.audit_session
         self.audit_resources = audit_info.audit_resources
+        self.tag_store = audit_info.tag_store
         self.audited_account = audit_info.audited_account
         self.audited_partition = audit_info.audited_partition
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.queues = []
         self.__threading_call__(self.__list_queues__)
-        self.__get_queue_attributes__(self.regional_clients)
+        logger.info("SQS - describing queue attributes...")
+        threading_call_per_resource(
+            self.__get_queue_attributes__, self.queues, self.regional_clients
+        )
         self.__list_queue_tags__()
 
     def __get_session__(self):
@@ -58,27 +68,19 @@ class SQS:
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __get_queue_attributes__(self, regional_clients):
+    def __get_queue_attributes__(self, regional_client, queue):
         try:
-            logger.info("SQS - describing queue attributes...")
-            for queue in self.queues:
-                regional_client = regional_clients[queue.region]
-                queue_attributes = regional_client.get_queue_attributes(
-                    QueueUrl=queue.id, AttributeNames=["All"]
-                )
-                if "Attributes" in queue_attributes:
-                    if "Policy" in queue_attributes["Attributes"]:
-                        queue.policy = loads(queue_attributes["Attributes"]["Policy"])
-                    if "KmsMasterKeyId" in queue_attributes["Attributes"]:
-                        queue.kms_key_id = queue_attributes["Attributes"][
-                            "KmsMasterKeyId"
-                        ]
-                    if "SqsManagedSseEnabled" in queue_attributes["Attributes"]:
-                        if (
-                            queue_attributes["Attributes"]["SqsManagedSseEnabled"]
-                            == "true"
-                        ):
-                            queue.kms_key_id = "SqsManagedSseEnabled"
+            queue_attributes = regional_client.get_queue_attributes(
+                QueueUrl=queue.id, AttributeNames=["All"]
+            )
+            if "Attributes" in queue_attributes:
+                if "Policy" in queue_attributes["Attributes"]:
+                    queue.policy = loads(queue_attributes["Attributes"]["Policy"])
+                if "KmsMasterKeyId" in queue_attributes["Attributes"]:
+                    queue.kms_key_id = queue_attributes["Attributes"]["KmsMasterKeyId"]
+                if "SqsManagedSseEnabled" in queue_attributes["Attributes"]:
+                    if queue_attributes["Attributes"]["SqsManagedSseEnabled"] == "true":
+                        queue.kms_key_id = "SqsManagedSseEnabled"
 
         except Exception as error:
             logger.error(
@@ -90,6 +92,14 @@ class SQS:
         try:
             for queue in self.queues:
                 regional_client = self.regional_clients[queue.region]
+                stored_tags = get_stored_tags(self.tag_store, queue.arn, queue.region)
+                if stored_tags is not None:
+                    queue.tags = (
+                        [{tag["Key"]: tag["Value"] for tag in stored_tags}]
+                        if stored_tags
+                        else []
+                    )
+                    continue
                 response = regional_client.list_queue_tags(QueueUrl=queue.id).get(
                     "Tags"
                 )
@@ -8,6 +8,7 @@ from prowler.lib.logger import logger
 from prowler.providers.aws.aws_provider import (
     AWS_Provider,
     assume_role,
+    get_aws_enabled_regions,
     get_checks_from_input_arn,
     get_regions_from_audit_resources,
 )
@@ -22,8 +23,12 @@ from prowler.providers.aws.lib.organizations.organizations import (
     get_organizations_metadata,
 )
 from prowler.providers.aws.lib.resource_api_tagging.resource_api_tagging import (
+    TagStore,
     get_tagged_resources,
 )
+from prowler.providers.aws.lib.resource_presence.resource_presence import (
+    get_regions_with_resources,
+)
 from prowler.providers.azure.azure_provider import Azure_Provider
 from prowler.providers.azure.lib.audit_info.audit_info import azure_audit_info
 from prowler.providers.azure.lib.audit_info.models import Azure_Audit_Info
@@ -238,6 +243,18 @@ Azure Identity Type: {Fore.YELLOW}[{audit_info.identity.identity_type}]{Style.RE
         else:
             current_audit_info.profile_region = "us-east-1"
 
+        # Get the enabled regions of the account to not audit the disabled ones
+        current_audit_info.enabled_regions = get_aws_enabled_regions(current_audit_info)
+
+        # Probe the regions with resources to skip the empty ones
+        if arguments.get("skip_empty_regions"):
+            current_audit_info.regions_with_resources = get_regions_with_resources(
+                current_audit_info
+            )
+
+        # Resources tags are retrieved once per region and shared by all the services
+        current_audit_info.tag_store = TagStore(current_audit_info)
+
         if not arguments.get("only_logs"):
             print_aws_credentials(current_audit_info)
 
@@ -3,6 +3,7 @@ import pathlib
 from importlib.machinery import FileFinder
 from pkgutil import ModuleInfo
 
+import pytest
 from boto3 import client, session
 from fixtures.bulk_checks_metadata import test_bulk_checks_metadata
 from mock import patch
@@ -21,7 +22,7 @@ from prowler.lib.check.check import (
     remove_custom_checks_module,
     update_audit_metadata,
 )
-from prowler.lib.check.models import load_check_metadata
+from prowler.lib.check.models import Check_Report_AWS, load_check_metadata
 from prowler.providers.aws.aws_provider import (
     get_checks_from_input_arn,
     get_regions_from_audit_resources,
@@ -525,3 +526,28 @@ class Test_Check:
         assert audit_metadata.services_scanned == 1
         assert audit_metadata.expected_checks == expected_checks
         assert audit_metadata.completed_checks == 1
+
+    def test_check_report_aws(self):
+        check_metadata = load_check_metadata(
+            f"{os.path.dirname(os.path.realpath(__file__))}/fixtures/metadata.json"
+        ).json()
+        tags = [{"Key": "Name", "Value": "test"}]
+        reports = []
+        for region in ["eu-west-1", "eu-west-1"]:
+            report = Check_Report_AWS(check_metadata)
+            # Build a new string each time, as the API responses do
+            report.region = "".join(region)
+            report.status = "".join("FAIL")
+            report.resource_tags = tags
+            reports.append(report)
+
+        # The metadata is parsed once and shared by all the findings of the check
+        assert reports[0].check_metadata is reports[1].check_metadata
+        # Repeated values are kept only once
+        assert reports[0].region is reports[1].region
+        assert reports[0].status is reports[1].status
+        assert reports[0].resource_tags is reports[1].resource_tags
+        # Findings are slotted, only their fields can be set
+        assert not hasattr(reports[0], "__dict__")
+        with pytest.raises(AttributeError):
+            reports[0].project_id = "test"
@@ -49,6 +49,7 @@ class Test_Parser:
         assert parsed.session_duration == 3600
         assert not parsed.external_id
         assert not parsed.region
+        assert not parsed.skip_empty_regions
         assert not parsed.organizations_role
         assert not parsed.security_hub
         assert not parsed.quick_inventory
@@ -781,6 +782,12 @@ class Test_Parser:
         assert wrapped_exit.type == SystemExit
         assert wrapped_exit.value.code == 2
 
+    def test_aws_parser_skip_empty_regions(self):
+        argument = "--skip-empty-regions"
+        command = [prowler_command, argument]
+        parsed = self.parser.parse(command)
+        assert parsed.skip_empty_regions
+
     def test_aws_parser_organizations_role_short(self):
         argument = "-O"
         organizations_role = "role_test"
@@ -24,7 +24,7 @@ from prowler.lib.check.compliance_models import (
     Compliance_Base_Model,
     Compliance_Requirement,
 )
-from prowler.lib.check.models import Check_Report, load_check_metadata
+from prowler.lib.check.models import Check_Report_AWS, load_check_metadata
 from prowler.lib.outputs.file_descriptors import fill_file_descriptors
 from prowler.lib.outputs.json import (
     fill_json_asff,
@@ -62,6 +62,7 @@ from prowler.lib.outputs.models import (
     unroll_tags,
 )
 from prowler.lib.outputs.outputs import (
+    Findings_Summary,
     extract_findings_statistics,
     send_to_s3_bucket,
     set_report_color,
@@ -389,7 +390,7 @@ class Test_Outputs:
     #         audited_regions=["eu-west-2", "eu-west-1"],
     #         organizations_metadata=None,
     #     )
-    #     finding = Check_Report(
+    #     finding = Check_Report_AWS(
     #         load_check_metadata(
     #             f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
     #         ).json()
@@ -437,7 +438,7 @@ class Test_Outputs:
             audit_resources=None,
             mfa_enabled=False,
         )
-        finding = Check_Report(
+        finding = Check_Report_AWS(
             load_check_metadata(
                 f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
             ).json()
@@ -508,14 +509,12 @@ class Test_Outputs:
             audit_resources=None,
             mfa_enabled=False,
         )
-        finding = Check_Report(
-            load_check_metadata(
-                f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
-            ).json()
+        check_metadata = load_check_metadata(
+            f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
         )
-
         # Empty the Remediation.Recomendation.URL
-        finding.check_metadata.Remediation.Recommendation.Url = ""
+        check_metadata.Remediation.Recommendation.Url = ""
+        finding = Check_Report_AWS(check_metadata.json())
 
         finding.resource_details = "Test resource details"
         finding.resource_id = "test-resource"
@@ -593,14 +592,12 @@ class Test_Outputs:
             audit_resources=None,
             mfa_enabled=False,
         )
-        finding = Check_Report(
-            load_check_metadata(
-                f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
-            ).json()
+        check_metadata = load_check_metadata(
+            f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
         )
-
         # Empty the Remediation.Recomendation.URL
-        finding.check_metadata.Remediation.Recommendation.Url = ""
+        check_metadata.Remediation.Recommendation.Url = ""
+        finding = Check_Report_AWS(check_metadata.json())
 
         finding.resource_details = "Test resource details"
         finding.resource_id = "test-resource"
@@ -824,14 +821,12 @@ class Test_Outputs:
                 "FedRAMP-Low-Revision-4": ["ac-2", "au-2", "ca-7"],
             },
         ):
-            finding = Check_Report(
-                load_check_metadata(
-                    f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
-                ).json()
+            check_metadata = load_check_metadata(
+                f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
             )
-
             # Empty the Remediation.Recomendation.URL
-            finding.check_metadata.Remediation.Recommendation.Url = ""
+            check_metadata.Remediation.Recommendation.Url = ""
+            finding = Check_Report_AWS(check_metadata.json())
 
             finding.resource_details = "Test resource details"
             finding.resource_id = "test-resource"
@@ -954,7 +949,7 @@ class Test_Outputs:
             audit_resources=None,
             mfa_enabled=False,
         )
-        finding = Check_Report(
+        finding = Check_Report_AWS(
             load_check_metadata(
                 f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
             ).json()
@@ -1275,6 +1270,56 @@ class Test_Outputs:
         assert stats["resources_count"] == 0
         assert stats["findings_count"] == 0
 
+    def test_findings_summary(self):
+        compliance = mock.MagicMock()
+        compliance.Framework = "CIS"
+        compliance.Provider = "AWS"
+        compliance.Version = "1.5"
+        requirement = mock.MagicMock()
+        requirement.Attributes = [
+            mock.MagicMock(
+                Section="2.1. Simple Storage Service (S3)", Profile="Level 1"
+            )
+        ]
+        compliance.Requirements = [requirement]
+        bulk_checks_metadata = {"s3_bucket_check": mock.MagicMock()}
+        bulk_checks_metadata["s3_bucket_check"].Compliance = [compliance]
+
+        findings = []
+        for status, severity in [("PASS", "high"), ("FAIL", "high"), ("INFO", "low")]:
+            finding = mock.MagicMock()
+            finding.status = status
+            finding.resource_id = f"test_resource_{status}"
+            finding.check_metadata.CheckID = "s3_bucket_check"
+            finding.check_metadata.ServiceName = "s3"
+            finding.check_metadata.Provider = "aws"
+            finding.check_metadata.Severity = severity
+            findings.append(finding)
+
+        findings_summary = Findings_Summary(["cis_1.5_aws"], bulk_checks_metadata)
+        # Findings are aggregated in several batches, as they are reported
+        findings_summary.add_findings(findings[:1])
+        findings_summary.add_findings(findings[1:])
+
+        assert findings_summary.statistics.get_stats() == extract_findings_statistics(
+            findings
+        )
+        summary_table = findings_summary.summary_table
+        assert summary_table.findings_count == 3
+        assert summary_table.pass_count == 1
+        assert summary_table.fail_count == 1
+        assert summary_table.services["s3"]["Total"] == 3
+        assert summary_table.services["s3"]["High"] == 1
+        assert summary_table.services["s3"]["Low"] == 0
+        compliance_table = findings_summary.compliance_tables[0]
+        assert compliance_table.framework == "CIS"
+        assert compliance_table.version == "1.5"
+        assert compliance_table.pass_count == 1
+        assert compliance_table.fail_count == 1
+        assert compliance_table.sections["2.1. Simple Storage Service (S3)"][
+            "Level 1"
+        ] == {"FAIL": 1, "PASS": 2}
+
     @mock.patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
     def test_send_to_security_hub(self):
         # Create mock session
@@ -1299,7 +1344,7 @@ class Test_Outputs:
             audit_resources=None,
             mfa_enabled=False,
         )
-        finding = Check_Report(
+        finding = Check_Report_AWS(
             load_check_metadata(
                 f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
             ).json()
@@ -1395,7 +1440,7 @@ class Test_Outputs:
             ),
         ]
 
-        finding = Check_Report(
+        finding = Check_Report_AWS(
             load_check_metadata(
                 f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
             ).json()
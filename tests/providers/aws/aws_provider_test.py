@@ -1,15 +1,20 @@
+from types import SimpleNamespace
+
 import boto3
 import sure  # noqa
 from mock import patch
-from moto import mock_iam, mock_sts
+from moto import mock_ec2, mock_iam, mock_sts
 
 from prowler.providers.aws.aws_provider import (
     AWS_Provider,
     assume_role,
     generate_regional_clients,
     get_available_aws_service_regions,
+    get_aws_enabled_regions,
     get_default_region,
     get_global_region,
+    load_aws_regions_catalog,
+    threading_call_per_resource,
 )
 from prowler.providers.aws.lib.audit_info.models import AWS_Assume_Role, AWS_Audit_Info
 
@@ -476,32 +481,28 @@ class Test_AWS_Provider:
             mfa_enabled=False,
         )
         with patch(
-            "prowler.providers.aws.aws_provider.parse_json_file",
+            "prowler.providers.aws.aws_provider.load_aws_regions_catalog",
             return_value={
-                "services": {
-                    "ec2": {
-                        "regions": {
-                            "aws": [
-                                "af-south-1",
-                                "ca-central-1",
-                                "eu-central-1",
-                                "eu-central-2",
-                                "eu-north-1",
-                                "eu-south-1",
-                                "eu-south-2",
-                                "eu-west-1",
-                                "eu-west-2",
-                                "eu-west-3",
-                                "me-central-1",
-                                "me-south-1",
-                                "sa-east-1",
-                                "us-east-1",
-                                "us-east-2",
-                                "us-west-1",
-                                "us-west-2",
-                            ],
-                        }
-                    }
+                "ec2": {
+                    "aws": [
+                        "af-south-1",
+                        "ca-central-1",
+                        "eu-central-1",
+                        "eu-central-2",
+                        "eu-north-1",
+                        "eu-south-1",
+                        "eu-south-2",
+                        "eu-west-1",
+                        "eu-west-2",
+                        "eu-west-3",
+                        "me-central-1",
+                        "me-south-1",
+                        "sa-east-1",
+                        "us-east-1",
+                        "us-east-2",
+                        "us-west-1",
+                        "us-west-2",
+                    ],
                 }
             },
         ):
@@ -527,33 +528,130 @@ class Test_AWS_Provider:
             mfa_enabled=False,
         )
         with patch(
-            "prowler.providers.aws.aws_provider.parse_json_file",
+            "prowler.providers.aws.aws_provider.load_aws_regions_catalog",
             return_value={
-                "services": {
-                    "ec2": {
-                        "regions": {
-                            "aws": [
-                                "af-south-1",
-                                "ca-central-1",
-                                "eu-central-1",
-                                "eu-central-2",
-                                "eu-north-1",
-                                "eu-south-1",
-                                "eu-south-2",
-                                "eu-west-1",
-                                "eu-west-2",
-                                "eu-west-3",
-                                "me-central-1",
-                                "me-south-1",
-                                "sa-east-1",
-                                "us-east-1",
-                                "us-east-2",
-                                "us-west-1",
-                                "us-west-2",
-                            ],
-                        }
-                    }
+                "ec2": {
+                    "aws": [
+                        "af-south-1",
+                        "ca-central-1",
+                        "eu-central-1",
+                        "eu-central-2",
+                        "eu-north-1",
+                        "eu-south-1",
+                        "eu-south-2",
+                        "eu-west-1",
+                        "eu-west-2",
+                        "eu-west-3",
+                        "me-central-1",
+                        "me-south-1",
+                        "sa-east-1",
+                        "us-east-1",
+                        "us-east-2",
+                        "us-west-1",
+                        "us-west-2",
+                    ],
                 }
             },
         ):
             assert len(get_available_aws_service_regions("ec2", audit_info)) == 17
+
+    def test_get_available_aws_service_regions_with_enabled_regions(self):
+        audit_info = AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=None,
+            audited_account=None,
+            audited_account_arn=None,
+            audited_partition="aws",
+            audited_identity_arn=None,
+            audited_user_id=None,
+            profile=None,
+            profile_region=None,
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=None,
+            organizations_metadata=None,
+            audit_resources=None,
+            mfa_enabled=False,
+            enabled_regions={"eu-west-1", "us-east-1"},
+        )
+        with patch(
+            "prowler.providers.aws.aws_provider.load_aws_regions_catalog",
+            return_value={
+                "ec2": {
+                    "aws": [
+                        "af-south-1",
+                        "eu-west-1",
+                        "me-south-1",
+                        "us-east-1",
+                    ],
+                }
+            },
+        ):
+            assert sorted(get_available_aws_service_regions("ec2", audit_info)) == [
+                "eu-west-1",
+                "us-east-1",
+            ]
+
+    def test_load_aws_regions_catalog(self):
+        catalog = load_aws_regions_catalog()
+        assert "us-east-1" in catalog["ec2"]["aws"]
+        assert "cn-north-1" in catalog["ec2"]["aws-cn"]
+        # The catalog is only parsed once
+        assert load_aws_regions_catalog() is catalog
+
+    @mock_ec2
+    def test_get_aws_enabled_regions(self):
+        audit_info = AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=boto3.session.Session(),
+            audited_account=ACCOUNT_ID,
+            audited_account_arn=None,
+            audited_partition="aws",
+            audited_identity_arn=None,
+            audited_user_id=None,
+            profile=None,
+            profile_region="us-east-1",
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=None,
+            organizations_metadata=None,
+            audit_resources=None,
+            mfa_enabled=False,
+        )
+        with patch(
+            "prowler.providers.aws.aws_provider.aws_enabled_regions_by_account",
+            new={},
+        ) as enabled_regions_by_account:
+            enabled_regions = get_aws_enabled_regions(audit_info)
+            assert "us-east-1" in enabled_regions
+            assert "eu-west-1" in enabled_regions
+            # Enabled regions are cached per account
+            assert enabled_regions_by_account[ACCOUNT_ID] == enabled_regions
+
+    def test_threading_call_per_resource(self):
+        regional_clients = {
+            "eu-west-1": SimpleNamespace(region="eu-west-1"),
+            "us-east-1": SimpleNamespace(region="us-east-1"),
+        }
+        resources = [
+            SimpleNamespace(name="resource-1", region="eu-west-1", client_region=None),
+            SimpleNamespace(name="resource-2", region="us-east-1", client_region=None),
+            SimpleNamespace(name="failing", region="us-east-1", client_region=None),
+            SimpleNamespace(name="resource-3", region="us-east-1", client_region=None),
+        ]
+
+        def call(regional_client, resource):
+            if resource.name == "failing":
+                raise Exception("failing resource")
+            resource.client_region = regional_client.region
+
+        threading_call_per_resource(call, resources, regional_clients)
+
+        # Every resource is called with the client of its region
+        assert resources[0].client_region == "eu-west-1"
+        assert resources[1].client_region == "us-east-1"
+        # An error in a resource does not stop the rest
+        assert resources[2].client_region is None
+        assert resources[3].client_region == "us-east-1"
@@ -0,0 +1,68 @@
+from json import load
+
+from prowler.providers.aws.lib.managed_policies.managed_policies import (
+    ManagedPolicyDocuments,
+    is_aws_managed_policy,
+)
+
+AWS_MANAGED_POLICY_ARN = "arn:aws:iam::aws:policy/ReadOnlyAccess"
+CUSTOM_POLICY_ARN = "arn:aws:iam::123456789012:policy/test-policy"
+POLICY_DOCUMENT = {
+    "Version": "2012-10-17",
+    "Statement": [{"Effect": "Allow", "Action": "s3:Get*", "Resource": "*"}],
+}
+
+
+class Test_Managed_Policies:
+    def test_is_aws_managed_policy(self):
+        assert is_aws_managed_policy(AWS_MANAGED_POLICY_ARN)
+        assert is_aws_managed_policy("arn:aws-cn:iam::aws:policy/ReadOnlyAccess")
+        assert not is_aws_managed_policy(CUSTOM_POLICY_ARN)
+
+    def test_add_document(self):
+        managed_policy_documents = ManagedPolicyDocuments()
+        managed_policy_documents.add_document(
+            AWS_MANAGED_POLICY_ARN, "v1", POLICY_DOCUMENT
+        )
+        # Customer managed policies are never cached
+        managed_policy_documents.add_document(CUSTOM_POLICY_ARN, "v1", POLICY_DOCUMENT)
+
+        assert (
+            managed_policy_documents.get_document(AWS_MANAGED_POLICY_ARN, "v1")
+            == POLICY_DOCUMENT
+        )
+        assert (
+            managed_policy_documents.get_document(AWS_MANAGED_POLICY_ARN, "v2") is None
+        )
+        assert managed_policy_documents.get_document(CUSTOM_POLICY_ARN, "v1") is None
+
+    def test_save_and_load(self, tmp_path):
+        cache_file = f"{tmp_path}/cache/aws_managed_policies.json"
+        managed_policy_documents = ManagedPolicyDocuments()
+        managed_policy_documents.load(cache_file)
+        managed_policy_documents.add_document(
+            AWS_MANAGED_POLICY_ARN, "v1", POLICY_DOCUMENT
+        )
+        managed_policy_documents.save()
+
+        with open(cache_file) as f:
+            assert load(f) == {AWS_MANAGED_POLICY_ARN: {"v1": POLICY_DOCUMENT}}
+
+        # A new execution reads the documents of the previous one
+        next_managed_policy_documents = ManagedPolicyDocuments()
+        next_managed_policy_documents.load(cache_file)
+        assert (
+            next_managed_policy_documents.get_document(AWS_MANAGED_POLICY_ARN, "v1")
+            == POLICY_DOCUMENT
+        )
+
+    def test_save_without_cache_file(self, tmp_path):
+        managed_policy_documents = ManagedPolicyDocuments()
+        managed_policy_documents.load(None)
+        managed_policy_documents.add_document(
+            AWS_MANAGED_POLICY_ARN, "v1", POLICY_DOCUMENT
+        )
+        managed_policy_documents.save()
+
+        assert managed_policy_documents.cache_file is None
+        assert not any(tmp_path.iterdir())
@@ -0,0 +1,157 @@
+from prowler.providers.aws.lib.policy_analysis.policy_analysis import (
+    CompiledPolicy,
+    pattern_covers,
+    patterns_overlap,
+)
+
+
+class Test_policy_analysis:
+    def test_pattern_covers(self):
+        assert pattern_covers("iam:*", "iam:putuserpolicy")
+        assert pattern_covers("iam:put*", "iam:put*policy")
+        assert pattern_covers("*", "kms:*")
+        assert not pattern_covers("kms:create*", "kms:*")
+        assert not pattern_covers("kms:?", "kms:*")
+
+    def test_patterns_overlap(self):
+        assert patterns_overlap("iam:*policy", "iam:put*")
+        assert patterns_overlap("*", "kms:decrypt")
+        assert not patterns_overlap("iam:*", "kms:*")
+        assert not patterns_overlap("iam:get*", "iam:put*")
+
+    def test_allows_wildcard_action(self):
+        policy = CompiledPolicy(
+            {
+                "Version": "2012-10-17",
+                "Statement": {
+                    "Effect": "Allow",
+                    "Action": "iam:Put*",
+                    "Resource": "*",
+                },
+            }
+        )
+        assert policy.allows("iam:PutUserPolicy")
+        assert policy.allows("IAM:putrolepolicy")
+        assert not policy.allows("iam:*")
+        assert not policy.allows("iam:CreateAccessKey")
+
+    def test_allows_not_action(self):
+        policy = CompiledPolicy(
+            {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {"Effect": "Allow", "NotAction": "iam:*", "Resource": "*"},
+                ],
+            }
+        )
+        assert policy.allows("kms:*", resource="*")
+        assert not policy.allows("iam:PassRole")
+        assert not policy.allows("*")
+
+    def test_allows_deny(self):
+        policy = CompiledPolicy(
+            {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {"Effect": "Allow", "Action": "*", "Resource": "*"},
+                    {
+                        "Effect": "Deny",
+                        "Action": "kms:ScheduleKeyDeletion",
+                        "Resource": "*",
+                    },
+                    {
+                        "Effect": "Deny",
+                        "Action": "s3:DeleteBucket",
+                        "Resource": "arn:aws:s3:::bucket",
+                    },
+                ],
+            }
+        )
+        assert policy.allows("kms:Decrypt")
+        assert not policy.allows("kms:ScheduleKeyDeletion")
+        # A deny of some of the actions does not remove the rest of them
+        assert policy.allows("kms:*")
+        assert policy.allows("*")
+        # A deny over a single resource does not remove the permission
+        assert policy.allows("s3:DeleteBucket")
+        assert not policy.allows("s3:DeleteBucket", resource="arn:aws:s3:::bucket")
+
+    def test_allows_partial_deny(self):
+        policy = CompiledPolicy(
+            {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {"Effect": "Allow", "Action": "kms:*", "Resource": "*"},
+                    {"Effect": "Deny", "Action": "kms:Schedule*", "Resource": "*"},
+                ],
+            }
+        )
+        assert policy.allows("kms:*")
+        assert policy.allows("kms:Decrypt")
+        assert not policy.allows("kms:ScheduleKeyDeletion")
+        assert not policy.allows("kms:Schedule*")
+        assert not policy.denies("kms:*")
+        assert policy.denies("kms:ScheduleKeyDeletion")
+
+    def test_allows_conditional_deny(self):
+        policy = CompiledPolicy(
+            {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {"Effect": "Allow", "Action": "iam:*", "Resource": "*"},
+                    {
+                        "Effect": "Deny",
+                        "Action": "*",
+                        "Resource": "*",
+                        "Condition": {
+                            "BoolIfExists": {"aws:MultiFactorAuthPresent": "false"}
+                        },
+                    },
+                ],
+            }
+        )
+        assert policy.allows("iam:PassRole")
+        assert policy.allows("iam:*")
+        assert not policy.denies("iam:PassRole")
+
+    def test_allows_deny_not_action(self):
+        policy = CompiledPolicy(
+            {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {
+                        "Effect": "Allow",
+                        "Action": ["lambda:*", "glue:*"],
+                        "Resource": "*",
+                    },
+                    {"Effect": "Deny", "NotAction": "glue:*", "Resource": "*"},
+                ],
+            }
+        )
+        assert policy.allowed_actions(
+            {"lambda:CreateFunction", "glue:CreateDevEndpoint", "glue:*"}
+        ) == {"glue:CreateDevEndpoint", "glue:*"}
+        assert policy.allows_any({"lambda:InvokeFunction", "glue:GetDevEndpoint"})
+        assert not policy.allows_any({"lambda:InvokeFunction"})
+
+    def test_allows_resource(self):
+        policy = CompiledPolicy(
+            {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {
+                        "Effect": "Allow",
+                        "Action": "sts:AssumeRole",
+                        "Resource": "arn:aws:iam::*:role/*",
+                    },
+                ],
+            }
+        )
+        assert policy.allows("sts:AssumeRole")
+        assert policy.allows("sts:AssumeRole", resource="arn:aws:iam::*:role/*")
+        assert not policy.allows("sts:AssumeRole", resource="*")
+
+    def test_allows_no_document(self):
+        policy = CompiledPolicy(None)
+        assert not policy.allows("*")
+        assert policy.allowed_actions({"iam:PassRole"}) == set()
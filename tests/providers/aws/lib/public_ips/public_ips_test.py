@@ -0,0 +1,75 @@
+from ipaddress import ip_network
+from unittest import mock
+
+from awsipranges import AWSIPPrefixes
+from awsipranges.models.awsipprefix import AWSIPv4Prefix, AWSIPv6Prefix
+
+from prowler.providers.aws.lib.public_ips.public_ips import (
+    IPPrefixTable,
+    PublicIPIndex,
+    download_aws_ip_ranges,
+)
+
+
+class Test_public_ips:
+    def test_ip_prefix_table(self):
+        prefix_table = IPPrefixTable(
+            [
+                ip_network("54.152.0.0/16"),
+                ip_network("3.5.140.0/22"),
+                ip_network("2600:1f18::/33"),
+            ]
+        )
+        assert "54.152.12.70" in prefix_table
+        assert "3.5.143.255" in prefix_table
+        assert "3.5.144.0" not in prefix_table
+        assert "2600:1f18::1" in prefix_table
+        assert "2600:1f19::1" not in prefix_table
+        assert "17.5.7.3" not in prefix_table
+
+    def test_public_ip_index(self):
+        aws_ip_ranges = AWSIPPrefixes(
+            ipv4_prefixes=[
+                AWSIPv4Prefix(
+                    "54.152.0.0/16",
+                    region="us-east-1",
+                    network_border_group="us-east-1",
+                    services=("EC2",),
+                )
+            ],
+            ipv6_prefixes=[
+                AWSIPv6Prefix(
+                    "2600:1f18::/33",
+                    region="us-east-1",
+                    network_border_group="us-east-1",
+                    services=("EC2",),
+                )
+            ],
+        )
+        download_aws_ip_ranges.cache_clear()
+        with mock.patch(
+            "prowler.providers.aws.lib.public_ips.public_ips.awsipranges.get_ranges",
+            return_value=aws_ip_ranges,
+        ) as get_ranges:
+            public_ips = PublicIPIndex(["54.152.12.70"])
+            assert public_ips.belongs_to_account("54.152.12.70")
+            assert not public_ips.belongs_to_account("54.152.12.71")
+            assert public_ips.belongs_to_aws("54.152.12.71")
+            assert not public_ips.belongs_to_aws("17.5.7.3")
+            # The AWS IP ranges are downloaded only once
+            get_ranges.assert_called_once()
+        download_aws_ip_ranges.cache_clear()
+
+    def test_public_ip_index_aws_ip_ranges_download_error(self):
+        download_aws_ip_ranges.cache_clear()
+        with mock.patch(
+            "prowler.providers.aws.lib.public_ips.public_ips.awsipranges.get_ranges",
+            side_effect=Exception("Connection error"),
+        ) as get_ranges:
+            public_ips = PublicIPIndex([])
+            # The AWS IP ranges are unknown, not empty
+            assert public_ips.belongs_to_aws("54.152.12.71") is None
+            # A failed download is not cached
+            assert public_ips.belongs_to_aws("54.152.12.71") is None
+            assert get_ranges.call_count == 2
+        download_aws_ip_ranges.cache_clear()
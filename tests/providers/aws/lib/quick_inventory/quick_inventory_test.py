@@ -0,0 +1,126 @@
+import csv
+import json
+from argparse import Namespace
+
+from boto3 import client, session
+from colorama import Fore, Style
+from moto import mock_iam, mock_resourcegroupstaggingapi, mock_s3
+
+from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.lib.quick_inventory.quick_inventory import (
+    QuickInventoryOutput,
+    create_inventory_table,
+    quick_inventory,
+)
+
+AWS_ACCOUNT_NUMBER = "123456789012"
+AWS_REGION = "us-east-1"
+
+
+class Test_quick_inventory:
+    def set_mocked_audit_info(self):
+        audit_info = AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=session.Session(
+                profile_name=None,
+                botocore_session=None,
+            ),
+            audited_account=AWS_ACCOUNT_NUMBER,
+            audited_account_arn=f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:root",
+            audited_user_id=None,
+            audited_partition="aws",
+            audited_identity_arn=None,
+            profile=None,
+            profile_region=AWS_REGION,
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=[AWS_REGION, "eu-west-1"],
+            organizations_metadata=None,
+            audit_resources=None,
+            mfa_enabled=False,
+        )
+        return audit_info
+
+    @mock_iam
+    @mock_s3
+    @mock_resourcegroupstaggingapi
+    def test_quick_inventory(self, tmp_path):
+        client("iam").create_user(UserName="test-user")
+        s3_client = client("s3", region_name=AWS_REGION)
+        s3_client.create_bucket(Bucket="test-bucket")
+        s3_client.put_bucket_tagging(
+            Bucket="test-bucket",
+            Tagging={"TagSet": [{"Key": "test", "Value": "test"}]},
+        )
+        args = Namespace(
+            output_directory=str(tmp_path),
+            output_bucket=None,
+            output_bucket_no_assume=None,
+        )
+
+        quick_inventory(self.set_mocked_audit_info(), args)
+
+        json_files = list(tmp_path.glob("*.json"))
+        csv_files = list(tmp_path.glob("*.csv"))
+        assert len(json_files) == 1
+        assert len(csv_files) == 1
+        # Moto keeps the resources of the backends that are not mocked in this test
+        with open(json_files[0]) as json_file:
+            resources = sorted(
+                (
+                    resource
+                    for resource in json.load(json_file)
+                    if resource["AWS_ResourceARN"].split(":")[2] in ("iam", "s3")
+                ),
+                key=lambda resource: resource["AWS_ResourceARN"],
+            )
+        assert [resource["AWS_ResourceARN"] for resource in resources] == [
+            f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:user/test-user",
+            f"arn:aws:s3:{AWS_REGION}::test-bucket",
+        ]
+        assert resources[1]["AWS_ResourceType"] == "bucket"
+        assert resources[1]["AWS_ResourceID"] == "test-bucket"
+        assert resources[1]["AWS_Tags"] == [{"Key": "test", "Value": "test"}]
+        with open(csv_files[0], newline="") as csv_file:
+            rows = list(csv.DictReader(csv_file))
+        assert sorted(
+            row["AWS_ResourceARN"]
+            for row in rows
+            if row["AWS_ResourceARN"].split(":")[2] in ("iam", "s3")
+        ) == [resource["AWS_ResourceARN"] for resource in resources]
+
+    def test_quick_inventory_output_counters(self, tmp_path):
+        inventory = QuickInventoryOutput(AWS_ACCOUNT_NUMBER, str(tmp_path), "test")
+        inventory.add_resource(f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:role/test", [])
+        inventory.add_resource(f"arn:aws:s3:{AWS_REGION}::test-bucket", [])
+        inventory.add_resource(
+            f"arn:aws:ec2:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:instance/i-1234", []
+        )
+        inventory.close()
+
+        assert inventory.total_resources == 3
+        assert inventory.resources_per_region == {"global": 1, AWS_REGION: 2}
+        assert inventory.resources_type == {
+            "iam": {"role": {"global": 1}},
+            "s3": {"bucket": {AWS_REGION: 1}},
+            "ec2": {"instance": {AWS_REGION: 1}},
+        }
+        with open(tmp_path / "test.json") as json_file:
+            assert len(json.load(json_file)) == 3
+
+        inventory_table = create_inventory_table(
+            inventory.resources_type, inventory.resources_per_region
+        )
+        assert inventory_table["Service"] == ["ec2", "iam", "s3"]
+        assert inventory_table[f"{AWS_REGION}\n({Fore.GREEN}2{Style.RESET_ALL})"] == [
+            f"{Fore.GREEN}1{Style.RESET_ALL}\n",
+            "-\n",
+            f"{Fore.GREEN}1{Style.RESET_ALL}\n",
+        ]
+
+    def test_quick_inventory_output_empty(self, tmp_path):
+        inventory = QuickInventoryOutput(AWS_ACCOUNT_NUMBER, str(tmp_path), "test")
+        inventory.close()
+        with open(tmp_path / "test.json") as json_file:
+            assert json.load(json_file) == []
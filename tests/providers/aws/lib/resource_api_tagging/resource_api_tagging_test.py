@@ -0,0 +1,138 @@
+import boto3
+from mock import MagicMock, patch
+from moto import mock_kms, mock_resourcegroupstaggingapi
+
+from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.lib.resource_api_tagging.resource_api_tagging import (
+    TagStore,
+    get_stored_tags,
+)
+from prowler.providers.common.models import Audit_Metadata
+
+AWS_ACCOUNT_NUMBER = "123456789012"
+AWS_REGION = "us-east-1"
+
+
+class Test_Resource_API_Tagging:
+    def set_mocked_audit_info(self):
+        audit_info = AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=boto3.session.Session(
+                profile_name=None,
+                botocore_session=None,
+            ),
+            audited_account=AWS_ACCOUNT_NUMBER,
+            audited_account_arn=f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:root",
+            audited_user_id=None,
+            audited_partition="aws",
+            audited_identity_arn=None,
+            profile=None,
+            profile_region=AWS_REGION,
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=[AWS_REGION],
+            organizations_metadata=None,
+            audit_resources=None,
+            mfa_enabled=False,
+        )
+        return audit_info
+
+    @mock_resourcegroupstaggingapi
+    @mock_kms
+    def test_tag_store_get_tags(self):
+        kms_client = boto3.client("kms", region_name=AWS_REGION)
+        tagged_key = kms_client.create_key(
+            Tags=[{"TagKey": "test", "TagValue": "test"}]
+        )["KeyMetadata"]
+        untagged_key = kms_client.create_key()["KeyMetadata"]
+
+        tag_store = TagStore(self.set_mocked_audit_info())
+
+        assert tag_store.get_tags(tagged_key["Arn"], AWS_REGION) == [
+            {"Key": "test", "Value": "test"}
+        ]
+        assert tag_store.get_tags(untagged_key["Arn"], AWS_REGION) == []
+
+    @mock_resourcegroupstaggingapi
+    def test_tag_store_region_is_filled_once(self):
+        tag_store = TagStore(self.set_mocked_audit_info())
+        with patch.object(
+            tag_store, "__get_resources__", wraps=tag_store.__get_resources__
+        ) as get_resources:
+            tag_store.get_tags(
+                f"arn:aws:sns:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:topic-1", AWS_REGION
+            )
+            tag_store.get_tags(
+                f"arn:aws:sns:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:topic-2", AWS_REGION
+            )
+
+        get_resources.assert_called_once_with(AWS_REGION, {"sns"})
+        assert AWS_REGION in tag_store.regions
+
+    def test_tag_store_audited_resource_types(self):
+        audit_info = self.set_mocked_audit_info()
+        audit_info.audit_metadata = Audit_Metadata(
+            services_scanned=0,
+            expected_checks=[
+                "sns_topics_not_publicly_accessible",
+                "cloudwatch_log_group_kms_encryption_enabled",
+                "iam_root_mfa_enabled",
+            ],
+            completed_checks=0,
+            audit_progress=0,
+        )
+        audit_info.audit_session = MagicMock()
+        regional_client = audit_info.audit_session.client.return_value
+        regional_client.get_paginator.return_value.paginate.return_value = [
+            {"ResourceTagMappingList": []}
+        ]
+
+        tag_store = TagStore(audit_info)
+        tag_store.get_tags(
+            f"arn:aws:sns:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:topic", AWS_REGION
+        )
+        tag_store.get_tags(
+            f"arn:aws:logs:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:log-group:test",
+            AWS_REGION,
+        )
+        # Only the resource types of the audited services are retrieved, in one fill
+        regional_client.get_paginator.return_value.paginate.assert_called_once_with(
+            ResourceTypeFilters=["cloudwatch", "logs", "sns"]
+        )
+
+        # A resource type not audited is added to the region the first time it is read
+        tag_store.get_tags(
+            f"arn:aws:cloudtrail:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:trail/test",
+            AWS_REGION,
+        )
+        tag_store.get_tags(
+            f"arn:aws:cloudtrail:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:trail/other",
+            AWS_REGION,
+        )
+        assert regional_client.get_paginator.return_value.paginate.call_count == 2
+        regional_client.get_paginator.return_value.paginate.assert_called_with(
+            ResourceTypeFilters=["cloudtrail"]
+        )
+
+    def test_tag_store_region_error(self):
+        audit_info = self.set_mocked_audit_info()
+        audit_info.audit_session = MagicMock()
+        audit_info.audit_session.client.side_effect = Exception("AccessDenied")
+
+        tag_store = TagStore(audit_info)
+
+        assert (
+            tag_store.get_tags(
+                f"arn:aws:sns:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:topic", AWS_REGION
+            )
+            is None
+        )
+
+    def test_get_stored_tags_without_tag_store(self):
+        assert (
+            get_stored_tags(
+                None, f"arn:aws:sns:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:topic", AWS_REGION
+            )
+            is None
+        )
@@ -0,0 +1,150 @@
+import boto3
+from mock import MagicMock, patch
+from moto import mock_dynamodb, mock_resourcegroupstaggingapi, mock_sns, mock_sqs
+
+from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.lib.resource_presence.resource_presence import (
+    client_creation_lock,
+    get_indexed_resource_types,
+    get_regions_with_resources,
+    prunable_regional_services,
+    service_has_listed_resources,
+)
+
+AWS_ACCOUNT_NUMBER = "123456789012"
+AWS_REGION_EU_WEST_1 = "eu-west-1"
+AWS_REGION_US_EAST_1 = "us-east-1"
+
+
+class Test_Resource_Presence:
+    def set_mocked_audit_info(self):
+        audit_info = AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=boto3.session.Session(
+                profile_name=None,
+                botocore_session=None,
+            ),
+            audited_account=AWS_ACCOUNT_NUMBER,
+            audited_account_arn=f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:root",
+            audited_user_id=None,
+            audited_partition="aws",
+            audited_identity_arn=None,
+            profile=None,
+            profile_region=AWS_REGION_US_EAST_1,
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=[AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1],
+            organizations_metadata=None,
+            audit_resources=None,
+            mfa_enabled=False,
+        )
+        return audit_info
+
+    @mock_resourcegroupstaggingapi
+    @mock_sqs
+    @mock_sns
+    @mock_dynamodb
+    def test_get_regions_with_resources(self):
+        # Tagged queue found by the resourcegroupstaggingapi
+        sqs_client = boto3.client("sqs", region_name=AWS_REGION_EU_WEST_1)
+        sqs_client.create_queue(QueueName="queue", tags={"test": "test"})
+        # Untagged table confirmed with a list call
+        dynamodb_client = boto3.client("dynamodb", region_name=AWS_REGION_US_EAST_1)
+        dynamodb_client.create_table(
+            TableName="table",
+            AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+            KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+
+        audit_info = self.set_mocked_audit_info()
+        # Probe only the mocked services
+        with patch(
+            "prowler.providers.aws.lib.resource_presence.resource_presence.prunable_regional_services",
+            new={
+                service: prunable_regional_services[service]
+                for service in ["dynamodb", "sns", "sqs"]
+            },
+        ):
+            regions_with_resources = get_regions_with_resources(audit_info)
+
+        assert regions_with_resources["sqs"] == {AWS_REGION_EU_WEST_1}
+        assert regions_with_resources["dynamodb"] == {AWS_REGION_US_EAST_1}
+        assert regions_with_resources["sns"] == set()
+
+    @mock_resourcegroupstaggingapi
+    @mock_sns
+    def test_get_regions_with_resources_region_not_probed(self):
+        audit_info = self.set_mocked_audit_info()
+        tagging_client = boto3.client(
+            "resourcegroupstaggingapi", region_name=AWS_REGION_EU_WEST_1
+        )
+        tagging_client.region = AWS_REGION_EU_WEST_1
+        # The resourcegroupstaggingapi client of us-east-1 cannot be created
+        with patch(
+            "prowler.providers.aws.lib.resource_presence.resource_presence.prunable_regional_services",
+            new={"sns": prunable_regional_services["sns"]},
+        ), patch(
+            "prowler.providers.aws.lib.resource_presence.resource_presence.generate_regional_clients",
+            return_value={AWS_REGION_EU_WEST_1: tagging_client},
+        ):
+            regions_with_resources = get_regions_with_resources(audit_info)
+
+        assert regions_with_resources["sns"] == {AWS_REGION_US_EAST_1}
+
+    def test_get_indexed_resource_types(self):
+        resource_explorer_client = MagicMock()
+        resource_explorer_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "Resources": [
+                    {"Service": "dynamodb", "ResourceType": "dynamodb:table"},
+                ]
+            }
+        ]
+
+        present_resource_types = get_indexed_resource_types(
+            resource_explorer_client,
+            AWS_REGION_EU_WEST_1,
+            {"dynamodb:table", "dax:cache", "sqs"},
+        )
+
+        assert present_resource_types == {"dynamodb", "dynamodb:table"}
+        # Only service filters, since filters of different types are ANDed
+        resource_explorer_client.get_paginator.return_value.paginate.assert_called_once_with(
+            QueryString=f"region:{AWS_REGION_EU_WEST_1} service:dax service:dynamodb service:sqs"
+        )
+
+    def test_service_has_listed_resources_client_creation_locked(self):
+        audit_info = MagicMock()
+        client = MagicMock()
+        client.list_topics.return_value = {"Topics": [{"TopicArn": "topic"}]}
+
+        def create_client(*args, **kwargs):
+            # The session is not used by more than one thread at a time
+            assert client_creation_lock.locked()
+            return client
+
+        audit_info.audit_session.client.side_effect = create_client
+
+        assert service_has_listed_resources(audit_info, "sns", AWS_REGION_EU_WEST_1)
+        audit_info.audit_session.client.assert_called_once()
+        assert not client_creation_lock.locked()
+
+    def test_generate_regional_clients_with_regions_with_resources(self):
+        audit_info = self.set_mocked_audit_info()
+        audit_info.regions_with_resources = {
+            "sqs": {AWS_REGION_EU_WEST_1},
+            "sns": set(),
+        }
+
+        assert list(generate_regional_clients("sqs", audit_info).keys()) == [
+            AWS_REGION_EU_WEST_1
+        ]
+        assert generate_regional_clients("sns", audit_info) == {}
+        # Services not probed are not pruned
+        assert set(generate_regional_clients("guardduty", audit_info).keys()) == {
+            AWS_REGION_EU_WEST_1,
+            AWS_REGION_US_EAST_1,
+        }
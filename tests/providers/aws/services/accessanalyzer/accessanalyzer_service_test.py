@@ -41,19 +41,16 @@ def mock_make_api_call(self, operation_name, kwarg):
             ]
         }
     if operation_name == "ListFindings":
-        # If we only want to count the number of findings
-        # we return a list of values just to count them
+        # Only the active findings are listed
+        assert kwarg["filter"] == {"status": {"eq": ["ACTIVE"]}}
         return {
             "findings": [
                 {
                     "id": "test_id1",
+                    "status": "ACTIVE",
                 }
             ]
         }
-    if operation_name == "GetFinding":
-        # If we only want to count the number of findings
-        # we return a list of values just to count them
-        return {"finding": {"id": "test_id1", "status": "ARCHIVED"}}
     return make_api_call(self, operation_name, kwarg)
 
 
@@ -126,5 +123,5 @@ class Test_AccessAnalyzer_Service:
         access_analyzer = AccessAnalyzer(self.set_mocked_audit_info())
         assert len(access_analyzer.analyzers) == 1
         assert len(access_analyzer.analyzers[0].findings) == 1
-        assert access_analyzer.analyzers[0].findings[0].status == "ARCHIVED"
+        assert access_analyzer.analyzers[0].findings[0].status == "ACTIVE"
         assert access_analyzer.analyzers[0].findings[0].id == "test_id1"
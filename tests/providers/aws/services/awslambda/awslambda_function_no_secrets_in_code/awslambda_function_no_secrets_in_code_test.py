@@ -1,9 +1,8 @@
-import zipfile
 from unittest import mock
 
-from awslambda_service_test import create_zip_file
 from moto.core import DEFAULT_ACCOUNT_ID
 
+from prowler.lib.utils.utils import scan_secrets_in_memory
 from prowler.providers.aws.services.awslambda.awslambda_service import (
     Function,
     LambdaCode,
@@ -52,7 +51,10 @@ class Test_awslambda_function_no_secrets_in_code:
                 runtime=function_runtime,
                 code=LambdaCode(
                     location="",
-                    code_zip=zipfile.ZipFile(create_zip_file(code_with_secrets)),
+                    sha256="",
+                    secrets={
+                        "lambda_function.py": scan_secrets_in_memory(code_with_secrets)
+                    },
                 ),
             )
         }
@@ -86,21 +88,13 @@ class Test_awslambda_function_no_secrets_in_code:
         function_arn = (
             f"arn:aws:lambda:{AWS_REGION}:{DEFAULT_ACCOUNT_ID}:function/{function_name}"
         )
-        code_with_secrets = """
-        def lambda_handler(event, context):
-                print("custom log event")
-                return event
-        """
         lambda_client.functions = {
             "function_name": Function(
                 name=function_name,
                 arn=function_arn,
                 region=AWS_REGION,
                 runtime=function_runtime,
-                code=LambdaCode(
-                    location="",
-                    code_zip=zipfile.ZipFile(create_zip_file(code_with_secrets)),
-                ),
+                code=LambdaCode(location="", sha256="", secrets={}),
             )
         }
 
@@ -125,3 +119,44 @@ class Test_awslambda_function_no_secrets_in_code:
                 result[0].status_extended
                 == f"No secrets found in Lambda function {function_name} code"
             )
+
+    def test_function_code_not_scanned(self):
+        lambda_client = mock.MagicMock
+        function_name = "test-lambda"
+        function_runtime = "nodejs4.3"
+        function_arn = (
+            f"arn:aws:lambda:{AWS_REGION}:{DEFAULT_ACCOUNT_ID}:function/{function_name}"
+        )
+        lambda_client.functions = {
+            "function_name": Function(
+                name=function_name,
+                arn=function_arn,
+                region=AWS_REGION,
+                runtime=function_runtime,
+                code=LambdaCode(
+                    location="",
+                    sha256="",
+                    not_scanned_reason="the code is larger than 50 MB",
+                ),
+            )
+        }
+
+        with mock.patch(
+            "prowler.providers.aws.services.awslambda.awslambda_service.Lambda",
+            new=lambda_client,
+        ):
+            # Test Check
+            from prowler.providers.aws.services.awslambda.awslambda_function_no_secrets_in_code.awslambda_function_no_secrets_in_code import (
+                awslambda_function_no_secrets_in_code,
+            )
+
+            check = awslambda_function_no_secrets_in_code()
+            result = check.execute()
+
+            assert len(result) == 1
+            assert result[0].resource_id == function_name
+            assert result[0].status == "INFO"
+            assert (
+                result[0].status_extended
+                == f"Lambda function {function_name} code was not scanned for secrets since the code is larger than 50 MB"
+            )
@@ -1,11 +1,10 @@
 import io
-import os
-import tempfile
 import zipfile
 from re import search
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import mock
+import requests
 from boto3 import client, resource, session
 from moto import mock_iam, mock_lambda, mock_s3
 from moto.core import DEFAULT_ACCOUNT_ID
@@ -38,11 +37,13 @@ def create_zip_file(code: str = "") -> io.BytesIO:
     return zip_output
 
 
-def mock_request_get(_):
-    """Mock requests.get() to get the Lambda Code in Zip Format"""
-    mock_resp = mock.MagicMock
+def mock_session_get(*_, **__):
+    """Mock requests.Session.get() to stream the Lambda Code in Zip Format"""
+    code_zip = create_zip_file().read()
+    mock_resp = mock.MagicMock()
     mock_resp.status_code = 200
-    mock_resp.content = create_zip_file().read()
+    mock_resp.headers = {"Content-Length": str(len(code_zip))}
+    mock_resp.iter_content.return_value = [code_zip]
     return mock_resp
 
 
@@ -217,8 +218,11 @@ class Test_Lambda_Service:
         lambda_arn_2 = resp_2["FunctionArn"]
 
         with mock.patch(
-            "prowler.providers.aws.services.awslambda.awslambda_service.requests.get",
-            new=mock_request_get,
+            "prowler.providers.aws.services.awslambda.awslambda_service.requests.Session.get",
+            side_effect=mock_session_get,
+        ) as session_get, mock.patch.dict(
+            "prowler.providers.aws.services.awslambda.awslambda_service.lambda_code_secrets",
+            clear=True,
         ):
             awslambda = Lambda(self.set_mocked_audit_info())
             assert awslambda.functions
@@ -256,22 +260,10 @@ class Test_Lambda_Service:
 
             assert awslambda.functions[lambda_arn_1].tags == [{"test": "test"}]
 
-            # Pending ZipFile tests
-            with tempfile.TemporaryDirectory() as tmp_dir_name:
-                awslambda.functions[lambda_arn_1].code.code_zip.extractall(tmp_dir_name)
-                files_in_zip = next(os.walk(tmp_dir_name))[2]
-                assert len(files_in_zip) == 1
-                assert files_in_zip[0] == "lambda_function.py"
-                with open(f"{tmp_dir_name}/{files_in_zip[0]}", "r") as lambda_code_file:
-                    _ = lambda_code_file
-                    # assert (
-                    #     lambda_code_file.read()
-                    #     == """
-                    # def lambda_handler(event, context):
-                    # print("custom log event")
-                    # return event
-                    # """
-                    # )
+            # Both functions share the same code, so it is downloaded once
+            session_get.assert_called_once()
+            assert awslambda.functions[lambda_arn_1].code.secrets == {}
+            assert awslambda.functions[lambda_arn_1].code.sha256 == resp["CodeSha256"]
 
             # Lambda 2
             assert awslambda.functions[lambda_arn_2].name == lambda_name
@@ -293,3 +285,185 @@ class Test_Lambda_Service:
                 f"s3://awslambda-{AWS_REGION_NORTH_VIRGINIA}-tasks.s3-{AWS_REGION_NORTH_VIRGINIA}.amazonaws.com",
                 awslambda.functions[lambda_arn_2].code.location,
             )
+
+    @mock_lambda
+    @mock_iam
+    def test__get_functions_code__bigger_than_limit(self):
+        iam_client = client("iam", region_name=AWS_REGION)
+        iam_role = iam_client.create_role(
+            RoleName="test-lambda-role",
+            AssumeRolePolicyDocument="test-policy",
+            Path="/",
+        )["Role"]["Arn"]
+        lambda_client = client("lambda", region_name=AWS_REGION)
+        lambda_arn = lambda_client.create_function(
+            FunctionName="test-lambda",
+            Runtime="python3.7",
+            Role=iam_role,
+            Handler="lambda_function.lambda_handler",
+            Code={"ZipFile": create_zip_file().read()},
+            PackageType="ZIP",
+        )["FunctionArn"]
+
+        with mock.patch(
+            "prowler.providers.aws.services.awslambda.awslambda_service.requests.Session.get",
+            side_effect=mock_session_get,
+        ), mock.patch.dict(
+            "prowler.providers.aws.services.awslambda.awslambda_service.lambda_code_secrets",
+            clear=True,
+        ), mock.patch(
+            "prowler.providers.aws.services.awslambda.awslambda_service.get_config_var",
+            return_value=0,
+        ):
+            awslambda = Lambda(self.set_mocked_audit_info())
+            assert len(awslambda.functions) == 1
+            # Code above max_lambda_code_size_in_mb is not scanned
+            assert awslambda.functions[lambda_arn].code.secrets == {}
+            assert (
+                awslambda.functions[lambda_arn].code.not_scanned_reason
+                == "the code is larger than 0 MB"
+            )
+
+    @mock_lambda
+    @mock_iam
+    def test__get_functions_code__download_error(self):
+        iam_client = client("iam", region_name=AWS_REGION)
+        iam_role = iam_client.create_role(
+            RoleName="test-lambda-role",
+            AssumeRolePolicyDocument="test-policy",
+            Path="/",
+        )["Role"]["Arn"]
+        lambda_client = client("lambda", region_name=AWS_REGION)
+        lambda_arn = lambda_client.create_function(
+            FunctionName="test-lambda",
+            Runtime="python3.7",
+            Role=iam_role,
+            Handler="lambda_function.lambda_handler",
+            Code={"ZipFile": create_zip_file().read()},
+            PackageType="ZIP",
+        )["FunctionArn"]
+
+        with mock.patch(
+            "prowler.providers.aws.services.awslambda.awslambda_service.requests.Session.get",
+            side_effect=ConnectionError("Connection reset"),
+        ), mock.patch.dict(
+            "prowler.providers.aws.services.awslambda.awslambda_service.lambda_code_secrets",
+            clear=True,
+        ) as lambda_code_secrets:
+            awslambda = Lambda(self.set_mocked_audit_info())
+            assert len(awslambda.functions) == 1
+            assert awslambda.functions[lambda_arn].code.secrets == {}
+            assert (
+                awslambda.functions[lambda_arn].code.not_scanned_reason
+                == "the code could not be downloaded or unzipped (ConnectionError)"
+            )
+            # The code that could not be scanned is not cached
+            assert lambda_code_secrets == {}
+
+    @mock_lambda
+    @mock_iam
+    def test__get_functions_code__download_error_without_credentials(self):
+        iam_client = client("iam", region_name=AWS_REGION)
+        iam_role = iam_client.create_role(
+            RoleName="test-lambda-role",
+            AssumeRolePolicyDocument="test-policy",
+            Path="/",
+        )["Role"]["Arn"]
+        lambda_client = client("lambda", region_name=AWS_REGION)
+        lambda_arn = lambda_client.create_function(
+            FunctionName="test-lambda",
+            Runtime="python3.7",
+            Role=iam_role,
+            Handler="lambda_function.lambda_handler",
+            Code={"ZipFile": create_zip_file().read()},
+            PackageType="ZIP",
+        )["FunctionArn"]
+
+        def mock_session_get_forbidden(code_location, **_):
+            presigned_url = f"{code_location}?X-Amz-Security-Token=secret-token&X-Amz-Signature=secret-signature"
+            mock_resp = mock.MagicMock()
+            mock_resp.raise_for_status.side_effect = requests.HTTPError(
+                f"403 Client Error: Forbidden for url: {presigned_url}"
+            )
+            return mock_resp
+
+        with mock.patch(
+            "prowler.providers.aws.services.awslambda.awslambda_service.requests.Session.get",
+            side_effect=mock_session_get_forbidden,
+        ), mock.patch.dict(
+            "prowler.providers.aws.services.awslambda.awslambda_service.lambda_code_secrets",
+            clear=True,
+        ), mock.patch(
+            "prowler.providers.aws.services.awslambda.awslambda_service.logger"
+        ) as logger:
+            awslambda = Lambda(self.set_mocked_audit_info())
+
+        with mock.patch(
+            "prowler.providers.aws.services.awslambda.awslambda_service.Lambda",
+            new=MagicMock,
+        ), mock.patch(
+            "prowler.providers.aws.services.awslambda.awslambda_function_no_secrets_in_code.awslambda_function_no_secrets_in_code.awslambda_client",
+            new=awslambda,
+        ):
+            from prowler.providers.aws.services.awslambda.awslambda_function_no_secrets_in_code.awslambda_function_no_secrets_in_code import (
+                awslambda_function_no_secrets_in_code,
+            )
+
+            result = awslambda_function_no_secrets_in_code().execute()
+
+        assert len(result) == 1
+        assert result[0].resource_arn == lambda_arn
+        assert result[0].status == "INFO"
+        assert (
+            result[0].status_extended
+            == "Lambda function test-lambda code was not scanned for secrets since the code could not be downloaded or unzipped (HTTPError)"
+        )
+        # The presigned URL credentials are neither reported nor logged
+        for log_call in logger.error.call_args_list:
+            assert "secret-token" not in str(log_call)
+            assert "secret-signature" not in str(log_call)
+
+    @mock_lambda
+    @mock_iam
+    def test__get_functions_code__only_top_level_files(self):
+        iam_client = client("iam", region_name=AWS_REGION)
+        iam_role = iam_client.create_role(
+            RoleName="test-lambda-role",
+            AssumeRolePolicyDocument="test-policy",
+            Path="/",
+        )["Role"]["Arn"]
+        lambda_client = client("lambda", region_name=AWS_REGION)
+        lambda_arn = lambda_client.create_function(
+            FunctionName="test-lambda",
+            Runtime="python3.7",
+            Role=iam_role,
+            Handler="lambda_function.lambda_handler",
+            Code={"ZipFile": create_zip_file().read()},
+            PackageType="ZIP",
+        )["FunctionArn"]
+
+        def mock_session_get_vendored_code(*_, **__):
+            zip_output = io.BytesIO()
+            with zipfile.ZipFile(zip_output, "w", zipfile.ZIP_DEFLATED) as zip_file:
+                zip_file.writestr("lambda_function.py", 'db_password = "test-password"')
+                zip_file.writestr(
+                    "node_modules/library/index.js", 'db_password = "test-password"'
+                )
+            code_zip = zip_output.getvalue()
+            mock_resp = mock.MagicMock()
+            mock_resp.headers = {"Content-Length": str(len(code_zip))}
+            mock_resp.iter_content.return_value = [code_zip]
+            return mock_resp
+
+        with mock.patch(
+            "prowler.providers.aws.services.awslambda.awslambda_service.requests.Session.get",
+            side_effect=mock_session_get_vendored_code,
+        ), mock.patch.dict(
+            "prowler.providers.aws.services.awslambda.awslambda_service.lambda_code_secrets",
+            clear=True,
+        ):
+            awslambda = Lambda(self.set_mocked_audit_info())
+            # Files in directories, like vendored dependencies, are not scanned
+            assert list(awslambda.functions[lambda_arn].code.secrets) == [
+                "lambda_function.py"
+            ]
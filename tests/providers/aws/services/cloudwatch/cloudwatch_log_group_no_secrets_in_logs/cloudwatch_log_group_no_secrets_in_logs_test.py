@@ -6,6 +6,7 @@ from moto import mock_logs
 from moto.core.utils import unix_time_millis
 
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.services.cloudwatch.cloudwatch_service import LogGroup
 
 AWS_REGION = "us-east-1"
 AWS_ACCOUNT_NUMBER = "123456789012"
@@ -172,3 +173,53 @@ class Test_cloudwatch_log_group_no_secrets_in_logs:
                 "Potential secrets found in log group", result[0].status_extended
             )
             assert result[0].resource_id == "test"
+
+    def test_cloudwatch_log_group_sampling_states(self):
+        logs_client = mock.MagicMock
+        log_groups_sampling = {
+            "truncated": "TRUNCATED",
+            "skipped": "SKIPPED",
+            "error": "ERROR",
+        }
+        logs_client.log_groups = [
+            LogGroup(
+                arn=f"arn:aws:logs:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:log-group:{name}",
+                name=name,
+                retention_days=9999,
+                never_expire=True,
+                kms_id=None,
+                region=AWS_REGION,
+                events_sampling=events_sampling,
+                sampled_events=1000 if events_sampling == "TRUNCATED" else 0,
+            )
+            for name, events_sampling in log_groups_sampling.items()
+        ]
+
+        with mock.patch(
+            "prowler.providers.aws.services.cloudwatch.cloudwatch_log_group_no_secrets_in_logs.cloudwatch_log_group_no_secrets_in_logs.logs_client",
+            new=logs_client,
+        ):
+            # Test Check
+            from prowler.providers.aws.services.cloudwatch.cloudwatch_log_group_no_secrets_in_logs.cloudwatch_log_group_no_secrets_in_logs import (
+                cloudwatch_log_group_no_secrets_in_logs,
+            )
+
+            check = cloudwatch_log_group_no_secrets_in_logs()
+            result = check.execute()
+
+            assert len(result) == 3
+            assert result[0].status == "PASS"
+            assert (
+                result[0].status_extended
+                == "No secrets found in the 1000 sampled log events of truncated log group, the rest of its events were not scanned."
+            )
+            assert result[1].status == "INFO"
+            assert (
+                result[1].status_extended
+                == "Log group skipped was not scanned for secrets since it has no log events in the sampling period."
+            )
+            assert result[2].status == "INFO"
+            assert (
+                result[2].status_extended
+                == "Log group error was not scanned for secrets since its log events could not be retrieved."
+            )
@@ -1,10 +1,15 @@
+import threading
+from unittest import mock
+
 from boto3 import client, session
 from moto import mock_cloudwatch, mock_logs
+from moto.core.utils import unix_time_millis
 
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.aws.services.cloudwatch.cloudwatch_service import (
     CloudWatch,
     Logs,
+    scan_log_groups_streams,
 )
 from prowler.providers.common.models import Audit_Metadata
 
@@ -229,3 +234,148 @@ class Test_CloudWatch_Service:
         assert logs.log_groups[0].tags == [
             {"tag_key_1": "tag_value_1", "tag_key_2": "tag_value_2"}
         ]
+
+    @mock_logs
+    def test__get_log_events__(self):
+        logs_client = client("logs", region_name=AWS_REGION)
+        logs_client.create_log_group(logGroupName="/log-group/test")
+        logs_client.create_log_stream(
+            logGroupName="/log-group/test", logStreamName="test-stream"
+        )
+        logs_client.create_log_stream(
+            logGroupName="/log-group/test", logStreamName="test-stream-clean"
+        )
+        logs_client.put_log_events(
+            logGroupName="/log-group/test",
+            logStreamName="test-stream",
+            logEvents=[
+                {
+                    "timestamp": int(unix_time_millis()),
+                    "message": "password = password123",
+                },
+            ],
+        )
+        logs_client.put_log_events(
+            logGroupName="/log-group/test",
+            logStreamName="test-stream-clean",
+            logEvents=[
+                {"timestamp": int(unix_time_millis()), "message": "no secrets here"},
+            ],
+        )
+        audit_info = self.set_mocked_audit_info()
+        logs = Logs(audit_info)
+        assert len(logs.log_groups) == 1
+        # Only the secrets are kept, by log stream and event timestamp
+        assert list(logs.log_groups[0].secrets) == ["test-stream"]
+        log_stream_secrets = logs.log_groups[0].secrets["test-stream"]
+        assert len(log_stream_secrets) == 1
+        assert list(log_stream_secrets.values())[0] == {1: ["Secret Keyword"]}
+        assert logs.log_groups[0].events_sampling == "COMPLETE"
+        assert logs.log_groups[0].sampled_events == 2
+
+    @mock_logs
+    def test__get_log_events__scanned_in_batches(self):
+        logs_client = client("logs", region_name=AWS_REGION)
+        for log_group_name in ["/log-group/test-1", "/log-group/test-2"]:
+            logs_client.create_log_group(logGroupName=log_group_name)
+            logs_client.create_log_stream(
+                logGroupName=log_group_name, logStreamName="test-stream"
+            )
+            logs_client.put_log_events(
+                logGroupName=log_group_name,
+                logStreamName="test-stream",
+                logEvents=[
+                    {
+                        "timestamp": int(unix_time_millis()),
+                        "message": "password = password123",
+                    },
+                ],
+            )
+        audit_info = self.set_mocked_audit_info()
+        scan_threads = []
+
+        def scan_log_groups_streams_in_thread(*args):
+            scan_threads.append(threading.current_thread())
+            return scan_log_groups_streams(*args)
+
+        with mock.patch(
+            "prowler.providers.aws.services.cloudwatch.cloudwatch_service.log_groups_scan_batch_size",
+            new=1,
+        ), mock.patch(
+            "prowler.providers.aws.services.cloudwatch.cloudwatch_service.scan_log_groups_streams",
+            side_effect=scan_log_groups_streams_in_thread,
+        ):
+            logs = Logs(audit_info)
+        # Each batch is scanned by the thread that created the service, not by the region threads
+        assert scan_threads == [threading.current_thread()] * 2
+        assert len(logs.log_groups) == 2
+        for log_group in logs.log_groups:
+            assert list(log_group.secrets) == ["test-stream"]
+
+    @mock_logs
+    def test__get_log_events__over_threshold(self):
+        logs_client = client("logs", region_name=AWS_REGION)
+        logs_client.create_log_group(logGroupName="/log-group/test")
+        logs_client.create_log_stream(
+            logGroupName="/log-group/test", logStreamName="test-stream"
+        )
+        logs_client.put_log_events(
+            logGroupName="/log-group/test",
+            logStreamName="test-stream",
+            logEvents=[
+                {"timestamp": int(unix_time_millis()), "message": "no secrets here"},
+                {
+                    "timestamp": int(unix_time_millis()),
+                    "message": "password = password123",
+                },
+            ],
+        )
+        audit_info = self.set_mocked_audit_info()
+        config = {
+            "max_log_events_per_log_group": 1,
+            "max_log_events_size_in_kb_per_log_group": 1024,
+            "log_events_sampling_days": 0,
+        }
+        with mock.patch(
+            "prowler.providers.aws.services.cloudwatch.cloudwatch_service.get_config_var",
+            new=config.get,
+        ):
+            logs = Logs(audit_info)
+        # The event with the secret is not sampled
+        assert len(logs.log_groups) == 1
+        assert logs.log_groups[0].secrets == {}
+        assert logs.log_groups[0].events_sampling == "TRUNCATED"
+        assert logs.log_groups[0].sampled_events == 1
+
+    @mock_logs
+    def test__get_log_events__without_recent_events(self):
+        logs_client = client("logs", region_name=AWS_REGION)
+        logs_client.create_log_group(logGroupName="/log-group/test")
+        logs_client.create_log_stream(
+            logGroupName="/log-group/test", logStreamName="test-stream"
+        )
+        logs_client.put_log_events(
+            logGroupName="/log-group/test",
+            logStreamName="test-stream",
+            logEvents=[
+                {
+                    # 30 days ago
+                    "timestamp": int(unix_time_millis()) - 30 * 24 * 3600 * 1000,
+                    "message": "password = password123",
+                },
+            ],
+        )
+        audit_info = self.set_mocked_audit_info()
+        config = {
+            "max_log_events_per_log_group": 1000,
+            "max_log_events_size_in_kb_per_log_group": 1024,
+            "log_events_sampling_days": 7,
+        }
+        with mock.patch(
+            "prowler.providers.aws.services.cloudwatch.cloudwatch_service.get_config_var",
+            new=config.get,
+        ):
+            logs = Logs(audit_info)
+        assert len(logs.log_groups) == 1
+        assert logs.log_groups[0].secrets == {}
+        assert logs.log_groups[0].events_sampling == "SKIPPED"
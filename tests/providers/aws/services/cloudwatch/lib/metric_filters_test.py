@@ -0,0 +1,63 @@
+from unittest import mock
+
+from prowler.providers.aws.services.cloudwatch.cloudwatch_service import (
+    MetricAlarm,
+    MetricFilter,
+)
+from prowler.providers.aws.services.cloudwatch.lib.metric_filters import (
+    MonitoringIndex,
+    get_monitoring_index,
+)
+
+AWS_REGION = "us-east-1"
+AWS_ACCOUNT_NUMBER = "123456789012"
+
+pattern = r"\$\.eventName\s*=\s*.?ConsoleLogin.+\$\.errorMessage\s*=\s*.?Failed authentication.?"
+
+
+def build_metric_filter(name: str, log_group: str, filter_pattern: str):
+    return MetricFilter(
+        arn=f"arn:aws:logs:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:metric-filter/{name}",
+        name=name,
+        metric=f"{name}-metric",
+        pattern=filter_pattern,
+        log_group=log_group,
+        region=AWS_REGION,
+    )
+
+
+class Test_metric_filters:
+    def test_monitoring_index(self):
+        trail = mock.MagicMock()
+        trail.log_group_arn = (
+            f"arn:aws:logs:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:log-group:/trail:*"
+        )
+        login_pattern = '{($.eventName = "ConsoleLogin") && ($.errorMessage = "Failed authentication")}'
+        metric_filters = [
+            build_metric_filter("in-trail", "/trail", login_pattern),
+            build_metric_filter("not-in-trail", "/other", login_pattern),
+            build_metric_filter("other-pattern", "/trail", "{$.eventName = Other}"),
+        ]
+        metric_alarms = [
+            MetricAlarm(
+                arn=f"arn:aws:cloudwatch:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:alarm:test",
+                name="test",
+                metric="in-trail-metric",
+                name_space="test",
+                region=AWS_REGION,
+            )
+        ]
+        index = MonitoringIndex([trail], metric_filters, metric_alarms)
+
+        assert [
+            metric_filter.name for metric_filter in index.get_metric_filters(pattern)
+        ] == ["in-trail"]
+        assert index.has_alarms("in-trail-metric")
+        assert not index.has_alarms("other-pattern-metric")
+
+    def test_get_monitoring_index_cache(self):
+        trails, metric_filters, metric_alarms = [], [], []
+        index = get_monitoring_index(trails, metric_filters, metric_alarms)
+        assert get_monitoring_index(trails, metric_filters, metric_alarms) is index
+        # Another account's resources build a new index
+        assert get_monitoring_index([], [], []) is not index
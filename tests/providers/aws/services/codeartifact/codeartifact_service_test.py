@@ -89,6 +89,48 @@ def mock_make_api_call(self, operation_name, kwarg):
     return make_api_call(self, operation_name, kwarg)
 
 
+def mock_make_api_call_many_packages(self, operation_name, kwarg):
+    """Two packages, the external one is ingested from an upstream"""
+    if operation_name == "ListPackages":
+        return {
+            "packages": [
+                {
+                    "format": "pypi",
+                    "package": package,
+                    "originConfiguration": {
+                        "restrictions": {
+                            "publish": "ALLOW",
+                            "upstream": "ALLOW",
+                        }
+                    },
+                }
+                for package in ["internal-package", "external-package"]
+            ],
+        }
+    if operation_name == "ListPackageVersions":
+        return {
+            "versions": [
+                {
+                    "version": "1.0.0",
+                    "status": "Published",
+                    "origin": {
+                        "originType": "INTERNAL"
+                        if kwarg["package"] == "internal-package"
+                        else "EXTERNAL",
+                    },
+                },
+            ],
+        }
+    return mock_make_api_call(self, operation_name, kwarg)
+
+
+def mock_get_config_var(only_internal_packages, max_packages_per_repository):
+    return lambda variable: {
+        "codeartifact_only_internal_packages": only_internal_packages,
+        "codeartifact_max_packages_per_repository": max_packages_per_repository,
+    }[variable]
+
+
 # Mock generate_regional_clients()
 def mock_generate_regional_clients(service, audit_info):
     regional_client = audit_info.audit_session.client(service, region_name=AWS_REGION)
@@ -220,3 +262,37 @@ class Test_CodeArtifact_Service:
             .latest_version.origin.origin_type
             == OriginInformationValues.INTERNAL
         )
+
+    def test__list_packages__max_packages_per_repository(self):
+        with patch(
+            "botocore.client.BaseClient._make_api_call",
+            new=mock_make_api_call_many_packages,
+        ), patch(
+            "prowler.providers.aws.services.codeartifact.codeartifact_service.get_config_var",
+            new=mock_get_config_var(False, 1),
+        ):
+            codeartifact = CodeArtifact(self.set_mocked_audit_info())
+
+        repository = codeartifact.repositories[TEST_REPOSITORY_ARN]
+        assert len(repository.packages) == 1
+        assert repository.packages[0].name == "internal-package"
+        assert repository.packages_truncated
+
+    def test__list_packages__only_internal_packages(self):
+        with patch(
+            "botocore.client.BaseClient._make_api_call",
+            new=mock_make_api_call_many_packages,
+        ), patch(
+            "prowler.providers.aws.services.codeartifact.codeartifact_service.get_config_var",
+            new=mock_get_config_var(True, 0),
+        ):
+            codeartifact = CodeArtifact(self.set_mocked_audit_info())
+
+        repository = codeartifact.repositories[TEST_REPOSITORY_ARN]
+        assert len(repository.packages) == 1
+        assert repository.packages[0].name == "internal-package"
+        assert (
+            repository.packages[0].latest_version.origin.origin_type
+            == OriginInformationValues.INTERNAL
+        )
+        assert not repository.packages_truncated
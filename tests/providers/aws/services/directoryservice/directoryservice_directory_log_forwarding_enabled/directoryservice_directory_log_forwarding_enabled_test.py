@@ -8,6 +8,7 @@ from prowler.providers.aws.services.directoryservice.directoryservice_service im
 )
 
 AWS_REGION = "eu-west-1"
+AWS_ACCOUNT_NUMBER = "123456789012"
 
 
 class Test_directoryservice_directory_log_forwarding_enabled:
@@ -36,6 +37,7 @@ class Test_directoryservice_directory_log_forwarding_enabled:
             directory_name: Directory(
                 name=directory_name,
                 id=directory_id,
+                arn=f"arn:aws:ds:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:directory/{directory_id}",
                 type=DirectoryType.MicrosoftAD,
                 region=AWS_REGION,
                 log_subscriptions=[],
@@ -70,6 +72,7 @@ class Test_directoryservice_directory_log_forwarding_enabled:
             directory_name: Directory(
                 name=directory_name,
                 id=directory_id,
+                arn=f"arn:aws:ds:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:directory/{directory_id}",
                 type=DirectoryType.MicrosoftAD,
                 region=AWS_REGION,
                 log_subscriptions=[
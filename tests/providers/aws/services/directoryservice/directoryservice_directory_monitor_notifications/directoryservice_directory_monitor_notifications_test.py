@@ -11,6 +11,7 @@ from prowler.providers.aws.services.directoryservice.directoryservice_service im
 )
 
 AWS_REGION = "eu-west-1"
+AWS_ACCOUNT_NUMBER = "123456789012"
 
 
 class Test_directoryservice_directory_monitor_notifications:
@@ -38,6 +39,7 @@ class Test_directoryservice_directory_monitor_notifications:
         directoryservice_client.directories = {
             directory_name: Directory(
                 id=directory_id,
+                arn=f"arn:aws:ds:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:directory/{directory_id}",
                 type=DirectoryType.MicrosoftAD,
                 name=directory_name,
                 region=AWS_REGION,
@@ -73,6 +75,7 @@ class Test_directoryservice_directory_monitor_notifications:
             directory_name: Directory(
                 name=directory_name,
                 id=directory_id,
+                arn=f"arn:aws:ds:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:directory/{directory_id}",
                 type=DirectoryType.MicrosoftAD,
                 region=AWS_REGION,
                 event_topics=[
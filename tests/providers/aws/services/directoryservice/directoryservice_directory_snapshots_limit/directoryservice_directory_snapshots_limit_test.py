@@ -7,6 +7,7 @@ from prowler.providers.aws.services.directoryservice.directoryservice_service im
 )
 
 AWS_REGION = "eu-west-1"
+AWS_ACCOUNT_NUMBER = "123456789012"
 
 
 class Test_directoryservice_directory_snapshots_limit:
@@ -38,6 +39,7 @@ class Test_directoryservice_directory_snapshots_limit:
             directory_name: Directory(
                 name=directory_name,
                 id=directory_id,
+                arn=f"arn:aws:ds:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:directory/{directory_id}",
                 type=DirectoryType.MicrosoftAD,
                 region=AWS_REGION,
                 snapshots_limits=SnapshotLimit(
@@ -79,6 +81,7 @@ class Test_directoryservice_directory_snapshots_limit:
             directory_name: Directory(
                 name=directory_name,
                 id=directory_id,
+                arn=f"arn:aws:ds:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:directory/{directory_id}",
                 type=DirectoryType.MicrosoftAD,
                 region=AWS_REGION,
                 snapshots_limits=SnapshotLimit(
@@ -120,6 +123,7 @@ class Test_directoryservice_directory_snapshots_limit:
             directory_name: Directory(
                 name=directory_name,
                 id=directory_id,
+                arn=f"arn:aws:ds:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:directory/{directory_id}",
                 type=DirectoryType.MicrosoftAD,
                 region=AWS_REGION,
                 snapshots_limits=SnapshotLimit(
@@ -161,6 +165,7 @@ class Test_directoryservice_directory_snapshots_limit:
             directory_name: Directory(
                 name=directory_name,
                 id=directory_id,
+                arn=f"arn:aws:ds:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:directory/{directory_id}",
                 type=DirectoryType.MicrosoftAD,
                 region=AWS_REGION,
                 snapshots_limits=SnapshotLimit(
@@ -12,6 +12,7 @@ from prowler.providers.aws.services.directoryservice.directoryservice_service im
 )
 
 AWS_REGION = "eu-west-1"
+AWS_ACCOUNT_NUMBER = "123456789012"
 
 
 # Always use a mocked date to test the certificates expiration
@@ -41,6 +42,7 @@ class Test_directoryservice_ldap_certificate_expiration:
         directoryservice_client.directories = {
             directory_name: Directory(
                 id=directory_id,
+                arn=f"arn:aws:ds:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:directory/{directory_id}",
                 type=DirectoryType.MicrosoftAD,
                 name=directory_name,
                 region=AWS_REGION,
@@ -72,6 +74,7 @@ class Test_directoryservice_ldap_certificate_expiration:
             directory_name: Directory(
                 name=directory_name,
                 id=directory_id,
+                arn=f"arn:aws:ds:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:directory/{directory_id}",
                 type=DirectoryType.MicrosoftAD,
                 region=AWS_REGION,
                 certificates=[
@@ -118,6 +121,7 @@ class Test_directoryservice_ldap_certificate_expiration:
             directory_name: Directory(
                 name=directory_name,
                 id=directory_id,
+                arn=f"arn:aws:ds:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:directory/{directory_id}",
                 type=DirectoryType.MicrosoftAD,
                 region=AWS_REGION,
                 certificates=[
@@ -164,6 +168,7 @@ class Test_directoryservice_ldap_certificate_expiration:
             directory_name: Directory(
                 name=directory_name,
                 id=directory_id,
+                arn=f"arn:aws:ds:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:directory/{directory_id}",
                 type=DirectoryType.MicrosoftAD,
                 region=AWS_REGION,
                 certificates=[
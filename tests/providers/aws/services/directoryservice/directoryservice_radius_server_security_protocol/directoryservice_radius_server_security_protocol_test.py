@@ -9,6 +9,7 @@ from prowler.providers.aws.services.directoryservice.directoryservice_service im
 )
 
 AWS_REGION = "eu-west-1"
+AWS_ACCOUNT_NUMBER = "123456789012"
 
 
 class Test_directoryservice_radius_server_security_protocol:
@@ -37,6 +38,7 @@ class Test_directoryservice_radius_server_security_protocol:
             directory_name: Directory(
                 name=directory_name,
                 id=directory_id,
+                arn=f"arn:aws:ds:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:directory/{directory_id}",
                 type=DirectoryType.MicrosoftAD,
                 region=AWS_REGION,
                 radius_settings=None,
@@ -64,6 +66,7 @@ class Test_directoryservice_radius_server_security_protocol:
             directory_name: Directory(
                 name=directory_name,
                 id=directory_id,
+                arn=f"arn:aws:ds:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:directory/{directory_id}",
                 type=DirectoryType.MicrosoftAD,
                 region=AWS_REGION,
                 radius_settings=RadiusSettings(
@@ -101,6 +104,7 @@ class Test_directoryservice_radius_server_security_protocol:
             directory_name: Directory(
                 name=directory_name,
                 id=directory_id,
+                arn=f"arn:aws:ds:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:directory/{directory_id}",
                 type=DirectoryType.MicrosoftAD,
                 region=AWS_REGION,
                 radius_settings=RadiusSettings(
@@ -1,5 +1,5 @@
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import botocore
 from boto3 import session
@@ -177,6 +177,10 @@ class Test_DirectoryService_Service:
         )
         assert directoryservice.directories["d-12345a1b2"].name == "test-directory"
         assert directoryservice.directories["d-12345a1b2"].region == AWS_REGION
+        assert (
+            directoryservice.directories["d-12345a1b2"].arn
+            == f"arn:aws:ds:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:directory/d-12345a1b2"
+        )
         assert directoryservice.directories["d-12345a1b2"].tags == [
             {"Key": "string", "Value": "string"},
         ]
@@ -263,3 +267,20 @@ class Test_DirectoryService_Service:
             ].snapshots_limits.manual_snapshots_limit_reached
             is True
         )
+
+    @mock_ds
+    def test__list_tags_for_resource__tag_store(self):
+        audit_info = self.set_mocked_audit_info()
+        audit_info.tag_store = MagicMock()
+        audit_info.tag_store.get_tags.return_value = [
+            {"Key": "stored", "Value": "stored"}
+        ]
+        directoryservice = DirectoryService(audit_info)
+
+        audit_info.tag_store.get_tags.assert_called_once_with(
+            f"arn:aws:ds:{AWS_REGION}:{AWS_ACCOUNT_NUMBER}:directory/d-12345a1b2",
+            AWS_REGION,
+        )
+        assert directoryservice.directories["d-12345a1b2"].tags == [
+            {"Key": "stored", "Value": "stored"}
+        ]
@@ -6,6 +6,7 @@ from moto import mock_ec2
 
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.common.models import Audit_Metadata
+from tests.providers.aws.services.ec2.ec2_mocks import mock_make_api_call
 
 AWS_REGION = "us-east-1"
 AWS_ACCOUNT_NUMBER = "123456789012"
@@ -17,6 +18,7 @@ def mock_generate_regional_clients(service, audit_info):
     return {AWS_REGION: regional_client}
 
 
+@patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
 @patch(
     "prowler.providers.aws.services.ec2.ec2_service.generate_regional_clients",
     new=mock_generate_regional_clients,
@@ -35,7 +35,7 @@ class Test_ec2_instance_secrets_user_data:
             mfa_enabled=False,
             audit_metadata=Audit_Metadata(
                 services_scanned=0,
-                expected_checks=[],
+                expected_checks=["ec2_instance_secrets_user_data"],
                 completed_checks=0,
                 audit_progress=0,
             ),
@@ -221,3 +221,39 @@ class Test_ec2_instance_secrets_user_data:
                 result[0].resource_arn
                 == f"arn:{current_audit_info.audited_partition}:ec2:{AWS_REGION}:{current_audit_info.audited_account}:instance/{instance.id}"
             )
+
+    @mock_ec2
+    def test_one_ec2_with_binary_user_data(self):
+        ec2 = resource("ec2", region_name=AWS_REGION)
+        instance = ec2.create_instances(
+            ImageId=EXAMPLE_AMI_ID,
+            MinCount=1,
+            MaxCount=1,
+            UserData=b"\xff\xfe\x00binary user data",
+        )[0]
+
+        from prowler.providers.aws.services.ec2.ec2_service import EC2
+
+        current_audit_info = self.set_mocked_audit_info()
+
+        with mock.patch(
+            "prowler.providers.aws.lib.audit_info.audit_info.current_audit_info",
+            new=current_audit_info,
+        ), mock.patch(
+            "prowler.providers.aws.services.ec2.ec2_instance_secrets_user_data.ec2_instance_secrets_user_data.ec2_client",
+            new=EC2(current_audit_info),
+        ):
+            from prowler.providers.aws.services.ec2.ec2_instance_secrets_user_data.ec2_instance_secrets_user_data import (
+                ec2_instance_secrets_user_data,
+            )
+
+            check = ec2_instance_secrets_user_data()
+            result = check.execute()
+
+            assert len(result) == 1
+            assert result[0].status == "INFO"
+            assert (
+                result[0].status_extended
+                == f"EC2 instance {instance.id} User Data was not scanned for secrets since it could not be decoded as text."
+            )
+            assert result[0].resource_id == instance.id
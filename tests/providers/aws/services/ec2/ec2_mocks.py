@@ -0,0 +1,27 @@
+import botocore
+
+make_api_call = botocore.client.BaseClient._make_api_call
+
+
+def mock_make_api_call(self, operation_name, kwarg):
+    # Moto does not filter the snapshots restorable by all the users
+    if operation_name == "DescribeSnapshots" and kwarg.get("RestorableByUserIds"):
+        snapshots = make_api_call(
+            self, operation_name, {"OwnerIds": kwarg.get("OwnerIds", [])}
+        )["Snapshots"]
+        return {
+            "Snapshots": [
+                snapshot
+                for snapshot in snapshots
+                if {"Group": "all"}
+                in make_api_call(
+                    self,
+                    "DescribeSnapshotAttribute",
+                    {
+                        "Attribute": "createVolumePermission",
+                        "SnapshotId": snapshot["SnapshotId"],
+                    },
+                )["CreateVolumePermissions"]
+            ]
+        }
+    return make_api_call(self, operation_name, kwarg)
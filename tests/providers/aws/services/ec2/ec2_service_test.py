@@ -1,7 +1,7 @@
 import ipaddress
 import re
-from base64 import b64decode
 from datetime import datetime
+from unittest.mock import patch
 
 from boto3 import client, resource, session
 from dateutil.tz import tzutc
@@ -11,6 +11,7 @@ from moto import mock_ec2
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.aws.services.ec2.ec2_service import EC2
 from prowler.providers.common.models import Audit_Metadata
+from tests.providers.aws.services.ec2.ec2_mocks import mock_make_api_call
 
 AWS_ACCOUNT_NUMBER = "123456789012"
 AWS_REGION = "us-east-1"
@@ -18,6 +19,7 @@ EXAMPLE_AMI_ID = "ami-12c6146b"
 MOCK_DATETIME = datetime(2023, 1, 4, 7, 27, 30, tzinfo=tzutc())
 
 
+@patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
 class Test_EC2_Service:
     # Mocked Audit Info
     def set_mocked_audit_info(self):
@@ -114,7 +116,7 @@ class Test_EC2_Service:
         assert ec2.instances[0].state == "running"
         assert re.match(r"ami-[0-9a-z]{8}", ec2.instances[0].image_id)
         assert ec2.instances[0].launch_time == MOCK_DATETIME
-        assert not ec2.instances[0].user_data
+        assert ec2.instances[0].user_data_secrets is None
         assert not ec2.instances[0].http_tokens
         assert not ec2.instances[0].http_endpoint
         assert not ec2.instances[0].instance_profile
@@ -295,11 +297,15 @@ class Test_EC2_Service:
             OperationType="add",
             SnapshotId=snapshot_id,
         )
+        private_snapshot_id = ec2_client.create_snapshot(
+            VolumeId=volume_id,
+        )["SnapshotId"]
         # EC2 client for this test class
         audit_info = self.set_mocked_audit_info()
         ec2 = EC2(audit_info)
 
         assert snapshot_id in str(ec2.snapshots)
+        assert private_snapshot_id in str(ec2.snapshots)
         for snapshot in ec2.snapshots:
             if snapshot.id == snapshot_id:
                 assert re.match(r"snap-[0-9a-z]{8}", snapshot.id)
@@ -310,11 +316,12 @@ class Test_EC2_Service:
                 assert snapshot.region == AWS_REGION
                 assert not snapshot.encrypted
                 assert snapshot.public
+            if snapshot.id == private_snapshot_id:
+                assert not snapshot.public
 
     # Test EC2 Instance User Data
     @mock_ec2
     def test__get_instance_user_data__(self):
-        user_data = "This is some user_data"
         ec2 = resource("ec2", region_name=AWS_REGION)
         ec2.create_instances(
             ImageId=EXAMPLE_AMI_ID,
@@ -324,8 +331,60 @@ class Test_EC2_Service:
         )
         # EC2 client for this test class
         audit_info = self.set_mocked_audit_info()
+        audit_info.audit_metadata.expected_checks = ["ec2_instance_secrets_user_data"]
+        ec2 = EC2(audit_info)
+        assert ec2.instances[0].user_data_secrets is False
+
+    # Test EC2 Instance User Data with secrets
+    @mock_ec2
+    def test__get_instance_user_data__with_secrets(self):
+        ec2 = resource("ec2", region_name=AWS_REGION)
+        ec2.create_instances(
+            ImageId=EXAMPLE_AMI_ID,
+            MinCount=1,
+            MaxCount=1,
+            UserData="DB_PASSWORD=foobar123",
+        )
+        # EC2 client for this test class
+        audit_info = self.set_mocked_audit_info()
+        audit_info.audit_metadata.expected_checks = ["ec2_instance_secrets_user_data"]
+        ec2 = EC2(audit_info)
+        assert ec2.instances[0].user_data_secrets is True
+
+    # Test EC2 Instance User Data that cannot be decoded
+    @mock_ec2
+    def test__get_instance_user_data__binary(self):
+        ec2 = resource("ec2", region_name=AWS_REGION)
+        ec2.create_instances(
+            ImageId=EXAMPLE_AMI_ID,
+            MinCount=1,
+            MaxCount=1,
+            UserData=b"\xff\xfe\x00binary user data",
+        )
+        # EC2 client for this test class
+        audit_info = self.set_mocked_audit_info()
+        audit_info.audit_metadata.expected_checks = ["ec2_instance_secrets_user_data"]
+        ec2 = EC2(audit_info)
+        assert ec2.instances[0].user_data_secrets is None
+        assert (
+            ec2.instances[0].user_data_not_scanned_reason
+            == "it could not be decoded as text."
+        )
+
+    # Test EC2 Instance User Data is not retrieved if its check is not audited
+    @mock_ec2
+    def test__get_instance_user_data__not_audited(self):
+        ec2 = resource("ec2", region_name=AWS_REGION)
+        ec2.create_instances(
+            ImageId=EXAMPLE_AMI_ID,
+            MinCount=1,
+            MaxCount=1,
+            UserData="DB_PASSWORD=foobar123",
+        )
+        # EC2 client for this test class
+        audit_info = self.set_mocked_audit_info()
         ec2 = EC2(audit_info)
-        assert user_data == b64decode(ec2.instances[0].user_data).decode("utf-8")
+        assert ec2.instances[0].user_data_secrets is None
 
     # Test EC2 Get EBS Encryption by default
     @mock_ec2
@@ -373,7 +432,7 @@ class Test_EC2_Service:
 
     # Test EC2 Describe Network Interfaces
     @mock_ec2
-    def test__describe_sg_network_interfaces__(self):
+    def test__describe_network_interfaces__security_groups(self):
         # Generate EC2 Client
         ec2_client = client("ec2", region_name=AWS_REGION)
         ec2_resource = resource("ec2", region_name=AWS_REGION)
@@ -387,6 +446,9 @@ class Test_EC2_Service:
         ec2_client.modify_network_interface_attribute(
             NetworkInterfaceId=eni_id, Groups=[sg.id]
         )
+        unused_sg = ec2_resource.create_security_group(
+            GroupName="test-unused-securitygroup", Description="n/a"
+        )
 
         # EC2 client for this test class
         audit_info = self.set_mocked_audit_info()
@@ -402,7 +464,7 @@ class Test_EC2_Service:
                 )
                 assert re.match(r"sg-[0-9a-z]{17}", security_group.id)
                 assert security_group.region == AWS_REGION
-                assert eni_id in security_group.network_interfaces
+                assert security_group.network_interfaces == [eni_id]
                 assert security_group.ingress_rules == []
                 assert security_group.egress_rules == [
                     {
@@ -413,9 +475,11 @@ class Test_EC2_Service:
                         "UserIdGroupPairs": [],
                     }
                 ]
+            if security_group.id == unused_sg.id:
+                assert security_group.network_interfaces == []
 
     @mock_ec2
-    def test__describe_public_network_interfaces__(self):
+    def test__describe_network_interfaces__public(self):
         # Generate EC2 Client
         ec2_client = client("ec2", region_name=AWS_REGION)
         ec2_resource = resource("ec2", region_name=AWS_REGION)
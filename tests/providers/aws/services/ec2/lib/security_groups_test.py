@@ -1,6 +1,9 @@
 import pytest
 
-from prowler.providers.aws.services.ec2.lib.security_groups import _is_cidr_public
+from prowler.providers.aws.services.ec2.lib.security_groups import (
+    SecurityGroupRulesIndex,
+    _is_cidr_public,
+)
 
 
 class Test_security_groups:
@@ -19,3 +22,70 @@ class Test_security_groups:
 
         assert ex.type == ValueError
         assert ex.match(f"{cidr} has host bits set")
+
+    def test_security_group_rules_index_port_open(self):
+        index = SecurityGroupRulesIndex(
+            [
+                {
+                    "IpProtocol": "tcp",
+                    "FromPort": 20,
+                    "ToPort": 30,
+                    "IpRanges": [{"CidrIp": "0.0.0.0/0"}],
+                    "Ipv6Ranges": [],
+                    "UserIdGroupPairs": [],
+                }
+            ]
+        )
+        assert index.is_public("tcp", [22], any_address=True)
+        assert not index.is_public("tcp", [3389], any_address=True)
+        assert not index.is_public("udp", [22], any_address=True)
+
+    def test_security_group_rules_index_all_ports(self):
+        index = SecurityGroupRulesIndex(
+            [
+                {
+                    "IpProtocol": "udp",
+                    "FromPort": 0,
+                    "ToPort": 65535,
+                    "IpRanges": [],
+                    "Ipv6Ranges": [{"CidrIpv6": "::/0"}],
+                }
+            ]
+        )
+        # Every port is open regardless of the protocol
+        assert index.is_public("tcp", [22], any_address=True)
+        assert index.is_public("-1", any_address=True)
+
+    def test_security_group_rules_index_all_traffic(self):
+        index = SecurityGroupRulesIndex(
+            [
+                {
+                    "IpProtocol": "-1",
+                    "IpRanges": [{"CidrIp": "8.8.8.0/24"}],
+                    "Ipv6Ranges": [],
+                    "UserIdGroupPairs": [{"GroupId": "sg-123456"}],
+                }
+            ]
+        )
+        # Only 0.0.0.0/0 and ::/0 are public with any_address
+        assert not index.is_public("-1", any_address=True)
+        assert index.is_public("-1")
+
+    def test_security_group_rules_index_private_and_security_group(self):
+        index = SecurityGroupRulesIndex(
+            [
+                {
+                    "IpProtocol": "tcp",
+                    "FromPort": 0,
+                    "ToPort": 65535,
+                    "IpRanges": [{"CidrIp": "10.0.0.0/8"}],
+                    "Ipv6Ranges": [],
+                    "UserIdGroupPairs": [{"GroupId": "sg-123456"}],
+                }
+            ]
+        )
+        assert not index.is_public("tcp", [22])
+        assert [rule.source for rule in index.rules] == [
+            "private",
+            "security_group",
+        ]
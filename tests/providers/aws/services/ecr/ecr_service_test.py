@@ -223,9 +223,9 @@ class Test_ECR_Service:
         assert ecr.registries[AWS_REGION].repositories[0].scan_on_push
         assert ecr.registries[AWS_REGION].repositories[0].lifecycle_policy
 
-    # Test get image details
+    # Test get image details with the default latest image only
     @mock_ecr
-    def test__get_image_details__(self):
+    def test__get_image_details__latest_image(self):
         ecr_client = client("ecr", region_name=AWS_REGION)
         ecr_client.create_repository(
             repositoryName=repo_name,
@@ -233,6 +233,33 @@ class Test_ECR_Service:
         )
         audit_info = self.set_mocked_audit_info()
         ecr = ECR(audit_info)
+        assert len(ecr.registries[AWS_REGION].repositories[0].images_details) == 1
+        # Last image pushed
+        assert ecr.registries[AWS_REGION].repositories[0].images_details[
+            0
+        ].image_pushed_at == datetime(2023, 1, 2)
+        assert (
+            ecr.registries[AWS_REGION].repositories[0].images_details[0].latest_tag
+            == "test-tag2"
+        )
+
+    # Test get image details with the full image inventory
+    @mock_ecr
+    def test__get_image_details__(self):
+        ecr_client = client("ecr", region_name=AWS_REGION)
+        ecr_client.create_repository(
+            repositoryName=repo_name,
+            imageScanningConfiguration={"scanOnPush": True},
+        )
+        audit_info = self.set_mocked_audit_info()
+        with patch(
+            "prowler.providers.aws.services.ecr.ecr_service.get_config_var",
+            new=lambda variable: {
+                "ecr_full_image_inventory": True,
+                "ecr_latest_images_per_repository": 1,
+            }[variable],
+        ):
+            ecr = ECR(audit_info)
         assert len(ecr.registries) == 1
         assert len(ecr.registries[AWS_REGION].repositories) == 1
         assert ecr.registries[AWS_REGION].repositories[0].name == repo_name
@@ -0,0 +1,146 @@
+from json import dumps
+from unittest import mock
+
+from boto3 import client, session
+from moto import mock_iam
+
+from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+
+AWS_REGION = "us-east-1"
+AWS_ACCOUNT_NUMBER = "123456789012"
+
+ASSUME_ROLE_POLICY_DOCUMENT = {
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Principal": {"AWS": f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:root"},
+            "Action": "sts:AssumeRole",
+        }
+    ],
+}
+
+
+class Test_iam_principal_privilege_escalation_path:
+    def set_mocked_audit_info(self):
+        audit_info = AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=session.Session(
+                profile_name=None,
+                botocore_session=None,
+            ),
+            audited_account=AWS_ACCOUNT_NUMBER,
+            audited_account_arn=f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:root",
+            audited_user_id=None,
+            audited_partition="aws",
+            audited_identity_arn=None,
+            profile=None,
+            profile_region=None,
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=["us-east-1", "eu-west-1"],
+            organizations_metadata=None,
+            audit_resources=None,
+            mfa_enabled=False,
+        )
+
+        return audit_info
+
+    @mock_iam
+    def test_no_principals(self):
+        current_audit_info = self.set_mocked_audit_info()
+        from prowler.providers.aws.services.iam.iam_service import IAM
+
+        with mock.patch(
+            "prowler.providers.aws.lib.audit_info.audit_info.current_audit_info",
+            new=current_audit_info,
+        ), mock.patch(
+            "prowler.providers.aws.services.iam.iam_principal_privilege_escalation_path.iam_principal_privilege_escalation_path.iam_client",
+            new=IAM(current_audit_info),
+        ):
+            # Test Check
+            from prowler.providers.aws.services.iam.iam_principal_privilege_escalation_path.iam_principal_privilege_escalation_path import (
+                iam_principal_privilege_escalation_path,
+            )
+
+            check = iam_principal_privilege_escalation_path()
+            result = check.execute()
+            assert len(result) == 0
+
+    @mock_iam
+    def test_principals_with_and_without_escalation_path(self):
+        iam_client = client("iam", region_name=AWS_REGION)
+        admin_role_arn = iam_client.create_role(
+            RoleName="admin",
+            AssumeRolePolicyDocument=dumps(ASSUME_ROLE_POLICY_DOCUMENT),
+        )["Role"]["Arn"]
+        iam_client.attach_role_policy(
+            RoleName="admin",
+            PolicyArn="arn:aws:iam::aws:policy/AdministratorAccess",
+        )
+        reader_arn = iam_client.create_user(UserName="reader")["User"]["Arn"]
+        iam_client.put_user_policy(
+            UserName="reader",
+            PolicyName="read",
+            PolicyDocument=dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        {"Effect": "Allow", "Action": "s3:GetObject", "Resource": "*"}
+                    ],
+                }
+            ),
+        )
+        attacker_arn = iam_client.create_user(UserName="attacker")["User"]["Arn"]
+        iam_client.put_user_policy(
+            UserName="attacker",
+            PolicyName="assume",
+            PolicyDocument=dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        {
+                            "Effect": "Allow",
+                            "Action": "sts:AssumeRole",
+                            "Resource": admin_role_arn,
+                        }
+                    ],
+                }
+            ),
+        )
+
+        current_audit_info = self.set_mocked_audit_info()
+        from prowler.providers.aws.services.iam.iam_service import IAM
+
+        with mock.patch(
+            "prowler.providers.aws.lib.audit_info.audit_info.current_audit_info",
+            new=current_audit_info,
+        ), mock.patch(
+            "prowler.providers.aws.services.iam.iam_principal_privilege_escalation_path.iam_principal_privilege_escalation_path.iam_client",
+            new=IAM(current_audit_info),
+        ):
+            # Test Check
+            from prowler.providers.aws.services.iam.iam_principal_privilege_escalation_path.iam_principal_privilege_escalation_path import (
+                iam_principal_privilege_escalation_path,
+            )
+
+            check = iam_principal_privilege_escalation_path()
+            result = check.execute()
+            # The administrator role is not reported
+            assert len(result) == 2
+            for finding in result:
+                if finding.resource_arn == attacker_arn:
+                    assert finding.status == "FAIL"
+                    assert (
+                        finding.status_extended
+                        == f"User attacker can escalate to administrative privileges through {attacker_arn} -> sts:AssumeRole -> {admin_role_arn}"
+                    )
+                    assert finding.resource_id == "attacker"
+                else:
+                    assert finding.resource_arn == reader_arn
+                    assert finding.status == "PASS"
+                    assert (
+                        finding.status_extended
+                        == "User reader cannot escalate to administrative privileges in 5 steps or less"
+                    )
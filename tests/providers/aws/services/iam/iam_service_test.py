@@ -1,15 +1,44 @@
+from datetime import timedelta
 from json import dumps
 
+import botocore
 from boto3 import client, session
 from freezegun import freeze_time
+from mock import patch
 from moto import mock_iam
 
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.lib.managed_policies.managed_policies import (
+    ManagedPolicyDocuments,
+)
 from prowler.providers.aws.services.iam.iam_service import IAM, is_service_role
 
 AWS_ACCOUNT_NUMBER = "123456789012"
 TEST_DATETIME = "2023-01-01T12:01:01+00:00"
 
+make_api_call = botocore.client.BaseClient._make_api_call
+
+
+def mock_make_api_call(self, operation_name, kwarg):
+    if operation_name == "GetAccountAuthorizationDetails":
+        raise botocore.exceptions.ClientError(
+            {"Error": {"Code": "AccessDenied", "Message": "Access Denied"}},
+            operation_name,
+        )
+    return make_api_call(self, operation_name, kwarg)
+
+
+def mock_make_api_call_managed_policies(self, operation_name, kwarg):
+    if operation_name == "GetAccountAuthorizationDetails":
+        raise botocore.exceptions.ClientError(
+            {"Error": {"Code": "AccessDenied", "Message": "Access Denied"}},
+            operation_name,
+        )
+    # The cached AWS managed policy must not be retrieved
+    if operation_name == "GetPolicyVersion":
+        assert kwarg["PolicyArn"] != "arn:aws:iam::aws:policy/ReadOnlyAccess"
+    return make_api_call(self, operation_name, kwarg)
+
 
 class Test_IAM_Service:
     # Mocked Audit Info
@@ -471,6 +500,209 @@ class Test_IAM_Service:
         assert len(iam.groups[0].users) == 1
         assert iam.groups[0].users[0].name == username
 
+    # Test IAM Get Credential Report reusing the last one
+    @mock_iam
+    def test__get_credential_report__fresh_report(self):
+        # Generate IAM Client
+        iam_client = client("iam")
+        # Create IAM User
+        username = "user1"
+        user_arn = iam_client.create_user(UserName=username)["User"]["Arn"]
+        # Generate the credential report before the scan
+        while iam_client.generate_credential_report()["State"] != "COMPLETE":
+            pass
+
+        # IAM client for this test class
+        audit_info = self.set_mocked_audit_info()
+        # Moto always reports the same GeneratedTime, so widen the reuse window
+        with patch(
+            "prowler.providers.aws.services.iam.iam_service.credential_report_max_age",
+            new=timedelta(days=365 * 100),
+        ), patch(
+            "prowler.providers.aws.services.iam.iam_service.IAM.__generate_credential_report__"
+        ) as generate_credential_report:
+            iam = IAM(audit_info)
+            generate_credential_report.assert_not_called()
+
+        assert len(iam.credential_report) == 1
+        assert iam.credential_report_by_arn[user_arn]["user"] == username
+
+    # Test IAM Get Credential Report when its generation does not complete
+    @mock_iam
+    def test__get_credential_report__generation_not_completed(self):
+        # IAM client for this test class
+        audit_info = self.set_mocked_audit_info()
+        with patch(
+            "prowler.providers.aws.services.iam.iam_service.IAM.__get_fresh_credential_report__",
+            return_value=None,
+        ), patch(
+            "prowler.providers.aws.services.iam.iam_service.IAM.__generate_credential_report__",
+            return_value=False,
+        ):
+            iam = IAM(audit_info)
+
+        assert iam.credential_report == []
+        assert iam.credential_report_by_arn == {}
+        # The rest of the inventory is still collected
+        assert iam.account_summary
+
+    @mock_iam
+    def test__get_account_authorization_details__(self):
+        iam_client = client("iam")
+        username = "user1"
+        iam_client.create_user(
+            UserName=username, Tags=[{"Key": "test", "Value": "test"}]
+        )
+        iam_client.put_user_policy(
+            UserName=username,
+            PolicyName="inline-policy",
+            PolicyDocument=dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        {"Effect": "Allow", "Action": "s3:*", "Resource": "*"}
+                    ],
+                }
+            ),
+        )
+        group = "test-group"
+        iam_client.create_group(GroupName=group)
+        iam_client.add_user_to_group(GroupName=group, UserName=username)
+        role_name = "test-role"
+        iam_client.create_role(
+            RoleName=role_name,
+            AssumeRolePolicyDocument=dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": {
+                        "Effect": "Allow",
+                        "Principal": {"Service": "ec2.amazonaws.com"},
+                        "Action": "sts:AssumeRole",
+                    },
+                }
+            ),
+            Tags=[{"Key": "test", "Value": "test"}],
+        )
+        iam_client.attach_role_policy(
+            RoleName=role_name,
+            PolicyArn="arn:aws:iam::aws:policy/ReadOnlyAccess",
+        )
+
+        # IAM client for this test class
+        audit_info = self.set_mocked_audit_info()
+        iam = IAM(audit_info)
+
+        assert len(iam.users) == 1
+        assert iam.users[0].inline_policies == ["inline-policy"]
+        assert iam.users[0].tags == [{"Key": "test", "Value": "test"}]
+        assert len(iam.groups) == 1
+        assert iam.groups[0].users[0].name == username
+        assert len(iam.roles) == 1
+        assert iam.roles[0].is_service_role
+        assert iam.roles[0].tags == [{"Key": "test", "Value": "test"}]
+        assert iam.roles[0].attached_policies == [
+            {
+                "PolicyName": "ReadOnlyAccess",
+                "PolicyArn": "arn:aws:iam::aws:policy/ReadOnlyAccess",
+            }
+        ]
+        # Only the attached AWS Managed policies are listed
+        assert len(iam.policies) == 1
+        assert iam.policies[0].name == "ReadOnlyAccess"
+        assert iam.policies[0].type == "AWS"
+        assert iam.policies[0].attached
+        assert iam.policies[0].document
+
+    # Test IAM collection without Get Account Authorization Details permissions
+    @mock_iam
+    def test__get_account_authorization_details__access_denied(self):
+        iam_client = client("iam")
+        username = "user1"
+        iam_client.create_user(UserName=username)
+        group = "test-group"
+        iam_client.create_group(GroupName=group)
+        iam_client.add_user_to_group(GroupName=group, UserName=username)
+        policy_name = "policy1"
+        iam_client.create_policy(
+            PolicyName=policy_name,
+            PolicyDocument=dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        {"Effect": "Allow", "Action": "s3:*", "Resource": "*"}
+                    ],
+                }
+            ),
+        )
+
+        # IAM client for this test class
+        audit_info = self.set_mocked_audit_info()
+        with patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call):
+            iam = IAM(audit_info)
+
+        assert len(iam.users) == 1
+        assert len(iam.groups) == 1
+        assert iam.groups[0].users[0].name == username
+        custom_policies = [policy for policy in iam.policies if policy.type == "Custom"]
+        assert len(custom_policies) == 1
+        assert custom_policies[0].name == policy_name
+        assert custom_policies[0].document
+
+    # Test IAM inline policies documents without Get Account Authorization Details permissions
+    @mock_iam
+    def test__list_inline_policies__access_denied(self):
+        iam_client = client("iam")
+        inline_policy_document = {
+            "Version": "2012-10-17",
+            "Statement": [{"Effect": "Allow", "Action": "iam:*", "Resource": "*"}],
+        }
+        username = "user1"
+        iam_client.create_user(UserName=username)
+        iam_client.put_user_policy(
+            UserName=username,
+            PolicyName="inline-user-policy",
+            PolicyDocument=dumps(inline_policy_document),
+        )
+        role_name = "test-role"
+        iam_client.create_role(
+            RoleName=role_name,
+            AssumeRolePolicyDocument=dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": {
+                        "Effect": "Allow",
+                        "Principal": {"Service": "ec2.amazonaws.com"},
+                        "Action": "sts:AssumeRole",
+                    },
+                }
+            ),
+        )
+        iam_client.put_role_policy(
+            RoleName=role_name,
+            PolicyName="inline-role-policy",
+            PolicyDocument=dumps(inline_policy_document),
+        )
+        group = "test-group"
+        iam_client.create_group(GroupName=group)
+        iam_client.put_group_policy(
+            GroupName=group,
+            PolicyName="inline-group-policy",
+            PolicyDocument=dumps(inline_policy_document),
+        )
+
+        # IAM client for this test class
+        audit_info = self.set_mocked_audit_info()
+        with patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call):
+            iam = IAM(audit_info)
+
+        assert len(iam.users) == 1
+        assert iam.users[0].inline_policies == ["inline-user-policy"]
+        assert iam.users[0].inline_policies_documents == [inline_policy_document]
+        assert len(iam.roles) == 1
+        assert iam.roles[0].inline_policies_documents == [inline_policy_document]
+        assert len(iam.groups) == 1
+        assert iam.groups[0].inline_policies_documents == [inline_policy_document]
+
     # Test IAM List Attached Group Policies
     @mock_iam
     def test__list_attached_group_policies__(self):
@@ -678,7 +910,7 @@ class Test_IAM_Service:
         assert custom_policies == 1
 
     @mock_iam
-    def test__list_policies_version__(self):
+    def test__get_policy_version__(self):
         iam_client = client("iam")
         policy_name = "policy2"
         policy_document = {
@@ -703,6 +935,50 @@ class Test_IAM_Service:
                 assert policy.document["Statement"][0]["Resource"] == "*"
         assert custom_policies == 1
 
+    @mock_iam
+    def test__get_policy_version__aws_managed_policy_cached(self):
+        iam_client = client("iam")
+        role_name = "test-role"
+        iam_client.create_role(
+            RoleName=role_name,
+            AssumeRolePolicyDocument=dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": {
+                        "Effect": "Allow",
+                        "Principal": {"Service": "ec2.amazonaws.com"},
+                        "Action": "sts:AssumeRole",
+                    },
+                }
+            ),
+        )
+        policy_arn = "arn:aws:iam::aws:policy/ReadOnlyAccess"
+        iam_client.attach_role_policy(RoleName=role_name, PolicyArn=policy_arn)
+        version_id = iam_client.get_policy(PolicyArn=policy_arn)["Policy"][
+            "DefaultVersionId"
+        ]
+        cached_document = {
+            "Version": "2012-10-17",
+            "Statement": [{"Effect": "Allow", "Action": "s3:Get*", "Resource": "*"}],
+        }
+        managed_policy_documents = ManagedPolicyDocuments()
+        managed_policy_documents.documents[(policy_arn, version_id)] = cached_document
+
+        audit_info = self.set_mocked_audit_info()
+        with patch(
+            "prowler.providers.aws.services.iam.iam_service.aws_managed_policy_documents",
+            new=managed_policy_documents,
+        ), patch(
+            "botocore.client.BaseClient._make_api_call",
+            new=mock_make_api_call_managed_policies,
+        ):
+            iam = IAM(audit_info)
+
+        aws_policies = [policy for policy in iam.policies if policy.arn == policy_arn]
+        assert len(aws_policies) == 1
+        assert aws_policies[0].type == "AWS"
+        assert aws_policies[0].document == cached_document
+
     # Test IAM List SAML Providers
     @mock_iam
     def test__list_saml_providers__(self):
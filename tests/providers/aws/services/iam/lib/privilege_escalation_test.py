@@ -0,0 +1,194 @@
+from prowler.providers.aws.services.iam.iam_service import Group, Policy, Role, User
+from prowler.providers.aws.services.iam.lib.privilege_escalation import (
+    PrivilegeEscalationGraph,
+    administrator,
+)
+
+AWS_ACCOUNT_NUMBER = "123456789012"
+
+ADMINISTRATOR_POLICY_ARN = "arn:aws:iam::aws:policy/AdministratorAccess"
+ADMINISTRATOR_POLICY = Policy(
+    name="AdministratorAccess",
+    arn=ADMINISTRATOR_POLICY_ARN,
+    version_id="v1",
+    type="AWS",
+    attached=True,
+    document={
+        "Version": "2012-10-17",
+        "Statement": [{"Effect": "Allow", "Action": "*", "Resource": "*"}],
+    },
+)
+
+
+def inline_policy(actions, resource="*"):
+    return {
+        "Version": "2012-10-17",
+        "Statement": [{"Effect": "Allow", "Action": actions, "Resource": resource}],
+    }
+
+
+def trust_policy(principal):
+    return {
+        "Version": "2012-10-17",
+        "Statement": [
+            {"Effect": "Allow", "Principal": principal, "Action": "sts:AssumeRole"}
+        ],
+    }
+
+
+def user(name, inline_policies_documents=[], attached_policies=[]):
+    return User(
+        name=name,
+        arn=f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:user/{name}",
+        password_last_used=None,
+        attached_policies=attached_policies,
+        inline_policies_documents=inline_policies_documents,
+    )
+
+
+def role(name, principal, inline_policies_documents=[], attached_policies=[]):
+    return Role(
+        name=name,
+        arn=f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:role/{name}",
+        assume_role_policy=trust_policy(principal),
+        is_service_role=False,
+        attached_policies=attached_policies,
+        inline_policies_documents=inline_policies_documents,
+    )
+
+
+ADMINISTRATOR_ROLE = role(
+    "admin",
+    {"AWS": f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:root"},
+    attached_policies=[
+        {"PolicyName": "AdministratorAccess", "PolicyArn": ADMINISTRATOR_POLICY_ARN}
+    ],
+)
+
+
+class Test_PrivilegeEscalationGraph:
+    def test_no_escalation(self):
+        reader = user("reader", [inline_policy("s3:GetObject")])
+        graph = PrivilegeEscalationGraph(
+            [reader], [ADMINISTRATOR_ROLE], [], [ADMINISTRATOR_POLICY], 5
+        )
+        assert graph.administrators == {ADMINISTRATOR_ROLE.arn}
+        assert graph.get_escalation_path(reader.arn) == []
+
+    def test_self_escalation(self):
+        attacker = user("attacker", [inline_policy("iam:Put*")])
+        graph = PrivilegeEscalationGraph([attacker], [], [], [], 5)
+        assert graph.get_escalation_path(attacker.arn) == [
+            ("iam:PutUserPolicy", administrator)
+        ]
+
+    def test_assume_role(self):
+        attacker = user("attacker", [inline_policy("sts:AssumeRole")])
+        graph = PrivilegeEscalationGraph(
+            [attacker], [ADMINISTRATOR_ROLE], [], [ADMINISTRATOR_POLICY], 5
+        )
+        assert graph.get_escalation_path(attacker.arn) == [
+            ("sts:AssumeRole", ADMINISTRATOR_ROLE.arn)
+        ]
+
+    def test_transitive_path(self):
+        # attacker -> developer -> lambda role -> administrator
+        attacker = user("attacker", [inline_policy("iam:CreateAccessKey")])
+        developer = user(
+            "developer",
+            [
+                inline_policy(
+                    [
+                        "iam:PassRole",
+                        "lambda:CreateFunction",
+                        "lambda:InvokeFunction",
+                    ]
+                )
+            ],
+        )
+        lambda_role = role(
+            "lambda",
+            {"Service": "lambda.amazonaws.com"},
+            [inline_policy("iam:AttachRolePolicy")],
+        )
+        graph = PrivilegeEscalationGraph(
+            [attacker, developer], [lambda_role], [], [], 5
+        )
+        assert graph.get_escalation_path(attacker.arn) == [
+            ("iam:CreateAccessKey", developer.arn),
+            (
+                "iam:PassRole and lambda:CreateFunction and lambda:InvokeFunction",
+                lambda_role.arn,
+            ),
+            ("iam:AttachRolePolicy", administrator),
+        ]
+        # The depth of the search is bounded
+        graph = PrivilegeEscalationGraph(
+            [attacker, developer], [lambda_role], [], [], 2
+        )
+        assert graph.get_escalation_path(attacker.arn) == []
+        assert len(graph.get_escalation_path(developer.arn)) == 2
+
+    def test_deny_blocks_escalation(self):
+        attacker = user(
+            "attacker",
+            [
+                inline_policy("sts:AssumeRole"),
+                {
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        {
+                            "Effect": "Deny",
+                            "Action": "sts:AssumeRole",
+                            "Resource": ADMINISTRATOR_ROLE.arn,
+                        }
+                    ],
+                },
+            ],
+        )
+        graph = PrivilegeEscalationGraph(
+            [attacker], [ADMINISTRATOR_ROLE], [], [ADMINISTRATOR_POLICY], 5
+        )
+        assert graph.get_escalation_path(attacker.arn) == []
+
+    def test_conditional_deny_does_not_block_escalation(self):
+        attacker = user(
+            "attacker",
+            [
+                inline_policy("iam:*"),
+                {
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        {
+                            "Effect": "Deny",
+                            "Action": "*",
+                            "Resource": "*",
+                            "Condition": {
+                                "BoolIfExists": {"aws:MultiFactorAuthPresent": "false"}
+                            },
+                        }
+                    ],
+                },
+            ],
+        )
+        graph = PrivilegeEscalationGraph([attacker], [], [], [], 5)
+        assert graph.get_escalation_path(attacker.arn) != []
+
+    def test_add_user_to_administrator_group(self):
+        attacker = user("attacker", [inline_policy("iam:AddUserToGroup")])
+        administrators = Group(
+            name="administrators",
+            arn=f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:group/administrators",
+            attached_policies=[
+                {
+                    "PolicyName": "AdministratorAccess",
+                    "PolicyArn": ADMINISTRATOR_POLICY_ARN,
+                }
+            ],
+        )
+        graph = PrivilegeEscalationGraph(
+            [attacker], [], [administrators], [ADMINISTRATOR_POLICY], 5
+        )
+        assert graph.get_escalation_path(attacker.arn) == [
+            (f"iam:AddUserToGroup on {administrators.arn}", administrator)
+        ]
@@ -1,9 +1,11 @@
 import json
 
 from boto3 import client, session
-from moto import mock_kms
+from mock import patch
+from moto import mock_kms, mock_resourcegroupstaggingapi
 
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.lib.resource_api_tagging.resource_api_tagging import TagStore
 from prowler.providers.aws.services.kms.kms_service import KMS
 
 AWS_ACCOUNT_NUMBER = "123456789012"
@@ -107,6 +109,31 @@ class Test_ACM_Service:
             {"TagKey": "test", "TagValue": "test"},
         ]
 
+    # Test KMS List Tags from the tag store
+    @mock_resourcegroupstaggingapi
+    @mock_kms
+    def test__list_resource_tags__tag_store(self):
+        # Generate KMS Client
+        kms_client = client("kms", region_name=AWS_REGION)
+        # Create KMS keys
+        key1 = kms_client.create_key(
+            Tags=[
+                {"TagKey": "test", "TagValue": "test"},
+            ],
+        )["KeyMetadata"]
+        # KMS client for this test class
+        audit_info = self.set_mocked_audit_info()
+        audit_info.tag_store = TagStore(audit_info)
+        with patch.object(
+            audit_info.tag_store, "get_tags", wraps=audit_info.tag_store.get_tags
+        ) as get_tags:
+            kms = KMS(audit_info)
+        get_tags.assert_called_once_with(key1["Arn"], AWS_REGION)
+        assert len(kms.keys) == 1
+        assert kms.keys[0].tags == [
+            {"TagKey": "test", "TagValue": "test"},
+        ]
+
     # Test KMS Get rotation status
     @mock_kms
     def test__get_key_rotation_status__(self):
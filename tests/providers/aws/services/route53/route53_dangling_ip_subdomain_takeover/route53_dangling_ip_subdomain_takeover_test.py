@@ -293,6 +293,66 @@ class Test_route53_dangling_ip_subdomain_takeover:
                         == f"arn:{audit_info.audited_partition}:route53:::hostedzone/{zone_id.replace('/hostedzone/','')}"
                     )
 
+    @mock_ec2
+    @mock_route53
+    def test_hosted_zone_public_record_without_aws_ip_ranges(self):
+        conn = client("route53", region_name=AWS_REGION)
+
+        zone_id = conn.create_hosted_zone(
+            Name="testdns.aws.com.", CallerReference=str(hash("foo"))
+        )["HostedZone"]["Id"]
+
+        conn.change_resource_record_sets(
+            HostedZoneId=zone_id,
+            ChangeBatch={
+                "Changes": [
+                    {
+                        "Action": "CREATE",
+                        "ResourceRecordSet": {
+                            "Name": "foo.bar.testdns.aws.com",
+                            "Type": "A",
+                            "ResourceRecords": [{"Value": "54.152.12.70"}],
+                        },
+                    }
+                ]
+            },
+        )
+        from prowler.providers.aws.services.ec2.ec2_service import EC2
+        from prowler.providers.aws.services.route53.route53_service import Route53
+
+        audit_info = self.set_mocked_audit_info()
+
+        with mock.patch(
+            "prowler.providers.aws.lib.audit_info.audit_info.current_audit_info",
+            new=audit_info,
+        ):
+            with mock.patch(
+                "prowler.providers.aws.services.route53.route53_dangling_ip_subdomain_takeover.route53_dangling_ip_subdomain_takeover.route53_client",
+                new=Route53(audit_info),
+            ):
+                with mock.patch(
+                    "prowler.providers.aws.services.route53.route53_dangling_ip_subdomain_takeover.route53_dangling_ip_subdomain_takeover.ec2_client",
+                    new=EC2(audit_info),
+                ), mock.patch(
+                    "prowler.providers.aws.lib.public_ips.public_ips.get_aws_ip_ranges",
+                    return_value=None,
+                ):
+                    # Test Check
+                    from prowler.providers.aws.services.route53.route53_dangling_ip_subdomain_takeover.route53_dangling_ip_subdomain_takeover import (
+                        route53_dangling_ip_subdomain_takeover,
+                    )
+
+                    check = route53_dangling_ip_subdomain_takeover()
+                    result = check.execute()
+
+                    assert len(result) == 1
+                    assert result[0].status == "INFO"
+                    assert search(
+                        "the AWS IP address ranges could not be downloaded",
+                        result[0].status_extended,
+                    )
+                    assert result[0].resource_id == zone_id.replace("/hostedzone/", "")
+
     @mock_ec2
     @mock_route53
     def test_hosted_zone_eip_record(self):
@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import botocore
 from boto3 import client, session
@@ -221,6 +221,31 @@ class Test_Route53_Service:
 
         assert route53.hosted_zones[hosted_zone_id].region == AWS_REGION
 
+    @mock_route53
+    def test__list_tags_for_resource__tag_store_global_region(self):
+        r53_client = client("route53", region_name=AWS_REGION)
+        response = r53_client.create_hosted_zone(
+            Name="testdns.aws.com.", CallerReference=str(hash("foo"))
+        )
+        hosted_zone_id = response["HostedZone"]["Id"].replace("/hostedzone/", "")
+
+        audit_info = self.set_mocked_audit_info()
+        audit_info.profile_region = "eu-west-1"
+        audit_info.audited_regions = ["eu-west-1"]
+        audit_info.tag_store = MagicMock()
+        # Like the Resource Groups Tagging API, the hosted zones are only returned in the global region
+        audit_info.tag_store.get_tags.side_effect = lambda arn, region: (
+            [{"Key": "stored", "Value": "stored"}] if region == AWS_REGION else []
+        )
+        route53 = Route53(audit_info)
+
+        audit_info.tag_store.get_tags.assert_called_once_with(
+            f"arn:aws:route53:::hostedzone/{hosted_zone_id}", AWS_REGION
+        )
+        assert route53.hosted_zones[hosted_zone_id].tags == [
+            {"Key": "stored", "Value": "stored"}
+        ]
+
     @mock_route53
     def test__list_resource_record_sets__(self):
         # Create Hosted Zone
@@ -241,16 +266,23 @@ class Test_Route53_Service:
                             "Type": "A",
                             "ResourceRecords": [{"Value": "1.2.3.4"}],
                         },
-                    }
+                    },
+                    {
+                        "Action": "CREATE",
+                        "ResourceRecordSet": {
+                            "Name": "foo.bar.testdns.aws.com",
+                            "Type": "AAAA",
+                            "ResourceRecords": [{"Value": "2600:1f18::1"}],
+                        },
+                    },
                 ]
             },
         )
 
         # Set partition for the service
         route53 = Route53(self.set_mocked_audit_info())
-        assert (
-            len(route53.record_sets) == 3
-        )  # Default NS and SOA records plus the A record just created
+        # Only the A record just created, not the AAAA or the default NS and SOA records
+        assert len(route53.record_sets) == 1
         for set in route53.record_sets:
             if set.type == "A":
                 assert set.name == "foo.bar.testdns.aws.com."
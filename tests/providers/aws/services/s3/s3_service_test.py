@@ -90,6 +90,61 @@ class Test_S3_Service:
         )
         assert not s3.buckets[0].object_lock
 
+    # Test S3 List Buckets in several regions
+    @mock_s3
+    def test__list_buckets__several_regions(self):
+        # Generate S3 Client
+        s3_client = client("s3")
+        # Create S3 Buckets
+        bucket_name_us = "test-bucket-us"
+        s3_client.create_bucket(Bucket=bucket_name_us)
+        bucket_name_eu = "test-bucket-eu"
+        s3_client.create_bucket(
+            Bucket=bucket_name_eu,
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-1"},
+        )
+        s3_client.put_bucket_versioning(
+            Bucket=bucket_name_eu,
+            VersioningConfiguration={"Status": "Enabled"},
+        )
+
+        # S3 client for this test class
+        audit_info = self.set_mocked_audit_info()
+        s3 = S3(audit_info)
+
+        assert len(s3.buckets) == 2
+        buckets = {bucket.name: bucket for bucket in s3.buckets}
+        assert buckets[bucket_name_us].region == AWS_REGION
+        assert not buckets[bucket_name_us].versioning
+        assert buckets[bucket_name_eu].region == "eu-west-1"
+        assert buckets[bucket_name_eu].versioning
+        # Missing configurations are negative results
+        assert buckets[bucket_name_eu].policy == {}
+        assert buckets[bucket_name_eu].encryption is None
+        assert buckets[bucket_name_eu].tags == []
+
+    # Test S3 List Buckets with filter regions
+    @mock_s3
+    def test__list_buckets__audited_regions(self):
+        # Generate S3 Client
+        s3_client = client("s3")
+        # Create S3 Buckets
+        s3_client.create_bucket(Bucket="test-bucket-us")
+        bucket_name_eu = "test-bucket-eu"
+        s3_client.create_bucket(
+            Bucket=bucket_name_eu,
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-1"},
+        )
+
+        # S3 client for this test class
+        audit_info = self.set_mocked_audit_info()
+        audit_info.audited_regions = ["eu-west-1"]
+        s3 = S3(audit_info)
+
+        assert len(s3.buckets) == 1
+        assert s3.buckets[0].name == bucket_name_eu
+        assert s3.buckets[0].region == "eu-west-1"
+
     # Test S3 Get Bucket Versioning
     @mock_s3
     def test__get_bucket_versioning__(self):
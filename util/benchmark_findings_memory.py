@@ -0,0 +1,77 @@
+import sys
+import tracemalloc
+from dataclasses import dataclass
+
+from prowler.lib.check.check import bulk_load_checks_metadata
+from prowler.lib.check.models import Check_Metadata_Model, Check_Report_AWS
+
+# Compare the memory used by each AWS finding with the previous finding representation
+# Usage: python util/benchmark_findings_memory.py [number_of_findings]
+findings_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+resources_count = 1000
+regions = ["eu-west-1", "us-east-1", "us-west-2", "ap-southeast-1"]
+
+
+@dataclass
+class Previous_Check_Report_AWS:
+    """Previous finding representation, with its own parsed metadata and without slots"""
+
+    status: str
+    status_extended: str
+    check_metadata: Check_Metadata_Model
+    resource_details: str
+    resource_tags: list
+    resource_id: str
+    resource_arn: str
+    region: str
+
+    def __init__(self, metadata):
+        self.status = ""
+        self.check_metadata = Check_Metadata_Model.parse_raw(metadata)
+        self.status_extended = ""
+        self.resource_details = ""
+        self.resource_tags = []
+        self.resource_id = ""
+        self.resource_arn = ""
+        self.region = ""
+
+
+def measure_findings_memory(report_class, check_metadata: str, resources_tags: list):
+    """measure_findings_memory returns the memory in bytes used by each finding, reported as the checks do"""
+    tracemalloc.start()
+    findings = []
+    for index in range(findings_count):
+        resource = index % resources_count
+        region = regions[resource % len(regions)]
+        report = report_class(check_metadata)
+        # Values built at runtime, as they are read from the API responses
+        report.region = "".join(region)
+        report.resource_id = f"resource-{resource}"
+        report.resource_arn = f"arn:aws:s3:::resource-{resource}"
+        report.resource_tags = resources_tags[resource]
+        report.status = "".join("FAIL" if index % 2 else "PASS")
+        report.status_extended = f"Bucket resource-{resource} is not public."
+        findings.append(report)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return memory / findings_count
+
+
+# Each check reports its findings from its metadata, as Check.metadata() does
+check_metadata = bulk_load_checks_metadata("aws")["s3_bucket_public_access"].json()
+# Resource tags are retrieved once per resource by the services
+resources_tags = [
+    [
+        {"Key": "Name", "Value": f"resource-{index}"},
+        {"Key": "Environment", "Value": "prod"},
+    ]
+    for index in range(resources_count)
+]
+
+print(f"Findings: {findings_count}")
+for name, report_class in [
+    ("Previous finding", Previous_Check_Report_AWS),
+    ("Check_Report_AWS", Check_Report_AWS),
+]:
+    memory = measure_findings_memory(report_class, check_metadata, resources_tags)
+    print(f"{name}: {memory:.0f} bytes per finding")